@@ -0,0 +1,79 @@
+"""
+Module: Area Cache Statistics (benchmarks/area_cache.py)
+License: MIT
+
+Requires Python 3.8 or newer.
+
+Reports how often the recommended area of a present is served from its
+cache while the Quote Manager list is refreshed (MainWindow.
+_handle_quote_update renders every quote and the order total) and while
+an order is exported.
+
+Usage:
+    python benchmarks/area_cache.py [--quotes 10000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import typing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import wpqc  # noqa: E402
+
+
+def build_order(count: int, /) -> wpqc.Order:
+    order = wpqc.Order(1)
+    shapes = (
+        lambda index: wpqc.Cube(length=(index % 40) + 1),
+        lambda index: wpqc.Cuboid(
+            width=(index % 30) + 1, height=(index % 20) + 1,
+            depth=(index % 10) + 1),
+        lambda index: wpqc.Cylinder(
+            radius=(index % 15) + 1, depth=(index % 25) + 1))
+    for index in range(count):
+        order.add_quote(wpqc.Quote(
+            quote_title=f"Quote {index}",
+            present_type=shapes[index % len(shapes)](index),
+            wrapping_paper=wpqc.CheapWrappingPaper(
+                wpqc.WrappingPaper.PRESET_PURPLE),
+            gift_card=wpqc.GiftCard("Best wishes") if index % 2 else None,
+            bow=wpqc.Bow() if index % 3 else None))
+    return order
+
+
+def refresh_listbox(order: wpqc.Order, /) -> None:
+    # the work done by MainWindow._handle_quote_update, without Tk.
+    for quote in order:
+        f" {str(quote)}"
+    f"£{order.calculate_total_price():.2f}"
+
+
+def report(label: str, action: typing.Callable[[], typing.Any], /) -> None:
+    wpqc.PresentType.reset_area_cache_statistics()
+    action()
+    print(f"{label}: {wpqc.PresentType.area_cache_hits} hit(s), "
+          + f"{wpqc.PresentType.area_cache_misses} miss(es), "
+          + f"hit rate {wpqc.PresentType.get_area_cache_hit_rate():.1%}")
+
+
+def main(argv: typing.Sequence[str] = None, /) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[2])
+    parser.add_argument("--quotes", type=int, default=10000)
+    args = parser.parse_args(argv)
+    order = build_order(args.quotes)
+    report("first listbox refresh", lambda: refresh_listbox(order))
+    report("second listbox refresh", lambda: refresh_listbox(order))
+    with tempfile.TemporaryDirectory() as directory:
+        working_directory = os.getcwd()
+        os.chdir(directory)
+        try:
+            report("export", order.export_order)
+        finally:
+            os.chdir(working_directory)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Module: Columnar Order Comparison (benchmarks/columnar.py)
+License: MIT
+
+Requires Python 3.8 or newer. NumPy is optional, it is only used to
+show the columns being read without copying.
+
+Builds the same quotes into an Order and a ColumnarOrder, then compares
+the memory each takes (measured with tracemalloc) and the time to count
+quotes per shape, walking the quote objects against reading the shapes
+column.
+
+Usage:
+    python benchmarks/columnar.py [--quotes 200000]
+"""
+import argparse
+import collections
+import gc
+import os
+import sys
+import time
+import tracemalloc
+import typing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import wpqc  # noqa: E402
+from benchmarks.memory import build_order  # noqa: E402
+
+
+def measure(build: typing.Callable[[], wpqc.Order], /
+            ) -> typing.Tuple[wpqc.Order, int]:
+    gc.collect()
+    tracemalloc.start()
+    order = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return order, current
+
+
+def count_shapes(order: wpqc.Order, /) -> typing.Dict[str, int]:
+    # the object graph way, one pointer chase per quote.
+    return collections.Counter(
+        type(quote.present).__name__ for quote in order)
+
+
+def best_time(action: typing.Callable[[], typing.Any], /) -> float:
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv: typing.Sequence[str] = None, /) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[2])
+    parser.add_argument("--quotes", type=int, default=200000)
+    args = parser.parse_args(argv)
+    order, order_bytes = measure(lambda: build_order(args.quotes))
+
+    def build_columnar() -> wpqc.ColumnarOrder:
+        # the quotes already exist, only the columns are measured.
+        columnar = wpqc.ColumnarOrder(1)
+        for quote in order:
+            columnar.add_quote(quote)
+        return columnar
+
+    columnar, columnar_bytes = measure(build_columnar)
+    print(f"memory per quote: order {order_bytes / len(order):.0f} bytes, "
+          + f"columnar {columnar_bytes / len(columnar):.0f} bytes")
+    objects = best_time(lambda: count_shapes(order))
+    columns = best_time(columnar.count_shapes)
+    print(f"count shapes: order {objects * 1000:.1f} ms, "
+          + f"columnar {columns * 1000:.1f} ms "
+          + f"({objects / columns:.1f}x)")
+    if order.calculate_total_price() != columnar.calculate_total_price():
+        print("order totals differ")
+        return 1
+    try:
+        import numpy
+    except ImportError:
+        return 0
+    with columnar.get_column("length_one") as view:
+        lengths = numpy.frombuffer(view, dtype=numpy.float64)
+        print(f"numpy mean length one: {lengths.mean():.2f}cm, "
+              + f"shares memory: {lengths.base is not None}")
+        del lengths
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
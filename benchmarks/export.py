@@ -0,0 +1,139 @@
+"""
+Module: Receipt Export Benchmark (benchmarks/export.py)
+License: MIT
+
+Requires Python 3.8 or newer.
+
+Compares Order.export_order, which streams the receipt through
+precompiled templates, against the previous implementation, which
+concatenated f-strings per quote, recomputed every price and area inside
+the write loop and issued several small writes per quote. Both receipts
+are checked to be identical.
+
+Usage:
+    python benchmarks/export.py [--quotes 100000] [--repeat 3]
+"""
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import typing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import wpqc  # noqa: E402
+
+
+def build_order(count: int, /) -> wpqc.Order:
+    order = wpqc.Order(1)
+    for index in range(count):
+        order.add_quote(wpqc.Quote(
+            quote_title=f"Quote {index}",
+            present_type=wpqc.Cuboid(
+                width=(index % 30) + 1, height=(index % 20) + 1,
+                depth=(index % 10) + 1),
+            wrapping_paper=wpqc.ExpensiveWrappingPaper(
+                wpqc.WrappingPaper.PRESET_GOLD),
+            gift_card=wpqc.GiftCard("Season's greetings") if index % 2
+            else None,
+            bow=wpqc.Bow() if index % 3 else None))
+    return order
+
+
+def legacy_export_order(order: wpqc.Order, /) -> int:
+    # Order.export_order before the streaming receipt writer.
+    file = (f"{wpqc.get_current_time_date()} "
+            + f"Order {order.get_order_number()}.txt")
+    separator = ("-" * 80)
+    try:
+        with open(file, "w") as handler:
+            handler.write(
+                separator
+                + "\n\n\tWrapping Paper Quotes\n\n"
+                + "\tDate Time:\t\t\t\t\t\t"
+                + f"{wpqc.get_current_time_date()}\n"
+                + "\tOrder Number:\t\t\t\t\t"
+                + f"{order.get_order_number()}\n"
+                + "\tNumber of Quotes:\t\t\t\t"
+                + f"{len(order)}\n\n"
+                + separator
+                + "\n\n")
+            for q in order:
+                handler.write(
+                    q.title
+                    + f"   (Total: GBP {q.calculate_price():.2f})\n"
+                    + f"\t\t{str(q.present)}\n"
+                    + f"\t\t{str(q.wrapping_paper)}"
+                    + f"""   (GBP {q.wrapping_paper.calculate_price(
+                        q.present.get_recommended_area()):.2f})\n""")
+                if isinstance(q.gift_card, wpqc.GiftCard):
+                    handler.write(
+                        f"\t\t{str(q.gift_card)}"
+                        + f"   (GBP {q.gift_card.calculate_price():.2f})"
+                        + "\n")
+                if isinstance(q.bow, wpqc.Bow):
+                    handler.write(
+                        f"\t\t{str(q.bow)}"
+                        + f"   (GBP {q.bow.get_price():.2f})\n")
+                handler.write("\n")
+            handler.write(
+                "\n"
+                + "Total price for this order: GBP "
+                + f"{order.recalculate_total_price():.2f}\n")
+    except OSError:
+        return 1
+    return 0
+
+
+def measure(export: typing.Callable[[], int], repeat: int, /
+            ) -> typing.Tuple[float, int, str]:
+    # returns the best time in seconds, the peak traced memory in bytes and
+    # the receipt written by the last run.
+    best: float = float("inf")
+    for _ in range(repeat):
+        for file in glob.glob("*.txt"):
+            os.remove(file)
+        start = time.perf_counter()
+        export()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    export()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    with open(glob.glob("*.txt")[0]) as handler:
+        receipt = handler.read()
+    return best, peak, receipt
+
+
+def main(argv: typing.Sequence[str] = None, /) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[2])
+    parser.add_argument("--quotes", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    order = build_order(args.quotes)
+    working_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            legacy = measure(lambda: legacy_export_order(order), args.repeat)
+            streaming = measure(order.export_order, args.repeat)
+        finally:
+            os.chdir(working_directory)
+    print(f"exporting {args.quotes} quotes:")
+    print(f"  previous   {legacy[0] * 1000:9.1f} ms, "
+          + f"peak {legacy[1] / 1024:8.1f} KiB")
+    print(f"  streaming  {streaming[0] * 1000:9.1f} ms, "
+          + f"peak {streaming[1] / 1024:8.1f} KiB "
+          + f"({legacy[0] / streaming[0]:.2f}x)")
+    # the header holds the time of export, which may differ by a minute.
+    identical = (legacy[2].split("\tOrder Number:")[1]
+                 == streaming[2].split("\tOrder Number:")[1])
+    print(f"  receipts identical: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Module: Import Time Budget (benchmarks/import_time.py)
+License: MIT
+
+Requires Python 3.8 or newer.
+
+Measures the cost of importing the pricing model (wpqc) with
+`python -X importtime` and checks it against a budget. The model must
+also stay free of the user interface (tkinter) and of optional
+dependencies (numpy), which are only imported on demand.
+
+Usage:
+    python benchmarks/import_time.py [--budget-ms 50] [--runs 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import typing
+
+REPOSITORY_DIRECTORY: str = os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BUDGET_MS: float = 50.0
+FORBIDDEN_MODULES: typing.Tuple[str, ...] = ("tkinter", "_tkinter", "numpy")
+
+
+def measure_import(module: str, /) -> typing.Tuple[float, typing.List[str]]:
+    # returns the cumulative import time in milliseconds and the names of
+    # every module imported along the way.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPOSITORY_DIRECTORY, capture_output=True, text=True,
+        check=True)
+    cumulative_us: int = -1
+    imported: typing.List[str] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imported.append(name.strip())
+        if name.strip() == module:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000, imported
+
+
+def main(argv: typing.Sequence[str] = None, /) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[2])
+    parser.add_argument("--module", default="wpqc")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+    timings: typing.List[float] = []
+    imported: typing.List[str] = []
+    for _ in range(max(args.runs, 1)):
+        timing, imported = measure_import(args.module)
+        timings.append(timing)
+    # the fastest run is the least disturbed by the rest of the system.
+    best = min(timings)
+    print(f"import {args.module}: best {best:.1f} ms of {len(timings)} "
+          + f"run(s), budget {args.budget_ms:.1f} ms")
+    status: int = 0
+    if best > args.budget_ms:
+        print(f"  over budget by {best - args.budget_ms:.1f} ms")
+        status = 1
+    for name in sorted(set(imported) & set(FORBIDDEN_MODULES)):
+        print(f"  imports {name}, which must only be loaded on demand")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Module: Order Memory Footprint (benchmarks/memory.py)
+License: MIT
+
+Requires Python 3.8 or newer.
+
+Measures the memory an order takes per quote with tracemalloc. Quotes
+are built through the Translator, as the Quote Editor and the headless
+interface build them, so papers and bows are shared between quotes.
+The measurement includes the order's own bookkeeping (the quote list
+and the cached prices).
+
+Usage:
+    python benchmarks/memory.py [--quotes 1000000]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+import typing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import wpqc  # noqa: E402
+
+SHAPES: typing.Tuple[str, ...] = (
+    wpqc.Translator.CUBE, wpqc.Translator.CUBOID, wpqc.Translator.CYLINDER)
+PAPERS: typing.Tuple[str, ...] = (
+    wpqc.Translator.CHEAP_WRAPPING, wpqc.Translator.EXPENSIVE_WRAPPING)
+COLOURS: typing.Tuple[str, ...] = wpqc.get_catalogue().get_colour_names()
+
+
+def build_order(count: int, /) -> wpqc.Order:
+    order = wpqc.Order(1)
+    for index in range(count):
+        order.add_quote(wpqc.Quote(
+            quote_title=wpqc.Translator.check_quote_title(""),
+            present_type=wpqc.Translator.translate_present_type(
+                shape=SHAPES[index % len(SHAPES)],
+                length_one=str((index % 40) + 1),
+                length_two=str((index % 20) + 1),
+                length_three=str((index % 10) + 1)),
+            wrapping_paper=wpqc.Translator.translate_wrapping_paper_type(
+                paper=PAPERS[index % len(PAPERS)],
+                colour=COLOURS[index % len(COLOURS)]),
+            gift_card=wpqc.Translator.translate_gift_card(
+                gift_card=int(index % 3 == 0), message="Best wishes"),
+            bow=wpqc.Translator.translate_bow(bow=index % 2)))
+    return order
+
+
+def main(argv: typing.Sequence[str] = None, /) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[2])
+    parser.add_argument("--quotes", type=int, default=1000000)
+    args = parser.parse_args(argv)
+    gc.collect()
+    tracemalloc.start()
+    order = build_order(args.quotes)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{len(order)} quote(s): {current / (1 << 20):.1f} MiB, "
+          + f"{current / len(order):.0f} bytes per quote "
+          + f"(peak {peak / len(order):.0f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
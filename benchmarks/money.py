@@ -0,0 +1,124 @@
+"""
+Module: Money Benchmark (benchmarks/money.py)
+License: MIT
+
+Requires Python 3.8 or newer.
+
+Compares pricing an order with integer pence (Money) against the previous
+float path, where every price went through round_number (a Decimal built
+from a float and quantized on every call) and the order total was a sum
+of floats.
+
+Usage:
+    python benchmarks/money.py [--quotes 100000] [--repeat 5]
+"""
+import argparse
+import decimal
+import os
+import random
+import sys
+import timeit
+import typing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import wpqc  # noqa: E402
+
+
+def build_quotes(count: int, /) -> typing.List[wpqc.Quote]:
+    generator = random.Random(count)
+    quotes: typing.List[wpqc.Quote] = []
+    for index in range(count):
+        quotes.append(wpqc.Quote(
+            quote_title=f"Quote {index}",
+            present_type=wpqc.Cuboid(
+                width=generator.randint(1, 60),
+                height=generator.randint(1, 60),
+                depth=round(generator.uniform(1, 60), 1)),
+            wrapping_paper=generator.choice((
+                wpqc.CheapWrappingPaper, wpqc.ExpensiveWrappingPaper))(
+                    wpqc.WrappingPaper.PRESET_GOLD),
+            gift_card=wpqc.GiftCard("Happy Birthday") if index % 3 else None,
+            bow=wpqc.Bow() if index % 2 else None))
+    return quotes
+
+
+def legacy_round_number(amount: float, /) -> float:
+    # round_number before Money, a Decimal on every call.
+    try:
+        result = float(decimal.Decimal(amount).quantize(
+            decimal.Decimal(".01"), rounding=decimal.ROUND_HALF_UP))
+    except decimal.InvalidOperation:
+        result = float(-1)
+    return result
+
+
+def legacy_area(present: wpqc.Cuboid, /) -> float:
+    # Cuboid.get_recommended_area through legacy_round_number.
+    height = (2 * present.get_height()) + (2 * present.get_width())
+    width = (2 * present.get_height()) + present.get_depth()
+    if height <= 0 or width <= 0:
+        return 0
+    return legacy_round_number((height + 6) * (width + 6))
+
+
+def legacy_quote_price(quote: wpqc.Quote, /) -> float:
+    # the float based Quote.calculate_price, before Money.
+    total: float = 0
+    if legacy_area(quote.present) > 0:
+        total += legacy_round_number(
+            (legacy_area(quote.present)
+             * quote.wrapping_paper.get_price()) / 100)
+        if isinstance(quote.gift_card, wpqc.GiftCard):
+            total += 0.50 + (0.02 * len(quote.gift_card.get_message()))
+        if isinstance(quote.bow, wpqc.Bow):
+            total += 1.50
+    return total
+
+
+def legacy_total_price(quotes: typing.List[wpqc.Quote], /) -> float:
+    total: float = 0
+    for quote in quotes:
+        total += legacy_quote_price(quote)
+    return legacy_round_number(total)
+
+
+def money_total_price(quotes: typing.List[wpqc.Quote], /) -> wpqc.Money:
+    total: wpqc.Money = wpqc.Money()
+    for quote in quotes:
+        total += quote.calculate_price()
+    return total
+
+
+def main(argv: typing.Sequence[str] = None, /) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[2])
+    parser.add_argument("--quotes", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    quotes = build_quotes(args.quotes)
+    rounding = min(timeit.repeat(
+        "for amount in amounts: round_number(amount)",
+        setup="amounts = [index * 0.37 for index in range(10000)]",
+        globals={"round_number": legacy_round_number},
+        number=1, repeat=args.repeat))
+    integer = min(timeit.repeat(
+        "for amount in amounts: divide_half_up(amount, 100)",
+        setup="amounts = [index * 37 for index in range(10000)]",
+        globals={"divide_half_up": wpqc.divide_half_up},
+        number=1, repeat=args.repeat))
+    legacy = min(timeit.repeat(
+        lambda: legacy_total_price(quotes), number=1, repeat=args.repeat))
+    money = min(timeit.repeat(
+        lambda: money_total_price(quotes), number=1, repeat=args.repeat))
+    print(f"rounding 10000 amounts: round_number {rounding * 1000:.2f} ms, "
+          + f"divide_half_up {integer * 1000:.2f} ms "
+          + f"({rounding / integer:.2f}x)")
+    print(f"pricing {args.quotes} quotes: float {legacy * 1000:.1f} ms, "
+          + f"money {money * 1000:.1f} ms ({legacy / money:.2f}x)")
+    print(f"order total: float GBP {legacy_total_price(quotes):.2f}, "
+          + f"money GBP {money_total_price(quotes):.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Module: Pricing Service Load Generator (benchmarks/service.py)
+License: MIT
+
+Requires Python 3.8 or newer.
+
+Sends pricing requests to the HTTP/JSON pricing service over a number
+of persistent connections, optionally pipelining several requests per
+connection, and reports requests per second with the p50 and p99
+latency. Unless --address is given, a service is started on a free
+localhost port for the run.
+
+Usage:
+    python benchmarks/service.py [--connections 16] [--requests 20000]
+                                 [--pipeline 1] [--batch 0]
+                                 [--address 127.0.0.1:8765]
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import typing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+QUOTE: typing.Dict[str, str] = {
+    "title": "Birthday", "shape": "cuboid", "length_one": "20",
+    "length_two": "10", "length_three": "5", "paper": "expensive",
+    "colour": "gold", "bow": "yes", "gift_card": "yes",
+    "message": "Happy Birthday"}
+
+
+def build_request(host: str, batch: int, /) -> bytes:
+    if batch:
+        path, body = "/price/batch", json.dumps([QUOTE] * batch)
+    else:
+        path, body = "/price", json.dumps(QUOTE)
+    return (
+        f"POST {path} HTTP/1.1\r\n"
+        + f"Host: {host}\r\n"
+        + "Content-Type: application/json\r\n"
+        + f"Content-Length: {len(body)}\r\n\r\n"
+        + body).encode("utf-8")
+
+
+async def read_response(reader: asyncio.StreamReader, /) -> int:
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def run_connection(host: str, port: int, request: bytes,
+                         count: int, pipeline: int,
+                         latencies: typing.List[float], /) -> int:
+    # sends count requests, pipeline at a time, returns the failures.
+    reader, writer = await asyncio.open_connection(host, port)
+    failures = 0
+    try:
+        while count > 0:
+            depth = min(pipeline, count)
+            start = time.perf_counter()
+            writer.write(request * depth)
+            await writer.drain()
+            for _ in range(depth):
+                if await read_response(reader) != 200:
+                    failures += 1
+                latencies.append(time.perf_counter() - start)
+            count -= depth
+    finally:
+        writer.close()
+    return failures
+
+
+async def generate_load(host: str, port: int, args: argparse.Namespace, /
+                        ) -> typing.Tuple[typing.List[float], int, float]:
+    request = build_request(f"{host}:{port}", args.batch)
+    latencies: typing.List[float] = []
+    share, extra = divmod(args.requests, args.connections)
+    start = time.perf_counter()
+    failures = await asyncio.gather(*(
+        run_connection(host, port, request, share + (index < extra),
+                       args.pipeline, latencies)
+        for index in range(args.connections)))
+    return latencies, sum(failures), time.perf_counter() - start
+
+
+def percentile(values: typing.Sequence[float], fraction: float, /) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def start_service() -> typing.Tuple[subprocess.Popen, str, int]:
+    service = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "wpqc.py"),
+         "--serve", "--port", "0"],
+        stderr=subprocess.PIPE, text=True)
+    # "<name>: serving on http://<host>:<port>"
+    address = service.stderr.readline().rsplit("//", 1)[-1].strip()
+    host, _, port = address.rpartition(":")
+    return service, host, int(port)
+
+
+def main(argv: typing.Sequence[str] = None, /) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[2])
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--pipeline", type=int, default=1)
+    parser.add_argument("--batch", type=int, default=0,
+                        help="quotes per batch request, 0 for /price")
+    parser.add_argument("--address", default="",
+                        help="host:port of a running service")
+    args = parser.parse_args(argv)
+    service = None
+    if args.address:
+        host, _, port = args.address.rpartition(":")
+        port = int(port)
+    else:
+        service, host, port = start_service()
+    try:
+        latencies, failures, elapsed = asyncio.run(
+            generate_load(host, port, args))
+    finally:
+        if service is not None:
+            service.terminate()
+            service.wait()
+    latencies.sort()
+    print(f"{len(latencies)} request(s) over {args.connections} "
+          + f"connection(s), pipeline {args.pipeline}, batch {args.batch}: "
+          + f"{len(latencies) / elapsed:.0f} requests/s, "
+          + f"p50 {percentile(latencies, 0.50) * 1000:.2f} ms, "
+          + f"p99 {percentile(latencies, 0.99) * 1000:.2f} ms, "
+          + f"{failures} failure(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
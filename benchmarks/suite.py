@@ -0,0 +1,313 @@
+"""
+Module: Benchmark Suite (benchmarks/suite.py)
+License: MIT
+
+Requires Python 3.8 or newer. The Quote Manager case needs Tk and a
+display (e.g. Xvfb) and is skipped without one.
+
+Times the pricing and user interface hot paths at order sizes from 10
+to 1,000,000 quotes: round_number, pence_to_pounds, the recommended
+area of each shape, Quote.calculate_price, the price cache (a warm
+lookup of every quote), Quote.__str__, the order
+total, Order.export_order and MainWindow._handle_quote_update. Results
+are saved as JSON, and a run can be compared with an earlier one to
+flag regressions.
+
+Usage:
+    python benchmarks/suite.py [--sizes 10 100 ... 1000000]
+                               [--cases round_number ...] [--repeat 5]
+                               [--output results.json]
+                               [--baseline previous.json]
+    python benchmarks/suite.py --compare previous.json results.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import typing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import wpqc  # noqa: E402
+
+DEFAULT_SIZES: typing.Tuple[int, ...] = (
+    10, 100, 1000, 10000, 100000, 1000000)
+DEFAULT_THRESHOLD: float = 0.15
+# slowdowns smaller than this (in seconds) are timer noise, not flagged.
+NOISE_FLOOR: float = 50e-6
+# a size is run up to --repeat times, but no longer than this in total.
+TIME_LIMIT: float = 2.0
+
+# a case is given an order size and returns a prepare function, which is
+# called (untimed) before each run and returns the function to time.
+Run = typing.Callable[[], typing.Any]
+Case = typing.Callable[[int], typing.Callable[[], Run]]
+
+_orders: typing.Dict[int, wpqc.Order] = {}
+_windows: typing.List[typing.Any] = []
+
+
+def build_order(size: int, /) -> wpqc.Order:
+    # one order per size, shared by the cases.
+    if size not in _orders:
+        _orders.clear()
+        order = wpqc.Order(1)
+        shapes = (
+            lambda index: wpqc.Cube(length=(index % 40) + 1),
+            lambda index: wpqc.Cuboid(
+                width=(index % 30) + 1, height=(index % 20) + 1,
+                depth=(index % 10) + 1),
+            lambda index: wpqc.Cylinder(
+                radius=(index % 15) + 1, depth=(index % 25) + 1))
+        colours = wpqc.get_catalogue().get_colour_names()
+        for index in range(size):
+            order.add_quote(wpqc.Quote(
+                quote_title=f"Quote {index}",
+                present_type=shapes[index % len(shapes)](index),
+                wrapping_paper=wpqc.Translator.translate_wrapping_paper_type(
+                    paper=("cheap", "expensive")[index % 2],
+                    colour=colours[index % len(colours)]),
+                gift_card=(
+                    wpqc.GiftCard("Best wishes") if index % 3 == 0 else None),
+                bow=wpqc.Translator.translate_bow(bow=index % 2)))
+        _orders[size] = order
+    return _orders[size]
+
+
+def amounts(size: int, /) -> typing.List[float]:
+    generator = random.Random(size)
+    return [generator.uniform(0, 10000) for _ in range(size)]
+
+
+def case_round_number(size: int, /) -> typing.Callable[[], Run]:
+    values = amounts(size)
+    round_number = wpqc.round_number
+    return lambda: lambda: [round_number(value) for value in values]
+
+
+def case_pence_to_pounds(size: int, /) -> typing.Callable[[], Run]:
+    values = amounts(size)
+    pence_to_pounds = wpqc.pence_to_pounds
+    return lambda: lambda: [pence_to_pounds(value) for value in values]
+
+
+def _area_case(build: typing.Callable[[int], wpqc.PresentType], /) -> Case:
+    # fresh shapes for every run, so the area cache is always cold.
+    def case(size: int, /) -> typing.Callable[[], Run]:
+        def prepare() -> Run:
+            shapes = [build(index) for index in range(size)]
+            return lambda: [shape.get_recommended_area() for shape in shapes]
+        return prepare
+    return case
+
+
+def case_quote_calculate_price(size: int, /) -> typing.Callable[[], Run]:
+    quotes = build_order(size).quotes
+    return lambda: lambda: [quote.calculate_price() for quote in quotes]
+
+
+def case_price_cache(size: int, /) -> typing.Callable[[], Run]:
+    quotes = build_order(size).quotes
+    cache = wpqc.PriceCache(size)
+    for quote in quotes:
+        cache.get_price(quote)
+    return lambda: lambda: [cache.get_price(quote) for quote in quotes]
+
+
+def case_quote_str(size: int, /) -> typing.Callable[[], Run]:
+    quotes = build_order(size).quotes
+    return lambda: lambda: [str(quote) for quote in quotes]
+
+
+def case_order_total(size: int, /) -> typing.Callable[[], Run]:
+    order = build_order(size)
+    return lambda: order.calculate_total_price
+
+
+def case_order_recalculate_total(size: int, /) -> typing.Callable[[], Run]:
+    order = build_order(size)
+    return lambda: order.recalculate_total_price
+
+
+def case_order_export(size: int, /) -> typing.Callable[[], Run]:
+    order = build_order(size)
+    # receipts are written to the working directory, each run replaces the
+    # receipt of the one before.
+    directory = tempfile.TemporaryDirectory()
+
+    def export() -> None:
+        working_directory = os.getcwd()
+        os.chdir(directory.name)
+        try:
+            if order.export_order():
+                raise OSError("The receipt could not be written.")
+        finally:
+            os.chdir(working_directory)
+    return lambda: export
+
+
+def case_quote_manager_update(size: int, /) -> typing.Callable[[], Run]:
+    # raises RuntimeError without Tk or a display, the case is skipped.
+    try:
+        import tkinter
+        from wpqc_gui import MainWindow
+    except ImportError as error:
+        raise RuntimeError(f"Tk is not available ({error}).") from None
+    order = build_order(size)
+    if not _windows:
+        working_directory = os.getcwd()
+        # the order store and journal are opened in the working directory.
+        os.chdir(tempfile.mkdtemp())
+        try:
+            _windows.append(MainWindow())
+        except tkinter.TclError as error:
+            raise RuntimeError(
+                f"No display is available ({error}).") from None
+        finally:
+            os.chdir(working_directory)
+        _windows[0].withdraw()
+    window = _windows[0]
+    window._order = order
+    window._quotes_view.set_order(order)
+
+    def update() -> None:
+        window._handle_quote_update()
+        window.update_idletasks()
+    return lambda: update
+
+
+CASES: typing.Dict[str, Case] = {
+    "round_number": case_round_number,
+    "pence_to_pounds": case_pence_to_pounds,
+    "cube_area": _area_case(
+        lambda index: wpqc.Cube(length=(index % 40) + 1)),
+    "cuboid_area": _area_case(
+        lambda index: wpqc.Cuboid(
+            width=(index % 30) + 1, height=(index % 20) + 1,
+            depth=(index % 10) + 1)),
+    "cylinder_area": _area_case(
+        lambda index: wpqc.Cylinder(
+            radius=(index % 15) + 1, depth=(index % 25) + 1)),
+    "sphere_area": _area_case(
+        lambda index: wpqc.Sphere(radius=(index % 15) + 1)),
+    "triangular_prism_area": _area_case(
+        lambda index: wpqc.TriangularPrism(
+            side=(index % 20) + 1, length=(index % 30) + 1)),
+    "quote_calculate_price": case_quote_calculate_price,
+    "price_cache": case_price_cache,
+    "quote_str": case_quote_str,
+    "order_calculate_total_price": case_order_total,
+    "order_recalculate_total_price": case_order_recalculate_total,
+    "order_export": case_order_export,
+    "quote_manager_update": case_quote_manager_update,
+}
+
+
+def measure(prepare: typing.Callable[[], Run], repeat: int, /
+            ) -> typing.Dict[str, float]:
+    timings: typing.List[float] = []
+    while len(timings) < repeat and sum(timings) < TIME_LIMIT:
+        run = prepare()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return {
+        "best": min(timings),
+        "median": statistics.median(timings),
+        "runs": len(timings)}
+
+
+def run_suite(cases: typing.Sequence[str], sizes: typing.Sequence[int],
+              repeat: int, /) -> typing.Dict[str, typing.Any]:
+    results: typing.Dict[str, typing.Dict[str, typing.Any]] = {
+        name: {} for name in cases}
+    # sizes on the outside, so only one order is held at a time.
+    for size in sizes:
+        for name in cases:
+            try:
+                result = measure(CASES[name](size), repeat)
+            except RuntimeError as error:
+                results[name][str(size)] = {"skipped": str(error)}
+                print(f"{name:32} {size:>8}  skipped: {error}")
+                continue
+            results[name][str(size)] = result
+            print(f"{name:32} {size:>8}  best {result['best'] * 1000:10.3f}"
+                  + f" ms  median {result['median'] * 1000:10.3f} ms")
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results}
+
+
+def compare(baseline: typing.Dict[str, typing.Any],
+            current: typing.Dict[str, typing.Any],
+            threshold: float, /) -> int:
+    # returns the number of regressions, measurements slower than the
+    # baseline by more than threshold (best of the runs) and NOISE_FLOOR.
+    regressions = 0
+    for name, sizes in current["results"].items():
+        for size, result in sizes.items():
+            previous = baseline["results"].get(name, {}).get(size)
+            if (previous is None or "best" not in previous
+                    or "best" not in result):
+                continue
+            ratio = result["best"] / max(previous["best"], 1e-12)
+            flag = ""
+            if abs(result["best"] - previous["best"]) < NOISE_FLOOR:
+                pass
+            elif ratio > 1 + threshold:
+                regressions += 1
+                flag = "  REGRESSION"
+            elif ratio < 1 - threshold:
+                flag = "  improved"
+            print(f"{name:32} {size:>8}  {previous['best'] * 1000:10.3f} ms"
+                  + f" -> {result['best'] * 1000:10.3f} ms"
+                  + f"  ({ratio:.2f}x){flag}")
+    print(f"{regressions} regression(s) over {threshold:.0%}.")
+    return regressions
+
+
+def load(path: str, /) -> typing.Dict[str, typing.Any]:
+    with open(path, "r", encoding="utf-8") as handler:
+        return json.load(handler)
+
+
+def main(argv: typing.Sequence[str] = None, /) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[2])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=list(DEFAULT_SIZES))
+    parser.add_argument("--cases", nargs="+", choices=tuple(CASES),
+                        default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", metavar="FILE",
+                        help="save the results as JSON")
+    parser.add_argument("--baseline", metavar="FILE",
+                        help="compare the results with an earlier run")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "FILE"),
+                        help="compare two saved runs without running")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown flagged as a regression "
+                        + f"(default: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args(argv)
+    if args.compare:
+        baseline, current = (load(path) for path in args.compare)
+        return 1 if compare(baseline, current, args.threshold) else 0
+    current = run_suite(args.cases, args.sizes, args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handler:
+            json.dump(current, handler, indent=2)
+    if args.baseline:
+        baseline = load(args.baseline)
+        return 1 if compare(baseline, current, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
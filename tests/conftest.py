@@ -0,0 +1,57 @@
+import json
+import random
+import typing
+
+import pytest
+
+import wpqc
+from wpqc import Quote, Translator
+
+SHAPES: typing.Tuple[str, ...] = (
+    Translator.CUBE, Translator.CUBOID, Translator.CYLINDER,
+    Translator.SPHERE, Translator.TRIANGULAR_PRISM)
+PAPERS: typing.Tuple[str, ...] = (
+    Translator.CHEAP_WRAPPING, Translator.EXPENSIVE_WRAPPING)
+
+
+def make_quote(*, title: str = "Quote", shape: str = Translator.CUBE,
+               lengths: typing.Sequence[str] = ("10", "20", "30"),
+               paper: str = Translator.CHEAP_WRAPPING,
+               colour: str = "gold", bow: int = 0,
+               message: str = None) -> Quote:
+    # built through the Translator, as the application builds quotes.
+    return Quote(
+        quote_title=Translator.check_quote_title(title),
+        present_type=Translator.translate_present_type(
+            shape=shape, length_one=lengths[0], length_two=lengths[1],
+            length_three=lengths[2]),
+        wrapping_paper=Translator.translate_wrapping_paper_type(
+            paper=paper, colour=colour),
+        gift_card=Translator.translate_gift_card(
+            gift_card=int(message is not None), message=message or ""),
+        bow=Translator.translate_bow(bow=bow))
+
+
+def make_random_quote(generator: random.Random, /) -> Quote:
+    return make_quote(
+        title=f"Quote {generator.randrange(1000)}",
+        shape=generator.choice(SHAPES),
+        lengths=[f"{generator.uniform(0.5, 80):.2f}" for _ in range(3)],
+        paper=generator.choice(PAPERS),
+        colour=generator.choice(wpqc.get_catalogue().get_colour_names()),
+        bow=generator.randrange(2),
+        message=generator.choice((None, "", "Happy birthday!")))
+
+
+@pytest.fixture
+def catalogue_data() -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    # the default catalogue as JSON data, which a test may change and
+    # install with install_catalogue; the default is put back afterwards.
+    with open(wpqc.DEFAULT_CATALOGUE, encoding="utf-8") as handler:
+        data = json.load(handler)
+    yield data
+    wpqc.set_catalogue(wpqc.Catalogue.load(wpqc.DEFAULT_CATALOGUE))
+
+
+def install_catalogue(data: typing.Dict[str, typing.Any], /) -> None:
+    wpqc.set_catalogue(wpqc.Catalogue.from_json(json.dumps(data)))
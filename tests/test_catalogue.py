@@ -0,0 +1,98 @@
+import copy
+import json
+import typing
+
+import pytest
+
+import wpqc
+from conftest import install_catalogue, make_quote
+from wpqc import (
+    Catalogue, CheapWrappingPaper, ExpensiveWrappingPaper, PaperGrade,
+    Translator)
+
+
+def test_the_default_catalogue_round_trips(
+        catalogue_data: typing.Dict[str, typing.Any]) -> None:
+    catalogue = Catalogue.load(wpqc.DEFAULT_CATALOGUE)
+    assert catalogue.get_grades() == tuple(
+        PaperGrade(entry["name"], entry["label"], entry["price_cm_sq"],
+                   entry["pattern"])
+        for entry in catalogue_data["grades"])
+    assert catalogue.get_colour_names() == tuple(
+        entry["name"] for entry in catalogue_data["colours"])
+    assert catalogue.get_colour_labels() == tuple(
+        entry["label"] for entry in catalogue_data["colours"])
+    again = Catalogue.from_json(json.dumps(catalogue_data))
+    assert again.get_grades() == catalogue.get_grades()
+    assert again.get_colour_names() == catalogue.get_colour_names()
+
+
+def test_colours_are_looked_up_both_ways() -> None:
+    catalogue = wpqc.get_catalogue()
+    for name, label in zip(catalogue.get_colour_names(),
+                           catalogue.get_colour_labels()):
+        assert catalogue.has_colour(name)
+        assert catalogue.get_colour_label(name) == label
+        assert catalogue.get_colour_name(label) == name
+        assert Translator.translate_colour(name) == label
+        assert Translator.translate_colour(
+            label, human_readable=False) == name
+    assert not catalogue.has_colour("beige")
+    assert catalogue.get_colour_label("beige") is None
+    assert catalogue.describe_colour("beige") == "beige"
+    assert catalogue.get_grade("foil") is None
+
+
+@pytest.mark.parametrize("change", [
+    lambda data: data["grades"][0].update(price_cm_sq=-1),
+    lambda data: data["grades"][0].update(price_cm_sq="nan"),
+    lambda data: data["grades"][0].update(pattern="stripes"),
+    lambda data: data["grades"][0].update(name=""),
+    lambda data: data["grades"][0].pop("label"),
+    lambda data: data["colours"].append(dict(data["colours"][0])),
+    lambda data: data["colours"].append(
+        {"name": "beige", "label": data["colours"][0]["label"]}),
+    lambda data: data["grades"].append(dict(data["grades"][0])),
+    lambda data: data.pop("colours"),
+])
+def test_invalid_catalogues_are_rejected(
+        catalogue_data: typing.Dict[str, typing.Any],
+        change: typing.Callable[[typing.Dict[str, typing.Any]], None]
+        ) -> None:
+    data = copy.deepcopy(catalogue_data)
+    change(data)
+    with pytest.raises(ValueError):
+        Catalogue.from_json(json.dumps(data))
+
+
+def test_a_new_catalogue_reprices_new_quotes(
+        catalogue_data: typing.Dict[str, typing.Any]) -> None:
+    before = make_quote()
+    price = wpqc.get_price_cache().get_price(before)
+    catalogue_data["grades"][0]["price_cm_sq"] *= 2
+    catalogue_data["grades"].append(
+        {"name": "foil", "label": "Foil", "price_cm_sq": 1.5})
+    install_catalogue(catalogue_data)
+    assert len(wpqc.get_price_cache()) == 0
+    after = make_quote()
+    assert after.wrapping_paper is not before.wrapping_paper
+    assert after.wrapping_paper.get_price() == (
+        2 * before.wrapping_paper.get_price())
+    assert wpqc.get_price_cache().get_price(after) > price
+    foil = make_quote(paper="foil")
+    assert str(foil.wrapping_paper) == "Foil Wrapping Paper [Gold]"
+
+
+@pytest.mark.parametrize("paper_type, grade", [
+    (CheapWrappingPaper, "cheap"),
+    (ExpensiveWrappingPaper, "expensive"),
+])
+def test_preset_papers_need_their_grade(
+        catalogue_data: typing.Dict[str, typing.Any], paper_type: type,
+        grade: str) -> None:
+    assert paper_type("gold").get_grade() == grade
+    catalogue_data["grades"] = [
+        entry for entry in catalogue_data["grades"] if entry["name"] != grade]
+    install_catalogue(catalogue_data)
+    with pytest.raises(ValueError, match=grade):
+        paper_type("gold")
@@ -0,0 +1,93 @@
+import random
+import typing
+
+import pytest
+
+from conftest import install_catalogue, make_quote, make_random_quote
+from wpqc import Order
+from wpqc_cutting import (
+    TOLERANCE, CuttingPlan, describe_cutting_plans, pack_sheets,
+    plan_order_cutting)
+
+
+def check_plan(plan: CuttingPlan, /) -> None:
+    # every sheet lies on the roll and no two sheets overlap.
+    for placement in plan.placements:
+        assert placement.x >= 0 and placement.y >= 0
+        assert placement.x + placement.across <= (
+            plan.roll_width + TOLERANCE)
+        assert placement.y + placement.along <= (
+            plan.roll_length + TOLERANCE)
+    placements = sorted(plan.placements, key=lambda placement: placement.y)
+    for index, first in enumerate(placements):
+        for second in placements[index + 1:]:
+            if second.y >= first.y + first.along - TOLERANCE:
+                break
+            assert (first.x + first.across <= second.x + TOLERANCE
+                    or second.x + second.across <= first.x + TOLERANCE)
+
+
+def test_sheets_are_packed_onto_shelves() -> None:
+    roll_length, placements, oversized = pack_sheets(
+        [(0, 30, 60), (1, 20, 40), (2, 20, 30), (3, 10, 10)], 100)
+    assert oversized == []
+    # the long side of each sheet runs across the roll.
+    assert [(placement.quote_index, placement.x, placement.y,
+             placement.rotated) for placement in placements] == [
+        (0, 0, 0, False), (1, 60, 0, False), (2, 0, 30, False),
+        (3, 30, 30, False)]
+    assert roll_length == 50
+
+
+def test_sheets_too_wide_for_the_roll() -> None:
+    roll_length, placements, oversized = pack_sheets(
+        [(0, 150, 80), (1, 120, 130)], 100)
+    # the first fits turned with its short side across the roll.
+    assert [(placement.quote_index, placement.across, placement.along,
+             placement.rotated) for placement in placements] == [
+        (0, 80, 150, False)]
+    assert oversized == [1]
+    assert roll_length == 150
+
+
+@pytest.mark.parametrize("roll_width", [60.0, 100.0, 150.0])
+def test_order_plans_cover_every_sheet(roll_width: float) -> None:
+    generator = random.Random(19)
+    order = Order(1)
+    for _ in range(300):
+        order.add_quote(make_random_quote(generator))
+    plans = plan_order_cutting(order, roll_width=roll_width)
+    assert len({(plan.paper, plan.colour) for plan in plans}) == len(plans)
+    indexes: typing.List[int] = []
+    for plan in plans:
+        check_plan(plan)
+        assert 0 <= plan.get_waste_percentage() < 100
+        for placement in plan.placements:
+            quote = order.get_quote(placement.quote_index)
+            assert quote.wrapping_paper.get_colour() == plan.colour
+            assert sorted((placement.across, placement.along)) == sorted(
+                quote.present.get_sheet_dimensions())
+        indexes += [placement.quote_index for placement in plan.placements]
+        indexes += plan.oversized
+    assert sorted(indexes) == list(range(len(order)))
+
+
+def test_describe_cutting_plans() -> None:
+    order = Order(1)
+    order.add_quote(make_quote(lengths=("10", "20", "30")))
+    order.add_quote(make_quote(
+        lengths=("200", "200", "200"), paper="expensive", colour="purple"))
+    assert describe_cutting_plans(plan_order_cutting(order)).splitlines() == [
+        "Cheap Gold: 1 sheet(s), 0.36m of a 100cm roll, 54.0% waste",
+        "Expensive Purple: 0 sheet(s), 0.00m of a 100cm roll, 0.0% waste, "
+        + "1 sheet(s) wider than the roll"]
+
+
+def test_plans_are_described_with_catalogue_labels(
+        catalogue_data: typing.Dict[str, typing.Any]) -> None:
+    catalogue_data["grades"][0]["label"] = "Budget"
+    install_catalogue(catalogue_data)
+    order = Order(1)
+    order.add_quote(make_quote(colour="DarkSlateGray4"))
+    assert describe_cutting_plans(plan_order_cutting(order)).startswith(
+        "Budget Dark Slate Grey 4: ")
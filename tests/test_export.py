@@ -0,0 +1,95 @@
+import concurrent.futures
+import io
+import os
+import random
+import typing
+
+import pytest
+
+from conftest import make_quote, make_random_quote
+from wpqc import ColumnarOrder, Order, OrderSnapshot
+
+ORDER_TYPES: typing.Tuple[type, ...] = (Order, ColumnarOrder)
+TIME_DATE: str = "2022-05-01 12-00-00"
+SEPARATOR: str = "-" * 80
+
+
+def write_receipt(snapshot: OrderSnapshot, /) -> str:
+    handler = io.StringIO()
+    snapshot.write_receipt(handler)
+    return handler.getvalue()
+
+
+def make_order(order_type: type, count: int, /) -> Order:
+    generator = random.Random(25)
+    order = order_type(4)
+    for _ in range(count):
+        order.add_quote(make_random_quote(generator))
+    return order
+
+
+@pytest.mark.parametrize("order_type", ORDER_TYPES)
+def test_receipt_layout(order_type: type) -> None:
+    order = order_type(7)
+    order.add_quote(make_quote(title="Box", message="Hi", bow=1))
+    order.add_quote(make_quote(
+        title="Tube", shape="cylinder", lengths=("10", "20", "0"),
+        paper="expensive", colour="purple"))
+    snapshot = order.snapshot()._replace(time_date=TIME_DATE)
+    assert write_receipt(snapshot) == (
+        f"{SEPARATOR}\n\n\tWrapping Paper Quotes\n\n"
+        + f"\tDate Time:\t\t\t\t\t\t{TIME_DATE}\n"
+        + "\tOrder Number:\t\t\t\t\t7\n"
+        + "\tNumber of Quotes:\t\t\t\t2\n\n"
+        + f"{SEPARATOR}\n\n"
+        + "Box   (Total: GBP 8.66)\n"
+        + "\t\tCube [l = 10.0cm] [area = 1656.0cm^2]\n"
+        + "\t\tCheap Wrapping Paper [Gold]   (GBP 6.62)\n"
+        + "\t\tGift Card ['Hi']   (GBP 0.54)\n"
+        + "\t\tBow   (GBP 1.50)\n\n"
+        + "Tube   (Total: GBP 34.07)\n"
+        + "\t\tCylinder [r = 10.0 cm, d = 20.0cm] [area = 4542.9 cm^2]\n"
+        + "\t\tExpensive Wrapping Paper [Purple]   (GBP 34.07)\n\n"
+        + "\nTotal price for this order: GBP 42.73\n")
+
+
+def test_columnar_receipts_match_order_receipts() -> None:
+    # more quotes than fit in one chunk of the streamed receipt.
+    receipts = [
+        write_receipt(make_order(order_type, 1500).snapshot()._replace(
+            time_date=TIME_DATE))
+        for order_type in ORDER_TYPES]
+    assert receipts[0] == receipts[1]
+    assert receipts[0].count("(Total: GBP") == 1500
+
+
+@pytest.mark.parametrize("order_type", ORDER_TYPES)
+def test_exports_on_other_threads_match_serial_receipts(
+        order_type: type, tmp_path: "os.PathLike[str]",
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    order = make_order(order_type, 300)
+    snapshots = []
+    for order_number in range(8):
+        order.add_quote(make_quote(title=f"Order {order_number}"))
+        snapshots.append(order.snapshot()._replace(
+            order_number=order_number))
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(
+            OrderSnapshot.export_order, snapshots))
+    assert results == [0] * len(snapshots)
+    for snapshot in snapshots:
+        with open(snapshot.get_receipt_name(), encoding="utf-8") as handler:
+            assert handler.read() == write_receipt(snapshot)
+
+
+@pytest.mark.parametrize("order_type", ORDER_TYPES)
+def test_snapshot_is_unaffected_by_later_changes(order_type: type) -> None:
+    order = order_type(1)
+    order.add_quote(make_quote(title="Kept"))
+    snapshot = order.snapshot()
+    receipt = write_receipt(snapshot)
+    order.replace_quote(0, make_quote(title="Changed", paper="expensive"))
+    order.add_quote(make_quote())
+    assert [quote.title for quote in snapshot.quotes] == ["Kept"]
+    assert write_receipt(snapshot) == receipt
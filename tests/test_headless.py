@@ -0,0 +1,106 @@
+import csv
+import json
+import os
+import typing
+
+import pytest
+
+import wpqc
+from wpqc import translate_quote_row
+
+INVALID_DIMENSIONS: str = "Invalid dimensions provided for present."
+INCOMPLETE: str = "This quote is not complete."
+
+ROWS: typing.Tuple[typing.Dict[str, str], ...] = (
+    {"title": "Good", "shape": "cube", "length_one": "10", "paper": "cheap",
+     "colour": "gold", "bow": "1", "gift_card": "1", "message": "Hi"},
+    {"title": "NaN", "shape": "cube", "length_one": "nan", "paper": "cheap",
+     "colour": "gold"},
+    {"title": "Infinite", "shape": "cuboid", "length_one": "3",
+     "length_two": "inf", "length_three": "2", "paper": "cheap",
+     "colour": "gold"},
+    {"title": "Zero", "shape": "cube", "length_one": "0", "paper": "cheap",
+     "colour": "gold"},
+    {"title": "Shape", "shape": "cone", "length_one": "3", "paper": "cheap",
+     "colour": "gold"},
+    {"title": "Paper", "shape": "cube", "length_one": "3", "paper": "foil",
+     "colour": "gold"},
+    {"title": "Colour", "shape": "cube", "length_one": "3",
+     "paper": "cheap", "colour": "no such colour"},
+    {"title": "Cylinder", "shape": "cylinder", "length_one": "4",
+     "length_two": "9", "paper": "expensive", "colour": "purple"},
+)
+
+
+@pytest.mark.parametrize("length", ["nan", "NaN", "inf", "-inf", "1e999"])
+def test_non_finite_lengths_are_rejected(length: str) -> None:
+    quote, reason = translate_quote_row({
+        "shape": "cuboid", "length_one": "3", "length_two": length,
+        "length_three": "2", "paper": "cheap", "colour": "gold"})
+    assert quote is None
+    assert reason == INVALID_DIMENSIONS
+
+
+def test_valid_row_is_priced() -> None:
+    quote, reason = translate_quote_row(ROWS[0])
+    assert reason == ""
+    assert wpqc.describe_quote_price(quote) == {
+        "title": "Good", "area": "1656.00", "paper_price": "6.62",
+        "price": "8.66"}
+
+
+def write_rows(path: str, /) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as handler:
+        writer = csv.DictWriter(handler, wpqc.HEADLESS_FIELDS)
+        writer.writeheader()
+        writer.writerows(ROWS)
+
+
+def read_rows(path: str, /) -> typing.List[typing.Dict[str, str]]:
+    with open(path, newline="", encoding="utf-8") as handler:
+        return list(csv.DictReader(handler))
+
+
+def test_price_file_splits_priced_and_rejected_rows(
+        tmp_path: "os.PathLike[str]") -> None:
+    quotes = os.path.join(tmp_path, "quotes.csv")
+    output = os.path.join(tmp_path, "priced.csv")
+    rejects = os.path.join(tmp_path, "rejects.csv")
+    usage = os.path.join(tmp_path, "usage.json")
+    write_rows(quotes)
+    assert wpqc.main([
+        "--price", quotes, "--output", output, "--rejects", rejects,
+        "--usage", usage]) == 0
+    priced = read_rows(output)
+    assert [row["title"] for row in priced] == ["Good", "Cylinder"]
+    assert priced[0]["price"] == "8.66"
+    assert [(row["line"], row["title"], row["reason"])
+            for row in read_rows(rejects)] == [
+        ("2", "NaN", INVALID_DIMENSIONS),
+        ("3", "Infinite", INVALID_DIMENSIONS),
+        ("4", "Zero", INVALID_DIMENSIONS),
+        ("5", "Shape", INCOMPLETE),
+        ("6", "Paper", INCOMPLETE),
+        ("7", "Colour", "Invalid wrapping paper colour within the quote."),
+    ]
+    with open(usage, encoding="utf-8") as handler:
+        assert json.load(handler)["total"]["quotes"] == 2
+
+
+def test_price_file_jsonl(tmp_path: "os.PathLike[str]") -> None:
+    quotes = os.path.join(tmp_path, "quotes.jsonl")
+    output = os.path.join(tmp_path, "priced.jsonl")
+    with open(quotes, "w", encoding="utf-8") as handler:
+        for row in ROWS:
+            handler.write(json.dumps(row) + "\n")
+        handler.write("{not json\n")
+    rejects = os.path.join(tmp_path, "rejects.jsonl")
+    assert wpqc.main([
+        "--price", quotes, "--output", output, "--rejects", rejects]) == 0
+    with open(output, encoding="utf-8") as handler:
+        priced = [json.loads(line) for line in handler]
+    with open(rejects, encoding="utf-8") as handler:
+        rejected = [json.loads(line) for line in handler]
+    assert [row["title"] for row in priced] == ["Good", "Cylinder"]
+    assert len(rejected) == 7
+    assert rejected[1]["reason"] == INVALID_DIMENSIONS
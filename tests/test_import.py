@@ -0,0 +1,91 @@
+import csv
+import os
+import time
+import typing
+
+import pytest
+
+import wpqc
+import wpqc_import
+from wpqc_import import ImportBatch, QuoteImport
+
+GOOD_ROW: typing.Dict[str, str] = {
+    "title": "Good", "shape": "cube", "length_one": "10", "paper": "cheap",
+    "colour": "gold"}
+BAD_ROW: typing.Dict[str, str] = dict(GOOD_ROW, title="Bad", shape="cone")
+
+
+def write_quotes(path: str, count: int, /) -> None:
+    # every tenth row is rejected.
+    with open(path, "w", newline="", encoding="utf-8") as handler:
+        writer = csv.DictWriter(handler, wpqc.HEADLESS_FIELDS)
+        writer.writeheader()
+        for index in range(count):
+            writer.writerow(GOOD_ROW if index % 10 else BAD_ROW)
+
+
+def take_all(quote_import: QuoteImport, /) -> typing.List[ImportBatch]:
+    batches: typing.List[ImportBatch] = []
+    deadline = time.monotonic() + 30
+    while not quote_import.is_finished():
+        assert time.monotonic() < deadline
+        batches += quote_import.take_batches(4)
+        time.sleep(0.001)
+    return batches
+
+
+@pytest.fixture
+def quotes_path(tmp_path: "os.PathLike[str]") -> str:
+    return os.path.join(tmp_path, "quotes.csv")
+
+
+def test_quotes_arrive_in_batches(quotes_path: str) -> None:
+    write_quotes(quotes_path, 1050)
+    quote_import = QuoteImport(quotes_path, batch_size=100)
+    quote_import.start()
+    batches = take_all(quote_import)
+    assert [len(batch.quotes) + len(batch.rejected)
+            for batch in batches] == [100] * 10 + [50]
+    assert quote_import.get_imported_count() == 945
+    assert quote_import.get_rejected_count() == 105
+    assert quote_import.get_error() == ""
+    rejected = [row for batch in batches for row, _ in batch.rejected]
+    assert rejected == list(range(1, 1051, 10))
+    progress = [batch.progress for batch in batches]
+    assert progress == sorted(progress)
+    assert progress[-1] == 1
+    assert all(quote.title == "Good"
+               for batch in batches for quote in batch.quotes)
+
+
+def test_the_worker_waits_for_batches_to_be_taken(
+        quotes_path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(wpqc_import, "MAX_PENDING_BATCHES", 2)
+    write_quotes(quotes_path, 1000)
+    quote_import = QuoteImport(quotes_path, batch_size=10)
+    quote_import.start()
+    deadline = time.monotonic() + 30
+    while quote_import._batches.qsize() < 2:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    # two batches queued and the worker holding a third.
+    time.sleep(0.1)
+    assert quote_import._batches.qsize() == 2
+    assert quote_import._thread.is_alive()
+    assert len(quote_import.take_batches(2)) == 2
+    quote_import.cancel()
+    quote_import._thread.join(5)
+    assert not quote_import._thread.is_alive()
+    assert quote_import.is_finished() and quote_import.is_cancelled()
+    assert quote_import.take_batches(10) == []
+    assert quote_import.get_imported_count() == 18
+
+
+def test_unreadable_files_report_an_error(quotes_path: str) -> None:
+    quote_import = QuoteImport(quotes_path)
+    quote_import.start()
+    batches = take_all(quote_import)
+    assert [(batch.quotes, batch.rejected) for batch in batches] == [
+        ((), ())]
+    assert quote_import.get_error()
+    assert quote_import.get_imported_count() == 0
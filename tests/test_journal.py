@@ -0,0 +1,180 @@
+import os
+import random
+import typing
+
+import pytest
+
+import wpqc_journal
+from conftest import install_catalogue, make_quote, make_random_quote
+from wpqc import Order, Quote
+from wpqc_journal import OrderJournal
+
+
+def titles(order: Order, /) -> typing.List[str]:
+    return [quote.title for quote in order]
+
+
+@pytest.fixture
+def journal_path(tmp_path: "os.PathLike[str]") -> str:
+    return os.path.join(tmp_path, "wpqc.journal")
+
+
+def test_replay_rebuilds_the_order(journal_path: str) -> None:
+    generator = random.Random(3)
+    order = Order(12)
+    with OrderJournal(journal_path) as journal:
+        assert journal.begin(12) == 0
+        for _ in range(200):
+            action = generator.random()
+            if action < 0.6 or not len(order):
+                quote = make_random_quote(generator)
+                order.add_quote(quote)
+                journal.add_quote(quote)
+            elif action < 0.8:
+                index = generator.randrange(len(order))
+                quote = make_random_quote(generator)
+                order.replace_quote(index, quote)
+                journal.replace_quote(index, quote)
+            else:
+                index = generator.randrange(len(order))
+                order.delete_quote(index)
+                journal.delete_quote(index)
+    replayed = OrderJournal(journal_path).replay()
+    assert replayed.get_order_number() == 12
+    assert titles(replayed) == titles(order)
+    assert replayed.calculate_total_price() == order.calculate_total_price()
+    assert list(replayed.get_paper_usage()) == list(order.get_paper_usage())
+
+
+def test_replay_without_a_journal(journal_path: str) -> None:
+    assert OrderJournal(journal_path).replay() is None
+
+
+def test_replay_stops_at_a_torn_record(journal_path: str) -> None:
+    with OrderJournal(journal_path) as journal:
+        journal.begin(1)
+        journal.add_quotes([make_quote(title="One"), make_quote(title="Two")])
+    with open(journal_path, "a", encoding="utf-8") as handler:
+        handler.write('{"op": "add", "quote": ["Thr')
+    journal = OrderJournal(journal_path)
+    assert titles(journal.replay()) == ["One", "Two"]
+    assert journal.get_skipped_count() == 0
+
+
+def test_replay_compacts_the_journal(journal_path: str) -> None:
+    with OrderJournal(journal_path) as journal:
+        journal.begin(1)
+        for index in range(10):
+            journal.add_quote(make_quote(title=f"Quote {index}"))
+        for _ in range(5):
+            journal.delete_quote(0)
+    journal = OrderJournal(journal_path)
+    order = journal.replay()
+    journal.close()
+    # begin and one add per quote.
+    assert journal.get_record_count() == len(order) + 1
+    with open(journal_path, encoding="utf-8") as handler:
+        assert len(handler.readlines()) == len(order) + 1
+    assert titles(OrderJournal(journal_path).replay()) == titles(order)
+
+
+def test_check_compaction_after_enough_slack(journal_path: str) -> None:
+    order = Order(1)
+    quote = make_quote()
+    with OrderJournal(journal_path) as journal:
+        journal.begin(1)
+        order.add_quote(quote)
+        journal.add_quote(quote)
+        for _ in range(wpqc_journal.COMPACTION_SLACK):
+            order.replace_quote(0, quote)
+            journal.replace_quote(0, quote)
+        assert journal.get_record_count() > wpqc_journal.COMPACTION_SLACK
+        assert journal.check_compaction(order) == 0
+        assert journal.get_record_count() == 2
+
+
+def test_replay_skips_quotes_no_longer_in_the_catalogue(
+        journal_path: str,
+        catalogue_data: typing.Dict[str, typing.Any]) -> None:
+    catalogue_data["grades"].append(
+        {"name": "foil", "label": "Foil", "price_cm_sq": 1.5})
+    install_catalogue(catalogue_data)
+
+    def quote(title: str, paper: str = "cheap") -> Quote:
+        return make_quote(title=title, paper=paper)
+
+    with OrderJournal(journal_path) as journal:
+        journal.begin(1)
+        journal.add_quotes([
+            quote("One"), quote("Two", "foil"), quote("Three"),
+            quote("Four", "foil")])
+        # the journal's indices count the quotes which will be skipped.
+        journal.replace_quote(0, quote("Five", "foil"))
+        journal.replace_quote(2, quote("Six", "expensive"))
+        journal.delete_quote(1)
+        journal.add_quote(quote("Seven"))
+        journal.delete_quote(2)
+        journal.replace_quote(1, quote("Eight"))
+    del catalogue_data["grades"][-1]
+    install_catalogue(catalogue_data)
+    journal = OrderJournal(journal_path)
+    order = journal.replay()
+    assert titles(order) == ["Eight", "Seven"]
+    # the adds of Two and Four and the replacement by Five.
+    assert journal.get_skipped_count() == 3
+
+
+def test_replay_maps_indices_past_many_skipped_quotes(
+        journal_path: str,
+        catalogue_data: typing.Dict[str, typing.Any]) -> None:
+    catalogue_data["grades"].append(
+        {"name": "foil", "label": "Foil", "price_cm_sq": 1.5})
+    install_catalogue(catalogue_data)
+    generator = random.Random(12)
+    # [title, kept] of each quote in the journal, kept once foil is gone.
+    slots: typing.List[typing.List[typing.Any]] = []
+    with OrderJournal(journal_path) as journal:
+        journal.begin(1)
+        for number in range(3000):
+            action = generator.random()
+            title = f"Quote {number}"
+            paper = generator.choice(("cheap", "foil"))
+            quote = make_quote(title=title, paper=paper)
+            if action < 0.5 or not slots:
+                journal.add_quote(quote)
+                slots.append([title, paper != "foil"])
+            elif action < 0.75:
+                index = generator.randrange(len(slots))
+                journal.replace_quote(index, quote)
+                if slots[index][1]:
+                    slots[index] = [title, paper != "foil"]
+            else:
+                index = generator.randrange(len(slots))
+                journal.delete_quote(index)
+                del slots[index]
+    del catalogue_data["grades"][-1]
+    install_catalogue(catalogue_data)
+    order = OrderJournal(journal_path).replay()
+    assert titles(order) == [title for title, kept in slots if kept]
+
+
+def test_add_quotes_syncs_once_per_batch(
+        journal_path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    syncs: typing.List[int] = []
+    monkeypatch.setattr(os, "fsync", syncs.append)
+    quotes = [make_quote(title=f"Quote {index}") for index in range(500)]
+    with OrderJournal(journal_path) as journal:
+        journal.begin(1)
+        syncs.clear()
+        assert journal.add_quotes(quotes) == 0
+        assert len(syncs) == 1
+        assert not journal.has_unsynced_records()
+    assert len(OrderJournal(journal_path).replay()) == 500
+
+
+def test_discard_removes_the_journal(journal_path: str) -> None:
+    journal = OrderJournal(journal_path)
+    journal.begin(1)
+    journal.add_quote(make_quote())
+    journal.discard()
+    assert not os.path.exists(journal_path)
@@ -0,0 +1,90 @@
+import json
+import os
+import threading
+import typing
+
+import pytest
+
+import wpqc_metrics
+from wpqc_metrics import CallStatistics
+
+
+class Probe:
+
+    def call(self, value: int, /) -> int:
+        return value + 1
+
+    @staticmethod
+    def call_static(value: int, /) -> int:
+        return value * 2
+
+
+@pytest.fixture
+def probe() -> typing.Iterator[typing.Type[Probe]]:
+    originals = dict(vars(Probe))
+    wpqc_metrics.register(Probe, "call", "call_static")
+    yield Probe
+    wpqc_metrics.disable()
+    wpqc_metrics.reset()
+    wpqc_metrics._registered[:] = [
+        (owner, name) for owner, name in wpqc_metrics._registered
+        if owner is not Probe]
+    assert dict(vars(Probe)) == originals
+
+
+def test_nothing_is_wrapped_until_enabled(
+        probe: typing.Type[Probe]) -> None:
+    call = vars(probe)["call"]
+    assert probe().call(1) == 2
+    assert vars(probe)["call"] is call
+    assert "Probe.call" not in wpqc_metrics.snapshot()["calls"]
+
+
+def test_enabled_methods_are_counted(
+        probe: typing.Type[Probe], tmp_path: "os.PathLike[str]") -> None:
+    path = os.path.join(tmp_path, "metrics.json")
+    wpqc_metrics.enable(dump_path=path)
+    assert wpqc_metrics.is_enabled()
+    for value in range(10):
+        assert probe().call(value) == value + 1
+    assert probe.call_static(4) == 8
+    assert wpqc_metrics.dump() == 0
+    with open(path, encoding="utf-8") as handler:
+        calls = json.load(handler)["calls"]
+    assert calls["Probe.call"]["count"] == 10
+    assert calls["Probe.call_static"]["count"] == 1
+    assert sum(calls["Probe.call"]["histogram_us_under"].values()) == 10
+    wpqc_metrics.disable()
+    probe().call(0)
+    assert wpqc_metrics.snapshot()["calls"]["Probe.call"]["count"] == 10
+    wpqc_metrics.reset()
+    assert "Probe.call" not in wpqc_metrics.snapshot()["calls"]
+
+
+def test_percentiles_are_bucket_upper_bounds() -> None:
+    statistics = CallStatistics()
+    assert statistics.get_percentile_ns(0.5) == 0
+    for elapsed_ns in (100, 100, 100, 5000):
+        statistics.record(elapsed_ns)
+    assert statistics.get_percentile_ns(0.5) == 128
+    assert statistics.get_percentile_ns(0.99) == 8192
+    snapshot = statistics.snapshot()
+    assert (snapshot["count"], snapshot["max_us"]) == (4, 5)
+    assert snapshot["histogram_us_under"] == {"0.128": 3, "8.192": 1}
+
+
+def test_records_from_several_threads_are_all_kept() -> None:
+    statistics = CallStatistics()
+
+    def record() -> None:
+        for elapsed_ns in range(20000):
+            statistics.record(elapsed_ns)
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert statistics.count == 80000
+    assert sum(statistics.buckets) == 80000
+    assert statistics.total_ns == 4 * sum(range(20000))
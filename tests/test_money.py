@@ -0,0 +1,67 @@
+import decimal
+
+import pytest
+
+from wpqc import Money, WrappingPaper, divide_half_up, round_number
+
+
+@pytest.mark.parametrize("amount, pence", [
+    ("0.005", 1),
+    ("0.004", 0),
+    ("1.005", 101),
+    (2.675, 268),
+    ("-0.005", -1),
+    ("19.999", 2000),
+    (3, 300),
+])
+def test_from_pounds_rounds_half_up_once(amount: object, pence: int) -> None:
+    assert Money.from_pounds(amount).get_pence() == pence
+
+
+def test_from_pounds_marks_invalid_amounts() -> None:
+    assert Money.from_pounds("not a price") == Money(-100)
+
+
+@pytest.mark.parametrize("pence, text", [
+    (0, "0.00"), (5, "0.05"), (123456, "1234.56"), (-5, "-0.05"),
+    (-250, "-2.50"),
+])
+def test_formatting(pence: int, text: str) -> None:
+    assert str(Money(pence)) == text
+    assert f"{Money(pence):.2f}" == text
+    assert Money(pence).to_pounds() == decimal.Decimal(text)
+
+
+def test_sums_are_exact() -> None:
+    total = Money()
+    for _ in range(1000):
+        total += Money.from_pounds("0.10")
+    assert total == Money(10000)
+    assert total - Money(1) == Money(9999)
+
+
+@pytest.mark.parametrize("numerator, denominator, quotient", [
+    (5, 10, 1), (4, 10, 0), (15, 10, 2), (-5, 10, -1), (-4, 10, 0),
+])
+def test_divide_half_up(numerator: int, denominator: int,
+                        quotient: int) -> None:
+    assert divide_half_up(numerator, denominator) == quotient
+
+
+@pytest.mark.parametrize("amount, rounded", [
+    (0.125, 0.13), (0.375, 0.38), (-0.625, -0.63), (2.5, 2.5),
+    (1656.0, 1656.0),
+    # just below the tie as a binary float, so it rounds down.
+    (1.005, 1.0),
+])
+def test_round_number_ties_go_away_from_zero(amount: float,
+                                             rounded: float) -> None:
+    assert round_number(amount) == rounded
+
+
+def test_paper_price_is_rounded_to_the_nearest_penny() -> None:
+    # 0.4p per cm^2: 1.25cm^2 is 0.5p, a tie, and rounds up.
+    paper = WrappingPaper("gold", 0.4)
+    assert paper.calculate_price(1.25) == Money(1)
+    assert paper.calculate_price(1.24) == Money(0)
+    assert paper.calculate_price(1656.0) == Money(662)
@@ -0,0 +1,137 @@
+import array
+import random
+import typing
+
+import pytest
+
+from conftest import install_catalogue, make_quote, make_random_quote
+from wpqc import (
+    ColumnarOrder, Money, Order, PaperUsage, Quote, WrappingPaper)
+
+ORDER_TYPES: typing.Tuple[type, ...] = (Order, ColumnarOrder)
+
+
+def recalculate_usage(quotes: typing.Iterable[Quote], /) -> PaperUsage:
+    usage = PaperUsage()
+    for quote in quotes:
+        breakdown = quote.calculate_price_breakdown()
+        usage.add_quote(quote, breakdown.area, breakdown.paper)
+    return usage
+
+
+def check_totals(order: Order, quotes: typing.List[Quote], /) -> None:
+    total = Money()
+    for quote in quotes:
+        total += quote.calculate_price()
+    assert len(order) == len(quotes)
+    assert order.calculate_total_price() == total
+    assert list(order.get_paper_usage()) == list(recalculate_usage(quotes))
+
+
+@pytest.mark.parametrize("order_type", ORDER_TYPES)
+def test_running_totals_follow_adds_replaces_and_deletes(
+        order_type: type) -> None:
+    generator = random.Random(2022)
+    order = order_type(1)
+    quotes: typing.List[Quote] = []
+    for _ in range(500):
+        action = generator.random()
+        if action < 0.5 or not quotes:
+            quote = make_random_quote(generator)
+            order.add_quote(quote)
+            quotes.append(quote)
+        elif action < 0.75:
+            index = generator.randrange(len(quotes))
+            quote = make_random_quote(generator)
+            order.replace_quote(index, quote)
+            quotes[index] = quote
+        else:
+            index = generator.randrange(len(quotes))
+            order.delete_quote(index)
+            del quotes[index]
+    check_totals(order, quotes)
+    assert order.calculate_total_price() == order.recalculate_total_price()
+    while quotes:
+        order.delete_quote(0)
+        del quotes[0]
+    check_totals(order, quotes)
+    assert len(order.get_paper_usage()) == 0
+
+
+@pytest.mark.parametrize("order_type", ORDER_TYPES)
+def test_usage_does_not_drift_when_a_shared_paper_changes(
+        order_type: type) -> None:
+    # papers are shared between quotes, so one can change after a quote
+    # using it was added; what the quote added is still what is removed.
+    order = order_type(1)
+    quotes = [make_quote(lengths=(length, "5", "5"))
+              for length in ("10", "20", "30")]
+    for quote in quotes:
+        order.add_quote(quote)
+    paper = quotes[0].wrapping_paper
+    assert all(quote.wrapping_paper is paper for quote in quotes)
+    price = paper.get_price()
+    try:
+        paper.set_price(price * 3)
+        order.delete_quote(0)
+        replacement = make_quote(paper="expensive")
+        order.replace_quote(0, replacement)
+    finally:
+        paper.set_price(price)
+    check_totals(order, [replacement, quotes[2]])
+
+
+def test_columnar_order_reads_back_what_was_added() -> None:
+    generator = random.Random(7)
+    quotes = [make_random_quote(generator) for _ in range(50)]
+    order = ColumnarOrder(1)
+    for quote in quotes:
+        order.add_quote(quote)
+    for quote, view in zip(quotes, order):
+        assert view.title == quote.title
+        assert str(view.present) == str(quote.present)
+        assert view.wrapping_paper.get_grade() == (
+            quote.wrapping_paper.get_grade())
+        assert view.wrapping_paper.get_colour() == (
+            quote.wrapping_paper.get_colour())
+        assert view.calculate_price() == quote.calculate_price()
+
+
+def test_columnar_order_recalculates_from_its_rows() -> None:
+    generator = random.Random(14)
+    quotes = [make_random_quote(generator) for _ in range(200)]
+    order = ColumnarOrder(1)
+    for quote in quotes:
+        order.add_quote(quote)
+    total = Money()
+    for quote in quotes:
+        total += quote.calculate_price()
+    # the stored prices are not what is summed.
+    prices = order.get_column("prices")
+    prices[:] = array.array(prices.format, [0] * len(prices))
+    prices.release()
+    assert order.recalculate_total_price() == total
+
+
+def test_columnar_order_rejects_papers_outside_the_catalogue() -> None:
+    order = ColumnarOrder(1)
+    quote = make_quote()
+    stranger = Quote(
+        quote_title="Stranger", present_type=quote.present,
+        wrapping_paper=WrappingPaper("gold", 0.5, grade="foil"),
+        gift_card=None, bow=None)
+    with pytest.raises(ValueError):
+        order.add_quote(stranger)
+    assert len(order) == 0
+    assert order.calculate_total_price() == Money()
+
+
+
+def test_usage_is_described_with_catalogue_labels(
+        catalogue_data: typing.Dict[str, typing.Any]) -> None:
+    catalogue_data["grades"][1]["label"] = "Luxury"
+    install_catalogue(catalogue_data)
+    order = Order(1)
+    order.add_quote(make_quote(paper="expensive", colour="VioletRed2"))
+    assert order.get_paper_usage().describe() == (
+        "Luxury Violet Red 2: 1656.00cm^2, £12.42 (1 quote(s))")
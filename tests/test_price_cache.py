@@ -0,0 +1,57 @@
+import random
+
+from conftest import make_quote, make_random_quote
+from wpqc import PriceCache, PriceCacheStatistics
+
+
+def test_quotes_for_the_same_box_share_an_entry() -> None:
+    cache = PriceCache()
+    quote = make_quote(title="One", colour="gold")
+    same = make_quote(title="Two", colour="purple")
+    assert PriceCache.get_key(quote) == PriceCache.get_key(same)
+    for different in (
+            make_quote(paper="expensive"), make_quote(bow=1),
+            make_quote(message="Hi"), make_quote(message="Hello"),
+            make_quote(lengths=("11", "20", "30")),
+            make_quote(shape="cuboid")):
+        assert PriceCache.get_key(different) != PriceCache.get_key(quote)
+    assert cache.get_price(quote) == quote.calculate_price()
+    assert cache.get_price_breakdown(same) is (
+        cache.get_price_breakdown(quote))
+    assert cache.get_statistics() == PriceCacheStatistics(
+        hits=2, misses=1, evictions=0, size=1,
+        max_size=PriceCache.DEFAULT_SIZE)
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    cache = PriceCache(2)
+    first, second, third = [
+        make_quote(lengths=(length, "5", "5")) for length in "123"]
+    cache.get_price(first)
+    cache.get_price(second)
+    # first is now the most recently used, so second goes.
+    cache.get_price(first)
+    cache.get_price(third)
+    assert cache.get_statistics() == PriceCacheStatistics(1, 3, 1, 2, 2)
+    cache.get_price(first)
+    cache.get_price(second)
+    assert cache.get_statistics() == PriceCacheStatistics(2, 4, 2, 2, 2)
+
+
+def test_resizing_evicts_and_zero_turns_the_cache_off() -> None:
+    generator = random.Random(21)
+    quotes = [make_random_quote(generator) for _ in range(100)]
+    cache = PriceCache(1000)
+    for quote in quotes:
+        assert cache.get_price(quote) == quote.calculate_price()
+    size = len(cache)
+    cache.set_max_size(10)
+    assert len(cache) == 10
+    assert cache.get_statistics().evictions == size - 10
+    cache.set_max_size(0)
+    assert len(cache) == 0
+    for quote in quotes:
+        assert cache.get_price(quote) == quote.calculate_price()
+    assert len(cache) == 0
+    cache.reset_statistics()
+    assert cache.get_statistics() == PriceCacheStatistics(0, 0, 0, 0, 0)
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from conftest import make_quote, make_random_quote
+from wpqc import Money, QuoteBatch
+
+np = pytest.importorskip("numpy")
+
+
+def test_batch_prices_match_quote_prices() -> None:
+    generator = random.Random(1)
+    quotes = [make_random_quote(generator) for _ in range(2000)]
+    batch = QuoteBatch.from_quotes(quotes)
+    prices = batch.calculate_prices()
+    assert len(batch) == len(quotes)
+    assert [int(price) for price in prices] == [
+        quote.calculate_price().get_pence() for quote in quotes]
+    total = Money()
+    for quote in quotes:
+        total += quote.calculate_price()
+    assert batch.calculate_total_price() == total
+
+
+def test_batch_areas_match_quote_areas() -> None:
+    generator = random.Random(2)
+    quotes = [make_random_quote(generator) for _ in range(500)]
+    areas = QuoteBatch.from_quotes(quotes).get_recommended_areas()
+    assert areas.tolist() == [
+        quote.present.get_recommended_area() for quote in quotes]
+
+
+def test_batch_prices_rounding_ties_like_quotes() -> None:
+    # dimensions whose areas land on (or next to) a rounding tie.
+    quotes = [
+        make_quote(shape=shape, lengths=(f"{length:.2f}", "1.5", "2.25"))
+        for shape in ("cube", "cylinder", "sphere")
+        for length in np.arange(0.05, 5, 0.05)]
+    prices = QuoteBatch.from_quotes(quotes).calculate_prices()
+    assert [int(price) for price in prices] == [
+        quote.calculate_price().get_pence() for quote in quotes]
+
+
+def test_batch_rejects_uneven_columns() -> None:
+    with pytest.raises(ValueError):
+        QuoteBatch(
+            shapes=[QuoteBatch.SHAPE_CUBE], length_one=[1, 2],
+            length_two=[1], length_three=[1], paper_rates=[0.4],
+            bows=[False], gift_cards=[False], message_lengths=[0])
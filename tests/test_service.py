@@ -0,0 +1,144 @@
+import asyncio
+import json
+import typing
+
+import pytest
+
+import wpqc_service
+from wpqc_service import dispatch
+
+ROW: typing.Dict[str, str] = {
+    "title": "Good", "shape": "cube", "length_one": "10", "paper": "cheap",
+    "colour": "gold", "bow": "1", "gift_card": "1", "message": "Hi"}
+
+Reply = typing.Tuple[int, typing.Dict[str, str], typing.Any]
+
+
+def post(path: str, payload: typing.Any, /) -> wpqc_service.Response:
+    return dispatch("POST", path, json.dumps(payload).encode("utf-8"))
+
+
+def test_price_one_quote() -> None:
+    assert post("/price", ROW) == (200, {
+        "title": "Good", "area": "1656.00", "paper_price": "6.62",
+        "price": "8.66"})
+    status, result = post("/price", dict(ROW, shape="cone"))
+    assert status == 422
+    assert "error" in result
+
+
+def test_price_a_batch() -> None:
+    status, result = post("/price/batch", [ROW, {"title": "Empty"}, ROW, 3])
+    assert status == 200
+    assert (result["priced"], result["rejected"]) == (2, 2)
+    assert result["total"] == "17.32"
+    assert [sorted(quote) for quote in result["quotes"][1:]] == [
+        ["error"], sorted(result["quotes"][0]), ["error"]]
+
+
+@pytest.mark.parametrize("method, path, body, status", [
+    ("GET", "/price", b"", 405),
+    ("POST", "/health", b"", 405),
+    ("GET", "/nowhere", b"", 404),
+    ("POST", "/price", b"{not json", 400),
+    ("POST", "/price/batch", b"{}", 400),
+])
+def test_bad_requests(method: str, path: str, body: bytes,
+                      status: int) -> None:
+    assert dispatch(method, path, body)[0] == status
+
+
+def test_oversized_batches_are_refused(
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(wpqc_service, "MAX_BATCH_SIZE", 2)
+    assert post("/price/batch", [ROW] * 3)[0] == 413
+
+
+def test_health_reports_the_price_cache() -> None:
+    status, result = dispatch("GET", "/health?verbose=1", b"")
+    assert status == 200
+    assert "hits" in result["price_cache"]
+
+
+def request(path: str, payload: typing.Any, /, *,
+            close: bool = False) -> bytes:
+    body = json.dumps(payload).encode("utf-8")
+    connection = b"Connection: close\r\n" if close else b""
+    return (f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+            .encode("latin-1") + connection + b"\r\n" + body)
+
+
+async def read_reply(reader: asyncio.StreamReader, /) -> Reply:
+    status = int((await reader.readline()).split()[1])
+    headers: typing.Dict[str, str] = {}
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.lower()] = value.strip()
+    body = await reader.readexactly(int(headers["content-length"]))
+    return status, headers, json.loads(body)
+
+
+async def talk(data: bytes, count: int, /) -> typing.List[Reply]:
+    # serve one connection, write every request at once and read back
+    # count replies and then the end of the connection.
+    server = await asyncio.start_server(
+        wpqc_service.handle_connection, "127.0.0.1", 0,
+        limit=wpqc_service.MAX_LINE_SIZE)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(data)
+        await writer.drain()
+        replies = [await read_reply(reader) for _ in range(count)]
+        assert await asyncio.wait_for(reader.read(), 5) == b""
+        writer.close()
+        return replies
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def test_pipelined_requests_are_answered_in_order() -> None:
+    replies = asyncio.run(talk(
+        request("/price", dict(ROW, title="One"))
+        + request("/price", {"title": "Two"})
+        + request("/price", dict(ROW, title="Three"), close=True), 3))
+    assert [status for status, _, _ in replies] == [200, 422, 200]
+    assert [headers["connection"] for _, headers, _ in replies] == [
+        "keep-alive", "keep-alive", "close"]
+    assert replies[2][2]["title"] == "Three"
+
+
+def test_dispatch_errors_keep_the_connection(
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    errors = [RuntimeError("boom"), ValueError("Bad value.")]
+
+    def price_quote(row: typing.Any, /) -> wpqc_service.Response:
+        if errors:
+            raise errors.pop(0)
+        return 200, {"title": row["title"]}
+
+    monkeypatch.setattr(wpqc_service, "price_quote", price_quote)
+    replies = asyncio.run(talk(
+        request("/price", ROW) * 2 + request("/price", ROW, close=True), 3))
+    assert [(status, payload) for status, _, payload in replies] == [
+        (500, {"error": "Internal error."}),
+        (422, {"error": "Bad value."}),
+        (200, {"title": "Good"})]
+
+
+@pytest.mark.parametrize("data", [
+    b"POST /price HTTP/1.1\r\nContent-Le",
+    b"POST /price HTTP/1.1\r\nContent-Length: 10\r\n\r\nabc",
+])
+def test_stalled_requests_are_timed_out(
+        monkeypatch: pytest.MonkeyPatch, data: bytes) -> None:
+    monkeypatch.setattr(wpqc_service, "REQUEST_TIMEOUT", 0.2)
+    assert asyncio.run(talk(data, 0)) == []
+
+
+def test_chunked_bodies_are_refused() -> None:
+    replies = asyncio.run(talk(
+        b"POST /price HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n", 1))
+    assert replies[0][0] == 501
+    assert replies[0][1]["connection"] == "close"
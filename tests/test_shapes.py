@@ -0,0 +1,71 @@
+import pytest
+
+from wpqc import (
+    Cube, Cylinder, PresentType, QuoteBatch, ShapeRegistry, ShapeType,
+    Translator)
+
+
+def test_every_shape_is_found_by_code_name_and_type() -> None:
+    shape_types = ShapeRegistry.get_shape_types()
+    assert [shape_type.name for shape_type in shape_types] == [
+        Translator.CUBE, Translator.CUBOID, Translator.CYLINDER,
+        Translator.SPHERE, Translator.TRIANGULAR_PRISM]
+    assert [shape_type.code for shape_type in shape_types] == [
+        QuoteBatch.SHAPE_CUBE, QuoteBatch.SHAPE_CUBOID,
+        QuoteBatch.SHAPE_CYLINDER, QuoteBatch.SHAPE_SPHERE,
+        QuoteBatch.SHAPE_TRIANGULAR_PRISM]
+    for shape_type in shape_types:
+        assert ShapeRegistry.find_by_code(shape_type.code) is shape_type
+        assert ShapeRegistry.find_by_name(shape_type.name) is shape_type
+        present = shape_type.present_type.from_dimensions(2, 3, 4)
+        assert ShapeRegistry.find_for(present) is shape_type
+        name, *dimensions = Translator.describe_present_type(present)
+        assert name == shape_type.name
+        again = Translator.translate_present_type(
+            shape=name, length_one=str(dimensions[0]),
+            length_two=str(dimensions[1]), length_three=str(dimensions[2]))
+        assert type(again) is shape_type.present_type
+        assert again.get_dimensions() == present.get_dimensions()
+
+
+def test_unknown_shapes_are_not_found() -> None:
+    assert ShapeRegistry.find_by_code(0) is None
+    assert ShapeRegistry.find_by_name("cone") is None
+    assert ShapeRegistry.find_for(None) is None
+    assert Translator.translate_present_type(
+        shape="cone", length_one="1", length_two="1",
+        length_three="1") is None
+    assert Translator.describe_present_type(None) == (
+        Translator.NONE, 0, 0, 0)
+
+
+def test_subclasses_are_their_registered_shape() -> None:
+
+    class Dice(Cube):
+        __slots__ = ()
+
+    dice = Dice(length=2)
+    assert ShapeRegistry.find_for(dice) is ShapeRegistry.find_by_name(
+        Translator.CUBE)
+    assert Translator.describe_present_type(dice) == (
+        Translator.CUBE, 2, 0, 0)
+
+
+@pytest.mark.parametrize("code, name, present_type, dimensions", [
+    (0, "cone", PresentType, ("Radius (cm)",)),
+    (128, "cone", PresentType, ("Radius (cm)",)),
+    (QuoteBatch.SHAPE_CUBE, "cone", PresentType, ("Radius (cm)",)),
+    (99, Translator.CUBE, PresentType, ("Radius (cm)",)),
+    (99, "cone", Cylinder, ("Radius (cm)",)),
+    (99, "cone", PresentType, ()),
+    (99, "cone", PresentType, ("One", "Two", "Three", "Four")),
+])
+def test_clashing_or_invalid_shapes_are_not_registered(
+        code: int, name: str, present_type: type,
+        dimensions: tuple) -> None:
+    count = len(ShapeRegistry.get_shape_types())
+    with pytest.raises(ValueError):
+        ShapeRegistry.register(ShapeType(
+            code, name, "Cone", present_type, dimensions, ()))
+    assert len(ShapeRegistry.get_shape_types()) == count
+    assert ShapeRegistry.find_by_code(99) is None
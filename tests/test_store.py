@@ -0,0 +1,199 @@
+import datetime
+import io
+import os
+import random
+import re
+import sqlite3
+import typing
+
+import pytest
+
+import wpqc_store
+from conftest import install_catalogue, make_quote, make_random_quote
+from wpqc import ColumnarOrder, Money, Order, PaperUsage
+from wpqc_store import OrderStore
+
+
+@pytest.fixture
+def store(tmp_path: "os.PathLike[str]") -> typing.Iterator[OrderStore]:
+    with OrderStore(os.path.join(tmp_path, "wpqc.sqlite3")) as store:
+        yield store
+
+
+def make_order(order_number: int, count: int, /, *,
+               seed: int = 0) -> Order:
+    generator = random.Random(seed)
+    order = Order(order_number)
+    for _ in range(count):
+        order.add_quote(make_random_quote(generator))
+    return order
+
+
+def describe(order: Order, /) -> typing.List[typing.Tuple[str, ...]]:
+    return [
+        (quote.title, str(quote.present), quote.wrapping_paper.get_grade(),
+         quote.wrapping_paper.get_colour(), str(quote.bow),
+         str(quote.gift_card))
+        for quote in order]
+
+
+def test_round_trip(store: OrderStore) -> None:
+    order = make_order(3, 300)
+    assert store.save_order(order) == 0
+    loaded = store.load_order(3)
+    assert isinstance(loaded, ColumnarOrder)
+    assert loaded.get_order_number() == 3
+    assert describe(loaded) == describe(order)
+    assert loaded.calculate_total_price() == order.calculate_total_price()
+    assert list(loaded.get_paper_usage()) == list(order.get_paper_usage())
+    assert store.get_last_order_number() == 3
+    assert store.load_order(4) is None
+
+
+def test_loaded_orders_keep_their_prices(
+        store: OrderStore,
+        catalogue_data: typing.Dict[str, typing.Any]) -> None:
+    order = make_order(1, 100)
+    store.save_order(order)
+    for grade in catalogue_data["grades"]:
+        grade["price_cm_sq"] *= 2
+    install_catalogue(catalogue_data)
+    loaded = store.load_order(1)
+    assert loaded.calculate_total_price() == order.calculate_total_price()
+    assert [quote.calculate_price() for quote in loaded] == [
+        order.get_quote_price(index) for index in range(len(order))]
+    repriced = store.load_order(1, reprice=True)
+    assert repriced.calculate_total_price() > order.calculate_total_price()
+
+
+def test_receipts_of_loaded_orders_add_up(
+        store: OrderStore,
+        catalogue_data: typing.Dict[str, typing.Any]) -> None:
+    order = make_order(1, 200)
+    store.save_order(order)
+    catalogue_data["grades"][1]["price_cm_sq"] *= 1.37
+    install_catalogue(catalogue_data)
+    handler = io.StringIO()
+    store.load_order(1).snapshot().write_receipt(handler)
+    receipt = handler.getvalue()
+    # each quote's lines add up to its total, and the totals to the footer.
+    quotes = re.findall(r"\(Total: GBP (\S+)\)\n((?:\t\t.*\n)+)", receipt)
+    assert len(quotes) == len(order)
+    for index, (total, lines) in enumerate(quotes):
+        assert Money.from_pounds(total) == order.get_quote_price(index)
+        assert sum(
+            (Money.from_pounds(amount)
+             for amount in re.findall(r"\(GBP (\S+)\)", lines)),
+            Money()) == Money.from_pounds(total)
+    footer = re.search(r"order: GBP (\S+)", receipt).group(1)
+    assert Money.from_pounds(footer) == order.calculate_total_price()
+
+
+def test_edited_loaded_order_saves_consistently(
+        store: OrderStore,
+        catalogue_data: typing.Dict[str, typing.Any]) -> None:
+    store.save_order(make_order(1, 50))
+    catalogue_data["grades"][0]["price_cm_sq"] *= 3
+    install_catalogue(catalogue_data)
+    loaded = store.load_order(1)
+    loaded.delete_quote(10)
+    loaded.replace_quote(0, make_quote())
+    total = loaded.calculate_total_price()
+    assert store.save_order(loaded) == 0
+    reloaded = store.load_order(1)
+    assert reloaded.calculate_total_price() == total
+    assert list(store.get_paper_usage(order_number=1)) == list(
+        loaded.get_paper_usage())
+    assert list(reloaded.get_paper_usage()) == list(loaded.get_paper_usage())
+
+
+def test_usage_totals(store: OrderStore) -> None:
+    orders = [make_order(number, 40, seed=number) for number in (1, 2, 3)]
+    for order in orders:
+        store.save_order(order)
+    store.delete_order(2)
+    expected = PaperUsage()
+    for order in (orders[0], orders[2]):
+        expected.merge(order.get_paper_usage())
+    today = datetime.date.today().isoformat()
+    assert list(store.get_paper_usage()) == list(expected)
+    assert list(store.get_paper_usage(date=today)) == list(expected)
+    assert list(store.get_paper_usage(order_number=3)) == list(
+        orders[2].get_paper_usage())
+    assert store.load_order(2) is None
+
+
+def test_saving_again_replaces_the_order(store: OrderStore) -> None:
+    order = make_order(1, 20)
+    store.save_order(order)
+    order.delete_quote(0)
+    order.add_quote(make_quote(title="Added"))
+    store.save_order(order)
+    assert store.count_quotes() == 20
+    assert describe(store.load_order(1)) == describe(order)
+    assert list(store.get_paper_usage()) == list(order.get_paper_usage())
+
+
+def test_older_stores_are_upgraded(tmp_path: "os.PathLike[str]") -> None:
+    # a version 1 store: no paper usage columns on the quotes.
+    path = os.path.join(tmp_path, "old.sqlite3")
+    order = make_order(1, 30)
+    with OrderStore(path) as store:
+        store.save_order(order)
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("ALTER TABLE quotes DROP COLUMN area_units")
+        connection.execute("ALTER TABLE quotes DROP COLUMN paper_pence")
+        connection.execute("PRAGMA user_version = 1")
+    connection.close()
+    with OrderStore(path) as store:
+        loaded = store.load_order(1)
+        assert loaded.calculate_total_price() == (
+            order.calculate_total_price())
+        assert list(loaded.get_paper_usage()) == list(
+            order.get_paper_usage())
+        assert store._connection.execute(
+            "PRAGMA user_version").fetchone()[0] == (
+            wpqc_store.SCHEMA_VERSION)
+
+
+def test_upgrades_skip_quotes_no_longer_on_offer(
+        tmp_path: "os.PathLike[str]",
+        catalogue_data: typing.Dict[str, typing.Any]) -> None:
+    path = os.path.join(tmp_path, "old.sqlite3")
+    catalogue_data["grades"].append(
+        {"name": "foil", "label": "Foil", "price_cm_sq": 1.5})
+    install_catalogue(catalogue_data)
+    order = make_order(1, 10)
+    order.add_quote(make_quote(title="Foil", paper="foil"))
+    order.add_quote(make_quote(title="Gone", paper="foil", colour="purple"))
+    with OrderStore(path) as store:
+        store.save_order(order)
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("ALTER TABLE quotes DROP COLUMN area_units")
+        connection.execute("ALTER TABLE quotes DROP COLUMN paper_pence")
+        connection.execute("DELETE FROM order_usage")
+        connection.execute("DELETE FROM daily_usage")
+        connection.execute("PRAGMA user_version = 0")
+    connection.close()
+    del catalogue_data["grades"][-1]
+    install_catalogue(catalogue_data)
+    with OrderStore(path) as store:
+        assert store.get_skipped_count() == 2
+        usage = store.get_paper_usage(order_number=1)
+        assert usage.get_total().quotes == 10
+        assert [paper for paper, _, _ in usage] == sorted(
+            paper for paper, _, _ in order.get_paper_usage()
+            if paper != "foil")
+        with pytest.raises(ValueError, match="foil"):
+            store.load_order(1, reprice=True)
+    with OrderStore(path) as store:
+        assert store.get_skipped_count() == 0
+
+
+def test_empty_order_round_trip(store: OrderStore) -> None:
+    store.save_order(Order(5))
+    loaded = store.load_order(5)
+    assert len(loaded) == 0
+    assert loaded.calculate_total_price() == Money()
@@ -4,7 +4,10 @@ Author: Harsh Jayprakash <harshjayprakash@outlook.com>
 Date: (Original) May 2022
 License: MIT
 
-Requires Python 3.8 or newer.
+Requires Python 3.8 or newer. NumPy is optional and only required for
+batch pricing (QuoteBatch). Tkinter is only required by the user
+interface, which lives in wpqc_gui.py and is imported on demand, so the
+pricing model can be imported on hosts without Tk.
 
 A proof of concept calculator application for a department who provide
 gift wrapping services based on present shapes. This application was
@@ -14,16 +17,58 @@ Changelog:
     v1.0.14 (23-05-2022): Orginal submitted version.
     v1.0.15 (05-01-2026): Added docstrings.
                           Updated application name.
+    v1.1.0 (17-10-2026):  Added QuoteBatch for array based batch pricing.
+                          Added a headless mode for pricing quote files.
+                          Moved the user interface to wpqc_gui.py.
+                          Added Money, prices are now whole pence.
+                          Cached the recommended area of each present.
+                          Orders keep a running total of their quotes.
+                          Virtualised the quote list in the Quote Manager.
+                          Coalesced live price updates in the Quote Editor.
+                          Reused the preview canvas items.
+                          Streamed receipts through precompiled templates.
+                          Added the SQLite order store (wpqc_store.py).
+                          Added the order journal (wpqc_journal.py) to
+                          recover unfinished orders.
+                          Slotted the model classes and shared papers
+                          and bows between quotes.
+                          Added ColumnarOrder, an order held as arrays.
+                          Added multi-process headless pricing.
+                          Added the HTTP/JSON pricing service
+                          (wpqc_service.py).
+                          Added opt-in instrumentation (wpqc_metrics.py).
+                          Added roll cutting plans (wpqc_cutting.py).
+                          Added running paper usage totals to orders and
+                          the order store.
+                          Added a least recently used price cache.
+                          Paper grades and colours are read from a
+                          catalogue file (wpqc_catalogue.json).
+                          Added a shape registry, with sphere and
+                          triangular prism shapes.
+                          Added a background quote import to the Quote
+                          Manager (wpqc_import.py).
+                          Receipts are exported on a background thread
+                          from a snapshot of the order.
 """
+import array
+import contextlib
+import csv
 import decimal
 import datetime
+import io
+import itertools
+import json
 import math
 import os
-import tkinter as tk
-import tkinter.ttk as ttk
-import tkinter.messagebox as tkmsg
+import sys
+import time
 import typing
 
+import wpqc_metrics
+
+# optional, imported on first use by QuoteBatch (see _import_numpy).
+np = None
+
 # the application metadata.
 
 APPLICATION_NAME: str = "Wrapping Paper Quotes"
@@ -33,6 +78,14 @@ APPLICATION_VERSION: str = "1.0.14b-sc2"
 
 
 def round_number(amount: float, /) -> float:
+    # away from a rounding tie the nearest hundredth is unambiguous, so only
+    # close calls (and non finite amounts) pay for an exact Decimal.
+    scaled = amount * 100
+    magnitude = abs(scaled)
+    if magnitude < 1e15:
+        fraction = magnitude - math.floor(magnitude)
+        if abs(fraction - 0.5) >= max(1e-6, magnitude * 1e-12):
+            return math.copysign(math.floor(magnitude + 0.5), scaled) / 100
     try:
         result = float(decimal.Decimal(amount).quantize(
             decimal.Decimal(".01"), rounding=decimal.ROUND_HALF_UP))
@@ -50,21 +103,186 @@ def get_current_time_date() -> str:
     return current_time_date.strftime("%Y-%m-%d %H%M")
 
 
+def divide_half_up(numerator: int, denominator: int, /) -> int:
+    # integer division rounding halves away from zero (ROUND_HALF_UP).
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if 2 * remainder >= denominator:
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
+
+
+class Money:
+    # value class, a fixed point amount held as a whole number of pence.
+
+    __slots__ = ("_pence",)
+
+    def __init__(self, pence: int = 0, /) -> None:
+        self._pence: int = int(pence)
+
+    @staticmethod
+    def from_pounds(amount: typing.Union[float, str], /) -> "Money":
+        # rounded once, to the nearest penny (ROUND_HALF_UP).
+        try:
+            pence = decimal.Decimal(str(amount)).scaleb(2).quantize(
+                decimal.Decimal(1), rounding=decimal.ROUND_HALF_UP)
+        except decimal.InvalidOperation:
+            return Money(-100)
+        return Money(int(pence))
+
+    @staticmethod
+    def of(amount: typing.Union["Money", float, str], /) -> "Money":
+        if isinstance(amount, Money):
+            return amount
+        return Money.from_pounds(amount)
+
+    def get_pence(self) -> int:
+        return self._pence
+
+    def to_pounds(self) -> decimal.Decimal:
+        return decimal.Decimal(self._pence).scaleb(-2)
+
+    def __repr__(self) -> str:
+        return f"Money({self._pence})"
+
+    def __str__(self) -> str:
+        # pounds to two decimal places, without building a Decimal.
+        if self._pence < 0:
+            return f"-{-self._pence // 100}.{-self._pence % 100:02d}"
+        return f"{self._pence // 100}.{self._pence % 100:02d}"
+
+    def __format__(self, format_spec: str, /) -> str:
+        if format_spec in ("", ".2f"):
+            return self.__str__()
+        return format(self.to_pounds(), format_spec)
+
+    def __float__(self) -> float:
+        return self._pence / 100
+
+    def __int__(self) -> int:
+        return self._pence
+
+    def __bool__(self) -> bool:
+        return self._pence != 0
+
+    def __hash__(self) -> int:
+        return hash(self._pence)
+
+    def __eq__(self, other: typing.Any, /) -> bool:
+        if isinstance(other, Money):
+            return self._pence == other._pence
+        return NotImplemented
+
+    def __lt__(self, other: "Money", /) -> bool:
+        if isinstance(other, Money):
+            return self._pence < other._pence
+        return NotImplemented
+
+    def __le__(self, other: "Money", /) -> bool:
+        if isinstance(other, Money):
+            return self._pence <= other._pence
+        return NotImplemented
+
+    def __gt__(self, other: "Money", /) -> bool:
+        if isinstance(other, Money):
+            return self._pence > other._pence
+        return NotImplemented
+
+    def __ge__(self, other: "Money", /) -> bool:
+        if isinstance(other, Money):
+            return self._pence >= other._pence
+        return NotImplemented
+
+    def __add__(self, other: "Money", /) -> "Money":
+        if isinstance(other, Money):
+            return Money(self._pence + other._pence)
+        return NotImplemented
+
+    def __radd__(self, other: typing.Any, /) -> "Money":
+        # allows sum() over money, which starts from the integer zero.
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other: "Money", /) -> "Money":
+        if isinstance(other, Money):
+            return Money(self._pence - other._pence)
+        return NotImplemented
+
+    def __neg__(self) -> "Money":
+        return Money(-self._pence)
+
+    def __mul__(self, count: int, /) -> "Money":
+        if isinstance(count, int):
+            return Money(self._pence * count)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+
 class PresentType:
     # abstract class
 
+    __slots__ = ("_area",)
+
+    # shared by every shape, see get_area_cache_hit_rate. they are updated
+    # without a lock, so they are approximate while presents are priced on
+    # other threads too (exports, imports, the service); a lock would
+    # double the cost of a cache hit for the sake of a diagnostic.
+    area_cache_hits: int = 0
+    area_cache_misses: int = 0
+
     def __init__(self) -> None:
-        return
+        # the recommended area, cleared whenever a dimension changes.
+        self._area: float = None
+
+    @staticmethod
+    def get_area_cache_hit_rate() -> float:
+        lookups = PresentType.area_cache_hits + PresentType.area_cache_misses
+        if lookups == 0:
+            return 0
+        return PresentType.area_cache_hits / lookups
+
+    @staticmethod
+    def reset_area_cache_statistics() -> None:
+        PresentType.area_cache_hits = 0
+        PresentType.area_cache_misses = 0
+
+    def get_recommended_area(self) -> float:
+        # cached, every setter which changes a dimension clears _area.
+        if self._area is not None:
+            PresentType.area_cache_hits += 1
+            return self._area
+        PresentType.area_cache_misses += 1
+        height, width = self.get_wrap_dimensions()
+        if height <= 0 or width <= 0:
+            self._area = 0
+        else:
+            self._area = round_number((height + 6) * (width + 6))
+        return self._area
+
+    # virtual/overridable method
+    def get_dimensions(self) -> typing.Tuple[float, float, float]:
+        # the dimension fields (length_one, length_two and length_three) of
+        # the present, 0 for the fields its shape doesn't use.
+        return 0, 0, 0
 
     # virtual/overridable method
-    def get_recommended_area(self, *, height: float, width: float) -> float:
+    def get_wrap_dimensions(self) -> typing.Tuple[float, float]:
+        # the height and width of paper around the present, no margin.
+        return 0, 0
+
+    def get_sheet_dimensions(self) -> typing.Tuple[float, float]:
+        # the sheet the recommended area is cut to, margins included.
+        height, width = self.get_wrap_dimensions()
         if height <= 0 or width <= 0:
-            return 0
-        return round_number((height + 6) * (width + 6))
+            return 0, 0
+        return height + 6, width + 6
 
 
 class Cube(PresentType):
 
+    __slots__ = ("_length",)
+
     def __init__(self, *, length: float) -> None:
         super().__init__()
         self._length = length
@@ -79,15 +297,29 @@ class Cube(PresentType):
 
     def set_length(self, length: float, /) -> None:
         self._length = length
+        self._area = None
 
-    def get_recommended_area(self) -> float:
-        return super().get_recommended_area(
-            height=(3 * self.get_length()),
-            width=(4 * self.get_length()))
+    @staticmethod
+    def from_dimensions(one: float, two: float, three: float, /) -> "Cube":
+        return Cube(length=one)
+
+    def get_dimensions(self) -> typing.Tuple[float, float, float]:
+        return self.get_length(), 0, 0
+
+    @staticmethod
+    def wrap_dimensions(one: float, two: float, three: float, /
+                        ) -> typing.Tuple[float, float]:
+        # also given numpy arrays of dimensions, see QuoteBatch.
+        return 3 * one, 4 * one
+
+    def get_wrap_dimensions(self) -> typing.Tuple[float, float]:
+        return Cube.wrap_dimensions(*self.get_dimensions())
 
 
 class Cuboid(PresentType):
 
+    __slots__ = ("_height", "_width", "_depth")
+
     def __init__(self, *, height: float, width: float, depth: float) -> None:
         super().__init__()
         self._height = height
@@ -106,27 +338,44 @@ class Cuboid(PresentType):
 
     def set_height(self, height: float, /) -> None:
         self._height = height
+        self._area = None
 
     def get_width(self) -> float:
         return self._width
 
     def set_width(self, width: float, /) -> None:
         self._width = width
+        self._area = None
 
     def get_depth(self) -> float:
         return self._depth
 
     def set_depth(self, depth: float, /) -> None:
         self._depth = depth
+        self._area = None
 
-    def get_recommended_area(self) -> float:
-        return super().get_recommended_area(
-            height=((2 * self.get_height()) + (2 * self.get_width())),
-            width=((2 * self.get_height()) + self.get_depth()))
+    @staticmethod
+    def from_dimensions(one: float, two: float, three: float, /
+                        ) -> "Cuboid":
+        return Cuboid(width=one, height=two, depth=three)
+
+    def get_dimensions(self) -> typing.Tuple[float, float, float]:
+        return self.get_width(), self.get_height(), self.get_depth()
+
+    @staticmethod
+    def wrap_dimensions(one: float, two: float, three: float, /
+                        ) -> typing.Tuple[float, float]:
+        # width, height and depth.
+        return (2 * two) + (2 * one), (2 * two) + three
+
+    def get_wrap_dimensions(self) -> typing.Tuple[float, float]:
+        return Cuboid.wrap_dimensions(*self.get_dimensions())
 
 
 class Cylinder(PresentType):
 
+    __slots__ = ("_radius", "_depth")
+
     def __init__(self, *, radius: float, depth: float) -> None:
         super().__init__()
         self._radius = radius
@@ -143,22 +392,314 @@ class Cylinder(PresentType):
 
     def set_radius(self, radius: float, /) -> None:
         self._radius = radius
+        self._area = None
 
     def get_depth(self) -> float:
         return self._depth
 
     def set_depth(self, depth: float, /) -> None:
         self._depth = depth
+        self._area = None
+
+    @staticmethod
+    def from_dimensions(one: float, two: float, three: float, /
+                        ) -> "Cylinder":
+        return Cylinder(radius=one, depth=two)
+
+    def get_dimensions(self) -> typing.Tuple[float, float, float]:
+        return self.get_radius(), self.get_depth(), 0
+
+    @staticmethod
+    def wrap_dimensions(one: float, two: float, three: float, /
+                        ) -> typing.Tuple[float, float]:
+        # radius and depth.
+        return (4 * one) + two, math.pi * (one * 2)
+
+    def get_wrap_dimensions(self) -> typing.Tuple[float, float]:
+        return Cylinder.wrap_dimensions(*self.get_dimensions())
+
+
+class Sphere(PresentType):
+
+    __slots__ = ("_radius",)
+
+    def __init__(self, *, radius: float) -> None:
+        super().__init__()
+        self._radius = radius
+
+    def __str__(self) -> str:
+        return (
+            f"Sphere [r = {self.get_radius()}cm] "
+            + f"[area = {self.get_recommended_area()}cm^2]")
+
+    def get_radius(self) -> float:
+        return self._radius
+
+    def set_radius(self, radius: float, /) -> None:
+        self._radius = radius
+        self._area = None
+
+    @staticmethod
+    def from_dimensions(one: float, two: float, three: float, /
+                        ) -> "Sphere":
+        return Sphere(radius=one)
+
+    def get_dimensions(self) -> typing.Tuple[float, float, float]:
+        return self.get_radius(), 0, 0
+
+    @staticmethod
+    def wrap_dimensions(one: float, two: float, three: float, /
+                        ) -> typing.Tuple[float, float]:
+        # a square sheet gathered at the top, its edges reaching half way
+        # round the sphere from the centre of the sheet.
+        return math.pi * (one * 2), math.pi * (one * 2)
+
+    def get_wrap_dimensions(self) -> typing.Tuple[float, float]:
+        return Sphere.wrap_dimensions(*self.get_dimensions())
+
+
+class TriangularPrism(PresentType):
+    # a prism with equilateral triangle ends.
+
+    __slots__ = ("_side", "_length")
+
+    def __init__(self, *, side: float, length: float) -> None:
+        super().__init__()
+        self._side = side
+        self._length = length
+
+    def __str__(self) -> str:
+        return (
+            f"Triangular Prism [s = {self.get_side()}cm, "
+            + f"l = {self.get_length()}cm] "
+            + f"[area = {self.get_recommended_area()}cm^2]")
+
+    def get_side(self) -> float:
+        return self._side
+
+    def set_side(self, side: float, /) -> None:
+        self._side = side
+        self._area = None
+
+    def get_length(self) -> float:
+        return self._length
+
+    def set_length(self, length: float, /) -> None:
+        self._length = length
+        self._area = None
+
+    @staticmethod
+    def from_dimensions(one: float, two: float, three: float, /
+                        ) -> "TriangularPrism":
+        return TriangularPrism(side=one, length=two)
+
+    def get_dimensions(self) -> typing.Tuple[float, float, float]:
+        return self.get_side(), self.get_length(), 0
+
+    @staticmethod
+    def wrap_dimensions(one: float, two: float, three: float, /
+                        ) -> typing.Tuple[float, float]:
+        # side and length. the paper goes round the three sides, with a
+        # flap the height of the triangle folded over each end.
+        return 3 * one, two + (math.sqrt(3) * one)
+
+    def get_wrap_dimensions(self) -> typing.Tuple[float, float]:
+        return TriangularPrism.wrap_dimensions(*self.get_dimensions())
+
+
+# preview canvas items, (kind, coordinates) on a 100 x 100 canvas.
+PreviewItem = typing.Tuple[str, typing.Tuple[int, ...]]
+
+
+class ShapeType(typing.NamedTuple):
+    # a shape registered with ShapeRegistry.
+    code: int
+    # as in quote files, the order store and the journal.
+    name: str
+    label: str
+    present_type: typing.Type[PresentType]
+    # labels of the dimension fields (length_one, length_two and
+    # length_three) the shape uses, each must be above 0.
+    dimensions: typing.Tuple[str, ...]
+    # outlines ("rectangle", "oval" or "polygon") and lines drawn in black
+    # for the Quote Editor preview.
+    preview: typing.Tuple[PreviewItem, ...]
+
+
+class ShapeRegistry:
+    # static class, the shapes on offer indexed by code (QuoteBatch and
+    # ColumnarOrder), name and PresentType subclass, so dispatch is a dict
+    # lookup. see the registrations after Translator.
+
+    _by_code: typing.Dict[int, ShapeType] = {}
+    _by_name: typing.Dict[str, ShapeType] = {}
+    _by_type: typing.Dict[type, ShapeType] = {}
+
+    @staticmethod
+    def register(shape_type: ShapeType, /) -> None:
+        if (shape_type.code <= 0 or shape_type.code > 127
+                or shape_type.code in ShapeRegistry._by_code
+                or shape_type.name in ShapeRegistry._by_name
+                or shape_type.present_type in ShapeRegistry._by_type
+                or not 0 < len(shape_type.dimensions) <= 3):
+            raise ValueError(f"Cannot register shape {shape_type.name!r}.")
+        ShapeRegistry._by_code[shape_type.code] = shape_type
+        ShapeRegistry._by_name[shape_type.name] = shape_type
+        ShapeRegistry._by_type[shape_type.present_type] = shape_type
+
+    @staticmethod
+    def get_shape_types() -> typing.Tuple[ShapeType, ...]:
+        # in the order they were registered.
+        return tuple(ShapeRegistry._by_code.values())
+
+    @staticmethod
+    def find_by_code(code: int, /) -> ShapeType:
+        return ShapeRegistry._by_code.get(code)
+
+    @staticmethod
+    def find_by_name(name: str, /) -> ShapeType:
+        return ShapeRegistry._by_name.get(name)
+
+    @staticmethod
+    def find_for(present: PresentType, /) -> ShapeType:
+        # subclasses of a registered shape are that shape.
+        if (shape_type := ShapeRegistry._by_type.get(type(present))):
+            return shape_type
+        for base in type(present).__mro__[1:]:
+            if (shape_type := ShapeRegistry._by_type.get(base)):
+                return shape_type
+        return None
+
+
+class PaperGrade(typing.NamedTuple):
+    name: str
+    label: str
+    price_cm_sq: float
+    # the preview drawn in the Quote Editor, see Catalogue.PATTERNS.
+    pattern: str
+
+
+class Catalogue:
+    # the paper grades and colours on offer, read from a JSON data file
+    # (see DEFAULT_CATALOGUE and get_catalogue). colours are indexed both
+    # ways, name to label and label to name, so every lookup is a single
+    # hash lookup however many colours are stocked. colour names are Tk
+    # colour names, as they are also used to draw the preview.
+
+    __slots__ = ("_grades", "_colour_labels", "_colour_names")
+
+    PATTERNS: typing.Tuple[str, ...] = ("cheap", "expensive")
+
+    def __init__(self, grades: typing.Iterable[PaperGrade],
+                 colours: typing.Iterable[typing.Tuple[str, str]], /
+                 ) -> None:
+        # grades and colours (name, label) keep the order they are given.
+        self._grades: typing.Dict[str, PaperGrade] = {
+            grade.name: grade for grade in grades}
+        self._colour_labels: typing.Dict[str, str] = {}
+        self._colour_names: typing.Dict[str, str] = {}
+        for name, label in colours:
+            self._colour_labels[name] = label
+            self._colour_names[label] = name
+
+    @staticmethod
+    def from_json(text: str, /) -> "Catalogue":
+        # raises ValueError, naming the entry, if the catalogue is invalid.
+        data = json.loads(text)
+        grades: typing.List[PaperGrade] = []
+        colours: typing.List[typing.Tuple[str, str]] = []
+        try:
+            for entry in data["grades"]:
+                grade = PaperGrade(
+                    str(entry["name"]), str(entry["label"]),
+                    float(entry["price_cm_sq"]),
+                    str(entry.get("pattern", Catalogue.PATTERNS[0])))
+                if (not grade.name or not math.isfinite(grade.price_cm_sq)
+                        or grade.price_cm_sq < 0
+                        or grade.pattern not in Catalogue.PATTERNS):
+                    raise ValueError(f"Invalid paper grade: {entry}")
+                grades.append(grade)
+            for entry in data["colours"]:
+                colour = (str(entry["name"]), str(entry["label"]))
+                if not all(colour):
+                    raise ValueError(f"Invalid colour: {entry}")
+                colours.append(colour)
+        except (KeyError, TypeError, AttributeError) as error:
+            raise ValueError(f"Malformed catalogue ({error!r}).") from None
+        catalogue = Catalogue(grades, colours)
+        if (len(catalogue._grades) != len(grades)
+                or len(catalogue._colour_labels) != len(colours)
+                or len(catalogue._colour_names) != len(colours)):
+            raise ValueError(
+                "Grade names, colour names and colour labels must be "
+                + "unique.")
+        return catalogue
+
+    @staticmethod
+    def load(path: str, /) -> "Catalogue":
+        # raises OSError or ValueError.
+        with open(path, "r", encoding="utf-8") as handler:
+            return Catalogue.from_json(handler.read())
+
+    def get_grade(self, name: str, /) -> PaperGrade:
+        return self._grades.get(name)
+
+    def get_grades(self) -> typing.Tuple[PaperGrade, ...]:
+        return tuple(self._grades.values())
+
+    def has_colour(self, name: str, /) -> bool:
+        return name in self._colour_labels
+
+    def get_colour_label(self, name: str, /) -> str:
+        return self._colour_labels.get(name)
+
+    def get_colour_name(self, label: str, /) -> str:
+        return self._colour_names.get(label)
+
+    def get_colour_names(self) -> typing.Tuple[str, ...]:
+        return tuple(self._colour_labels)
+
+    def get_colour_labels(self) -> typing.Tuple[str, ...]:
+        return tuple(self._colour_names)
+
+    def describe_grade(self, name: str, /) -> str:
+        # the label, or the name capitalised for grades not in the
+        # catalogue.
+        grade = self._grades.get(name)
+        return grade.label if grade else name.capitalize()
+
+    def describe_colour(self, name: str, /) -> str:
+        # the label, or the name itself for colours not in the catalogue.
+        return self._colour_labels.get(name, name)
+
+
+DEFAULT_CATALOGUE: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "wpqc_catalogue.json")
+
+_catalogue: Catalogue = None
+
+
+def get_catalogue() -> Catalogue:
+    # DEFAULT_CATALOGUE is loaded on first use, unless set_catalogue was
+    # called first (e.g. by the --catalogue option).
+    if _catalogue is None:
+        set_catalogue(Catalogue.load(DEFAULT_CATALOGUE))
+    return _catalogue
 
-    def get_recommended_area(self) -> float:
-        return super().get_recommended_area(
-            height=((4 * self.get_radius()) + self.get_depth()),
-            width=(math.pi * (self.get_radius() * 2)))
+
+def set_catalogue(catalogue: Catalogue, /) -> None:
+    # papers and prices built from the previous catalogue are dropped.
+    global _catalogue
+    _catalogue = catalogue
+    Translator._shared_papers.clear()
+    _price_cache.clear()
 
 
 class WrappingPaper:
-    # abstract class
 
+    __slots__ = ("_grade", "_colour", "_price_per_cm_sq", "_rate")
+
+    # colours of the catalogue shipped with the application.
     PRESET_PURPLE: str = "purple"
     PRESET_DARK_SLATE_GREY: str = "DarkSlateGray4"
     PRESET_DEEP_SKY_BLUE: str = "deep sky blue"
@@ -166,18 +707,28 @@ class WrappingPaper:
     PRESET_VIOLET_RED: str = "VioletRed2"
     PRESET_GOLD: str = "gold"
 
-    colours: typing.Dict[str, str] = {
-        PRESET_PURPLE: "Purple",
-        PRESET_DARK_SLATE_GREY: "Dark Slate Grey 4",
-        PRESET_DEEP_SKY_BLUE: "Deep Sky Blue",
-        PRESET_LIGHT_SEA_GREEN: "Light Sea Green",
-        PRESET_VIOLET_RED: "Violet Red 2",
-        PRESET_GOLD: "Gold"
-    }
+    # prices per cm^2 (in pence) are held in units of 1/RATE_SCALE pence and
+    # areas in units of 1/AREA_SCALE cm^2, so pricing is integer arithmetic.
+    RATE_SCALE: int = 10000
+    AREA_SCALE: int = 100
 
-    def __init__(self, colour: str, price_cm_sq: float, /) -> None:
+    def __init__(self, colour: str, price_cm_sq: float, /, *,
+                 grade: str = "none") -> None:
+        # grade is the name of a catalogue PaperGrade.
+        self._grade = grade
         self._colour = colour
-        self._price_per_cm_sq = price_cm_sq
+        self.set_price(price_cm_sq)
+
+    def __str__(self) -> str:
+        catalogue = get_catalogue()
+        return (
+            f"{catalogue.describe_grade(self._grade)} "
+            + "Wrapping Paper ["
+            + catalogue.describe_colour(self._colour)
+            + "]")
+
+    def get_grade(self) -> str:
+        return self._grade
 
     def get_colour(self) -> str:
         return self._colour
@@ -190,55 +741,79 @@ class WrappingPaper:
 
     def set_price(self, price: float, /) -> None:
         self._price_per_cm_sq = price
+        self._rate = round(price * WrappingPaper.RATE_SCALE)
 
-    def calculate_price(self, area: float, /) -> float:
-        return area * self.get_price()
+    def get_rate(self) -> int:
+        return self._rate
+
+    def calculate_price(self, area: float, /) -> Money:
+        # area is already rounded to two decimal places, the price is
+        # rounded once to the nearest penny.
+        return Money(divide_half_up(
+            round(area * WrappingPaper.AREA_SCALE) * self._rate,
+            WrappingPaper.AREA_SCALE * WrappingPaper.RATE_SCALE))
+
+    @staticmethod
+    def get_catalogue_price(grade: str, /) -> float:
+        # raises ValueError, naming the grade, if it is not in the catalogue.
+        if (paper_grade := get_catalogue().get_grade(grade)) is None:
+            raise ValueError(f"Paper not in the catalogue: {grade}")
+        return paper_grade.price_cm_sq
 
 
 class ExpensiveWrappingPaper(WrappingPaper):
+    # the "expensive" grade of the catalogue, at its catalogue price.
 
-    def __init__(self, colour: str, /) -> None:
-        super().__init__(colour, 0.75)
+    __slots__ = ()
 
-    def __str__(self) -> str:
-        return (
-            f"Expensive Wrapping Paper ["
-            + WrappingPaper.colours[super().get_colour()]
-            + "]")
+    def __init__(self, colour: str, /) -> None:
+        super().__init__(
+            colour,
+            WrappingPaper.get_catalogue_price(Translator.EXPENSIVE_WRAPPING),
+            grade=Translator.EXPENSIVE_WRAPPING)
 
 
 class CheapWrappingPaper(WrappingPaper):
+    # the "cheap" grade of the catalogue, at its catalogue price.
 
-    def __init__(self, colour: str, /) -> None:
-        super().__init__(colour, 0.40)
+    __slots__ = ()
 
-    def __str__(self) -> str:
-        return (
-            f"Cheap Wrapping Paper ["
-            + WrappingPaper.colours[super().get_colour()]
-            + "]")
+    def __init__(self, colour: str, /) -> None:
+        super().__init__(
+            colour,
+            WrappingPaper.get_catalogue_price(Translator.CHEAP_WRAPPING),
+            grade=Translator.CHEAP_WRAPPING)
 
 
 class Bow:
 
+    __slots__ = ("_price",)
+
+    DEFAULT_PRICE: Money = Money(150)
+
     def __init__(self) -> None:
-        self._price: float = 1.50
+        self._price: Money = Bow.DEFAULT_PRICE
 
     def __str__(self) -> str:
         return "Bow"
 
-    def get_price(self) -> float:
+    def get_price(self) -> Money:
         return self._price
 
-    def set_price(self, price: float, /) -> None:
-        self._price = price
+    def set_price(self, price: typing.Union[Money, float], /) -> None:
+        self._price = Money.of(price)
 
 
 class GiftCard:
 
+    __slots__ = ("_base_rate", "_char_rate", "_message")
+
+    DEFAULT_BASE_RATE: Money = Money(50)
+    DEFAULT_CHAR_RATE: Money = Money(2)
+
     def __init__(self, message: str, /) -> None:
-        self._base_rate: float = 0.50
-        self._char_rate: float = 0.02
+        self._base_rate: Money = GiftCard.DEFAULT_BASE_RATE
+        self._char_rate: Money = GiftCard.DEFAULT_CHAR_RATE
         self._message = message
 
     def __str__(self) -> str:
@@ -246,17 +821,17 @@ class GiftCard:
             f"Gift Card ['"
             + f"{self.get_message()}']")
 
-    def get_base_rate(self) -> float:
+    def get_base_rate(self) -> Money:
         return self._base_rate
 
-    def set_base_rate(self, price: float, /) -> None:
-        self._base_rate = price
+    def set_base_rate(self, price: typing.Union[Money, float], /) -> None:
+        self._base_rate = Money.of(price)
 
-    def get_char_rate(self) -> float:
+    def get_char_rate(self) -> Money:
         return self._char_rate
 
-    def set_char_rate(self, price: float, /) -> None:
-        self._char_rate = price
+    def set_char_rate(self, price: typing.Union[Money, float], /) -> None:
+        self._char_rate = Money.of(price)
 
     def get_message(self) -> str:
         return self._message
@@ -264,14 +839,25 @@ class GiftCard:
     def set_message(self, message: str, /) -> None:
         self._message = message
 
-    def calculate_price(self) -> float:
+    def calculate_price(self) -> Money:
         return (
             self.get_base_rate()
             + (self.get_char_rate() * len(self.get_message())))
 
 
+class PriceBreakdown(typing.NamedTuple):
+    # every component of a quote's price, as printed on a receipt.
+    area: float
+    paper: Money
+    gift_card: Money
+    bow: Money
+    total: Money
+
+
 class Quote:
 
+    __slots__ = ("title", "present", "wrapping_paper", "gift_card", "bow")
+
     def __init__(self, *,
                  quote_title: str,
                  present_type: PresentType,
@@ -296,79 +882,931 @@ class Quote:
             result += f"   |   {str(self.gift_card)}"
         return result
 
-    def calculate_price(self) -> float:
-        total: float = 0
-        if self.present.get_recommended_area() > 0:
-            total += pence_to_pounds(
-                self.wrapping_paper.calculate_price(
-                    self.present.get_recommended_area()))
-            if isinstance(self.gift_card, GiftCard):
-                total += self.gift_card.calculate_price()
-            if isinstance(self.bow, Bow):
-                total += self.bow.get_price()
+    def calculate_price_breakdown(self) -> PriceBreakdown:
+        # the same figures as calculate_price, each computed once.
+        area: float = self.present.get_recommended_area()
+        gift_card: Money = (
+            self.gift_card.calculate_price()
+            if isinstance(self.gift_card, GiftCard) else Money())
+        bow: Money = (
+            self.bow.get_price() if isinstance(self.bow, Bow) else Money())
+        # also catches a NaN area, which cannot be priced.
+        if not area > 0:
+            return PriceBreakdown(area, Money(), gift_card, bow, Money())
+        paper: Money = self.wrapping_paper.calculate_price(area)
+        return PriceBreakdown(area, paper, gift_card, bow, Money(
+            paper.get_pence() + gift_card.get_pence() + bow.get_pence()))
+
+    def calculate_price(self) -> Money:
+        area: float = self.present.get_recommended_area()
+        if not area > 0:
+            return Money()
+        total: Money = self.wrapping_paper.calculate_price(area)
+        if isinstance(self.gift_card, GiftCard):
+            total += self.gift_card.calculate_price()
+        if isinstance(self.bow, Bow):
+            total += self.bow.get_price()
         return total
 
 
+class PriceCacheStatistics(typing.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    def get_hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0
+        return self.hits / lookups
+
+
+class PriceCache:
+    # a bounded least recently used cache of price breakdowns, keyed by the
+    # normalised specification of a quote (see get_key) rather than the
+    # quote itself, so a new quote for a box already priced is a hit.
+
+    __slots__ = ("_breakdowns", "_max_size", "_hits", "_misses",
+                 "_evictions")
+
+    DEFAULT_SIZE: int = 4096
+
+    def __init__(self, max_size: int = DEFAULT_SIZE, /) -> None:
+        # insertion ordered, the least recently used entry comes first.
+        self._breakdowns: typing.Dict[
+            typing.Tuple[typing.Any, ...], PriceBreakdown] = {}
+        self._max_size: int = max(max_size, 0)
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._breakdowns)
+
+    @staticmethod
+    def get_key(quote: Quote, /) -> typing.Tuple[typing.Any, ...]:
+        # everything the price depends on: the shape and the dimensions of
+        # the paper around it (the area follows from them), the paper rate
+        # (its grade; the colour doesn't change the price), the bow price
+        # and the gift card rates and message length.
+        present = quote.present
+        gift_card = quote.gift_card
+        bow = quote.bow
+        return (
+            type(present), *present.get_wrap_dimensions(),
+            quote.wrapping_paper.get_rate(),
+            bow.get_price().get_pence() if isinstance(bow, Bow) else None,
+            (gift_card.get_base_rate().get_pence(),
+             gift_card.get_char_rate().get_pence(),
+             len(gift_card.get_message()))
+            if isinstance(gift_card, GiftCard) else None)
+
+    def get_price_breakdown(self, quote: Quote, /) -> PriceBreakdown:
+        key = PriceCache.get_key(quote)
+        breakdowns = self._breakdowns
+        breakdown = breakdowns.pop(key, None)
+        if breakdown is None:
+            self._misses += 1
+            breakdown = quote.calculate_price_breakdown()
+            if self._max_size == 0:
+                return breakdown
+            if len(breakdowns) >= self._max_size:
+                del breakdowns[next(iter(breakdowns))]
+                self._evictions += 1
+        else:
+            self._hits += 1
+        breakdowns[key] = breakdown
+        return breakdown
+
+    def get_price(self, quote: Quote, /) -> Money:
+        return self.get_price_breakdown(quote).total
+
+    def get_max_size(self) -> int:
+        return self._max_size
+
+    def set_max_size(self, max_size: int, /) -> None:
+        # 0 turns the cache off, entries over the new size are evicted.
+        self._max_size = max(max_size, 0)
+        while len(self._breakdowns) > self._max_size:
+            del self._breakdowns[next(iter(self._breakdowns))]
+            self._evictions += 1
+
+    def clear(self) -> None:
+        self._breakdowns.clear()
+
+    def get_statistics(self) -> PriceCacheStatistics:
+        return PriceCacheStatistics(
+            self._hits, self._misses, self._evictions,
+            len(self._breakdowns), self._max_size)
+
+    def reset_statistics(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+
+# shared by the editor, orders, receipts and the headless interface.
+_price_cache: PriceCache = PriceCache()
+
+
+def get_price_cache() -> PriceCache:
+    return _price_cache
+
+
+RECEIPT_SEPARATOR: str = "-" * 80
+RECEIPT_BUFFER_SIZE: int = 1 << 16
+RECEIPT_CHUNK_SIZE: int = 1024
+
+# the receipt sections, as bound str.format methods built once at import.
+# fields are positional, amounts of money are given as Money.
+RECEIPT_HEADER: typing.Callable[..., str] = (
+    RECEIPT_SEPARATOR
+    + "\n\n\tWrapping Paper Quotes\n\n"
+    + "\tDate Time:\t\t\t\t\t\t{}\n"
+    + "\tOrder Number:\t\t\t\t\t{}\n"
+    + "\tNumber of Quotes:\t\t\t\t{}\n\n"
+    + RECEIPT_SEPARATOR
+    + "\n\n").format
+RECEIPT_QUOTE: typing.Callable[..., str] = (
+    "{}   (Total: GBP {})\n"
+    + "\t\t{}\n"
+    + "\t\t{}   (GBP {})\n").format
+RECEIPT_ADDITIONAL: typing.Callable[..., str] = (
+    "\t\t{}   (GBP {})\n").format
+RECEIPT_FOOTER: typing.Callable[..., str] = (
+    "\nTotal price for this order: GBP {}\n").format
+
+
+class PaperUsageTotal(typing.NamedTuple):
+    area: float
+    revenue: Money
+    quotes: int
+
+
+class PaperUsage:
+    # running paper area and paper revenue per (grade, colour), where the
+    # grade is the name of a catalogue PaperGrade. areas are held in units
+    # of 1/WrappingPaper.AREA_SCALE cm^2, so sums are exact.
+
+    __slots__ = ("_totals", "_keys")
+
+    def __init__(self) -> None:
+        self._totals: typing.Dict[
+            typing.Tuple[str, str], typing.List[int]] = {}
+        self._keys: typing.Dict[
+            typing.Tuple[str, str], typing.Tuple[str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def __iter__(self) -> typing.Iterator[
+            typing.Tuple[str, str, PaperUsageTotal]]:
+        for paper, colour in sorted(self._totals):
+            yield paper, colour, self.get_usage(paper, colour)
+
+    def get_usage(self, paper: str, colour: str, /) -> PaperUsageTotal:
+        area, revenue, quotes = self._totals.get((paper, colour), (0, 0, 0))
+        return PaperUsageTotal(
+            area / WrappingPaper.AREA_SCALE, Money(revenue), quotes)
+
+    def get_total(self) -> PaperUsageTotal:
+        area, revenue, quotes = (
+            sum(column) for column in zip((0, 0, 0), *self._totals.values()))
+        return PaperUsageTotal(
+            area / WrappingPaper.AREA_SCALE, Money(revenue), quotes)
+
+    def add_usage(self, paper: str, colour: str, area: float,
+                  revenue: Money, quotes: int, /) -> None:
+        self._add(
+            (paper, colour), round(area * WrappingPaper.AREA_SCALE),
+            revenue.get_pence(), quotes)
+
+    def merge(self, other: "PaperUsage", /) -> None:
+        for key, (area, revenue, quotes) in other._totals.items():
+            self._add(key, area, revenue, quotes)
+
+    def add_quote(self, quote: Quote, area: float, paper_price: Money, /
+                  ) -> typing.Tuple[str, str]:
+        # area and paper_price as in quote.calculate_price_breakdown(). the
+        # key returned, with the same area and paper_price, is what
+        # remove_quote takes off again, whatever the paper says by then.
+        return self.add_paper(
+            quote.wrapping_paper.get_grade(),
+            quote.wrapping_paper.get_colour(), area, paper_price)
+
+    def add_paper(self, paper: str, colour: str, area: float,
+                  paper_price: Money, /) -> typing.Tuple[str, str]:
+        # one quote's paper, as add_quote.
+        key = (paper, colour)
+        # keys are shared, so orders can keep one per quote cheaply.
+        key = self._keys.setdefault(key, key)
+        self._add(
+            key, round(max(area, 0) * WrappingPaper.AREA_SCALE),
+            paper_price.get_pence(), 1)
+        return key
+
+    def remove_quote(self, key: typing.Tuple[str, str], area: float,
+                     paper_price: Money, /) -> None:
+        self._add(
+            key, -round(max(area, 0) * WrappingPaper.AREA_SCALE),
+            -paper_price.get_pence(), -1)
+
+    def describe(self) -> str:
+        lines: typing.List[str] = []
+        catalogue = get_catalogue()
+        for paper, colour, total in self:
+            lines.append(
+                f"{catalogue.describe_grade(paper)} "
+                + f"{catalogue.describe_colour(colour)}: "
+                + f"{total.area:.2f}cm^2, £{total.revenue:.2f} "
+                + f"({total.quotes} quote(s))")
+        return "\n".join(lines)
+
+    def _add(self, key: typing.Tuple[str, str], area: int, revenue: int,
+             quotes: int, /) -> None:
+        totals = self._totals.setdefault(key, [0, 0, 0])
+        totals[0] += area
+        totals[1] += revenue
+        totals[2] += quotes
+        if totals[2] == 0:
+            del self._totals[key]
+
+
+class OrderSnapshot(typing.NamedTuple):
+    # an order as it stood at a point in time, which can be written out
+    # on another thread while the order carries on changing (or a new
+    # order is started), see Order.snapshot.
+    order_number: int
+    time_date: str
+    quotes: typing.Collection[Quote]
+    # the price breakdown of each quote, as priced when it was added to
+    # the order, so the receipt agrees with total_price whatever the
+    # catalogue says now.
+    breakdowns: typing.Sequence[PriceBreakdown]
+    total_price: Money
+
+    def get_receipt_name(self) -> str:
+        return f"{self.time_date} Order {self.order_number}.txt"
+
+    def export_order(self) -> int:
+        # nothing is priced, so any thread may export a snapshot.
+        try:
+            with open(self.get_receipt_name(), "w",
+                      buffering=RECEIPT_BUFFER_SIZE) as handler:
+                self.write_receipt(handler)
+        except OSError:
+            return 1
+        return 0
+
+    def write_receipt(self, handler: typing.TextIO, /) -> None:
+        # streams the receipt, joining RECEIPT_CHUNK_SIZE sections at a time
+        # so memory stays bounded however large the order is.
+        handler.write(RECEIPT_HEADER(
+            self.time_date,
+            self.order_number,
+            len(self.quotes)))
+        chunk: typing.List[str] = []
+        append = chunk.append
+        for quote, breakdown in zip(self.quotes, self.breakdowns):
+            append(RECEIPT_QUOTE(
+                quote.title, breakdown.total, quote.present,
+                quote.wrapping_paper, breakdown.paper))
+            if isinstance(quote.gift_card, GiftCard):
+                append(RECEIPT_ADDITIONAL(
+                    quote.gift_card, breakdown.gift_card))
+            if isinstance(quote.bow, Bow):
+                append(RECEIPT_ADDITIONAL(quote.bow, breakdown.bow))
+            append("\n")
+            if len(chunk) >= RECEIPT_CHUNK_SIZE:
+                handler.write("".join(chunk))
+                chunk.clear()
+        handler.write("".join(chunk))
+        handler.write(RECEIPT_FOOTER(self.total_price))
+
+
 class Order:
 
     def __init__(self, order_number: int, /) -> None:
         self._order_number = order_number
-        self.quotes: typing.List[Quote] = []
+        # the price breakdown of each quote is kept alongside it, so the
+        # running total and paper usage can be adjusted by exactly what the
+        # quote added as quotes are added, replaced or deleted.
+        self._quotes: typing.List[Quote] = []
+        self._breakdowns: typing.List[PriceBreakdown] = []
+        self._total_price: Money = Money()
+        # likewise the paper usage key of each quote.
+        self._usage_keys: typing.List[typing.Tuple[str, str]] = []
+        self._paper_usage: PaperUsage = PaperUsage()
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def __iter__(self) -> typing.Iterator[Quote]:
+        return iter(self._quotes)
+
+    @property
+    def quotes(self) -> typing.Tuple[Quote, ...]:
+        # read only, changes go through add/replace/delete_quote.
+        return tuple(self._quotes)
 
     def get_order_number(self) -> int:
         return self._order_number
 
-    def calculate_total_price(self) -> float:
-        total: float = 0
-        for quote in self.quotes:
+    def get_quote(self, index: int, /) -> Quote:
+        return self._quotes[index]
+
+    def get_quote_count(self) -> int:
+        return len(self._quotes)
+
+    def get_quote_price(self, index: int, /) -> Money:
+        # as priced when the quote was added.
+        return self._breakdowns[index].total
+
+    def get_quote_price_breakdown(self, index: int, /) -> PriceBreakdown:
+        return self._breakdowns[index]
+
+    def get_quote_paper_usage(self, index: int, /
+                              ) -> typing.Tuple[float, Money]:
+        # the area and paper price the quote added to the paper usage.
+        breakdown = self._breakdowns[index]
+        return breakdown.area, breakdown.paper
+
+    def add_quote(self, quote: Quote, /) -> int:
+        breakdown = _price_cache.get_price_breakdown(quote)
+        self._quotes.append(quote)
+        self._breakdowns.append(breakdown)
+        self._total_price += breakdown.total
+        self._usage_keys.append(self._paper_usage.add_quote(
+            quote, breakdown.area, breakdown.paper))
+        return len(self._quotes) - 1
+
+    def replace_quote(self, index: int, quote: Quote, /) -> None:
+        # quotes are never changed in place, an edited quote is a new quote
+        # which replaces the old one.
+        breakdown = _price_cache.get_price_breakdown(quote)
+        self._remove_paper_usage(index)
+        self._total_price += breakdown.total - self._breakdowns[index].total
+        self._quotes[index] = quote
+        self._breakdowns[index] = breakdown
+        self._usage_keys[index] = self._paper_usage.add_quote(
+            quote, breakdown.area, breakdown.paper)
+
+    def delete_quote(self, index: int, /) -> None:
+        self._remove_paper_usage(index)
+        self._total_price -= self._breakdowns[index].total
+        del self._quotes[index]
+        del self._breakdowns[index]
+        del self._usage_keys[index]
+
+    def _remove_paper_usage(self, index: int, /) -> None:
+        breakdown = self._breakdowns[index]
+        self._paper_usage.remove_quote(
+            self._usage_keys[index], breakdown.area, breakdown.paper)
+
+    def get_paper_usage(self) -> PaperUsage:
+        # kept up to date as quotes change, so reading it costs nothing.
+        return self._paper_usage
+
+    def calculate_total_price(self) -> Money:
+        return self._total_price
+
+    def recalculate_total_price(self) -> Money:
+        # full recomputation, the running total must always agree with it.
+        total: Money = Money()
+        for quote in self:
             total += quote.calculate_price()
-        return round_number(total)
+        return total
+
+    def snapshot(self) -> "OrderSnapshot":
+        # quotes are never changed in place (see replace_quote), so the
+        # snapshot shares them, and their price breakdowns.
+        return OrderSnapshot(
+            self._order_number, get_current_time_date(),
+            tuple(self._quotes), tuple(self._breakdowns), self._total_price)
 
     def export_order(self) -> int:
-        file = f"{get_current_time_date()} Order {self.get_order_number()}.txt"
-        separator = ("-" * 80)
+        return self.snapshot().export_order()
+
+    def write_receipt(self, handler: typing.TextIO, /) -> None:
+        self.snapshot().write_receipt(handler)
+
+
+def _import_numpy() -> None:
+    global np
+    if np is None:
         try:
-            with open(file, "w") as handler:
-                handler.write(
-                    separator
-                    + "\n\n\tWrapping Paper Quotes\n\n"
-                    + f"\tDate Time:\t\t\t\t\t\t"
-                    + f"{get_current_time_date()}\n"
-                    + f"\tOrder Number:\t\t\t\t\t"
-                    + f"{self.get_order_number()}\n"
-                    + f"\tNumber of Quotes:\t\t\t\t"
-                    + f"{len(self.quotes)}\n\n"
-                    + separator
-                    + "\n\n")
-                for q in self.quotes:
-                    handler.write(
-                        q.title
-                        + f"   (Total: GBP {q.calculate_price():.2f})\n"
-                        + f"\t\t{str(q.present)}\n"
-                        + f"\t\t{str(q.wrapping_paper)}"
-                        + f"""   (GBP {pence_to_pounds(
-                            q.wrapping_paper.calculate_price(
-                                q.present.get_recommended_area())):.2f})\n""")
-                    if isinstance(q.gift_card, GiftCard):
-                        handler.write(
-                            f"\t\t{str(q.gift_card)}"
-                            + f"   (GBP {q.gift_card.calculate_price():.2f})"
-                            + "\n")
-                    if isinstance(q.bow, Bow):
-                        handler.write(
-                            f"\t\t{str(q.bow)}"
-                            + f"   (GBP {q.bow.get_price():.2f})\n")
-                    handler.write("\n")
-                handler.write(
-                    "\n"
-                    + "Total price for this order: GBP "
-                    + f"{self.calculate_total_price():.2f}\n")
-        except OSError:
-            return 1
-        return 0
+            import numpy as np
+        except ImportError:
+            raise RuntimeError(
+                "QuoteBatch requires numpy to be installed.") from None
+
+
+def round_numbers(amounts: "np.ndarray", /) -> "np.ndarray":
+    # array counterpart of round_number, values close to a rounding tie
+    # (or not finite) are handed to round_number so results stay identical.
+    _import_numpy()
+    scaled = amounts * 100
+    magnitude = np.abs(scaled)
+    with np.errstate(invalid="ignore"):
+        fraction = magnitude - np.floor(magnitude)
+        ambiguous = ~np.isfinite(scaled) | (
+            np.abs(fraction - 0.5) < np.maximum(1e-6, magnitude * 1e-12))
+    result = np.copysign(np.floor(magnitude + 0.5), scaled) / 100
+    for index in np.flatnonzero(ambiguous):
+        result[index] = round_number(float(amounts[index]))
+    return result
+
+
+class QuoteBatch:
+    # columnar set of quotes, priced with array operations.
+
+    SHAPE_NONE: int = 0
+    SHAPE_CUBE: int = 1
+    SHAPE_CUBOID: int = 2
+    SHAPE_CYLINDER: int = 3
+    SHAPE_SPHERE: int = 4
+    SHAPE_TRIANGULAR_PRISM: int = 5
 
+    def __init__(self, *,
+                 shapes: typing.Sequence[int],
+                 length_one: typing.Sequence[float],
+                 length_two: typing.Sequence[float],
+                 length_three: typing.Sequence[float],
+                 paper_rates: typing.Sequence[float],
+                 bows: typing.Sequence[bool],
+                 gift_cards: typing.Sequence[bool],
+                 message_lengths: typing.Sequence[int]) -> None:
+        _import_numpy()
+        self._shapes = np.asarray(shapes, dtype=np.int8)
+        self._length_one = np.asarray(length_one, dtype=np.float64)
+        self._length_two = np.asarray(length_two, dtype=np.float64)
+        self._length_three = np.asarray(length_three, dtype=np.float64)
+        self._paper_rates = np.asarray(paper_rates, dtype=np.float64)
+        self._bows = np.asarray(bows, dtype=np.bool_)
+        self._gift_cards = np.asarray(gift_cards, dtype=np.bool_)
+        self._message_lengths = np.asarray(message_lengths, dtype=np.int64)
+        columns = (
+            self._shapes, self._length_one, self._length_two,
+            self._length_three, self._paper_rates, self._bows,
+            self._gift_cards, self._message_lengths)
+        if any(column.shape != self._shapes.shape for column in columns):
+            raise ValueError("QuoteBatch columns must have equal lengths.")
+        self._areas = None
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    @staticmethod
+    def from_quotes(quotes: typing.Iterable[Quote], /) -> "QuoteBatch":
+        shapes: typing.List[int] = []
+        length_one: typing.List[float] = []
+        length_two: typing.List[float] = []
+        length_three: typing.List[float] = []
+        paper_rates: typing.List[float] = []
+        bows: typing.List[bool] = []
+        gift_cards: typing.List[bool] = []
+        message_lengths: typing.List[int] = []
+        for quote in quotes:
+            present = quote.present
+            if (shape_type := ShapeRegistry.find_for(present)) is None:
+                shapes.append(QuoteBatch.SHAPE_NONE)
+                dimensions = (0, 0, 0)
+            else:
+                shapes.append(shape_type.code)
+                dimensions = present.get_dimensions()
+            length_one.append(dimensions[0])
+            length_two.append(dimensions[1])
+            length_three.append(dimensions[2])
+            paper_rates.append(quote.wrapping_paper.get_price())
+            bows.append(isinstance(quote.bow, Bow))
+            gift_cards.append(isinstance(quote.gift_card, GiftCard))
+            message_lengths.append(
+                len(quote.gift_card.get_message())
+                if isinstance(quote.gift_card, GiftCard) else 0)
+        return QuoteBatch(
+            shapes=shapes, length_one=length_one, length_two=length_two,
+            length_three=length_three, paper_rates=paper_rates, bows=bows,
+            gift_cards=gift_cards, message_lengths=message_lengths)
+
+    def get_recommended_areas(self) -> "np.ndarray":
+        # same formulas as the registered shapes, one row per quote.
+        if self._areas is None:
+            height = np.zeros(len(self))
+            width = np.zeros(len(self))
+            for shape_type in ShapeRegistry.get_shape_types():
+                rows = self._shapes == shape_type.code
+                if rows.any():
+                    height[rows], width[rows] = (
+                        shape_type.present_type.wrap_dimensions(
+                            self._length_one[rows], self._length_two[rows],
+                            self._length_three[rows]))
+            self._areas = np.where(
+                (height <= 0) | (width <= 0), 0.0,
+                round_numbers((height + 6) * (width + 6)))
+        return self._areas
+
+    def calculate_prices(self) -> "np.ndarray":
+        # prices in whole pence, following Quote.calculate_price.
+        # NaN areas are priced at 0, as by Quote.calculate_price.
+        areas = self.get_recommended_areas()
+        areas = np.where(areas > 0, areas, 0.0)
+        denominator = WrappingPaper.AREA_SCALE * WrappingPaper.RATE_SCALE
+        numerators = (
+            np.rint(areas * WrappingPaper.AREA_SCALE).astype(np.int64)
+            * np.rint(self._paper_rates * WrappingPaper.RATE_SCALE).astype(
+                np.int64))
+        totals = np.sign(numerators) * (
+            (np.abs(numerators) + (denominator // 2)) // denominator)
+        totals += np.where(
+            self._gift_cards,
+            GiftCard.DEFAULT_BASE_RATE.get_pence()
+            + (GiftCard.DEFAULT_CHAR_RATE.get_pence()
+               * self._message_lengths), 0)
+        totals += np.where(self._bows, Bow.DEFAULT_PRICE.get_pence(), 0)
+        return np.where(areas > 0, totals, 0)
+
+    def calculate_total_price(self) -> Money:
+        return Money(int(self.calculate_prices().sum()))
+
+
+class QuoteView(Quote):
+    # a quote read from a row of a ColumnarOrder, only valid until the
+    # order is next changed.
+
+    __slots__ = ("_order", "_index")
+
+    def __init__(self, order: "ColumnarOrder", index: int, /) -> None:
+        self._order = order
+        self._index = index
+
+    @property
+    def title(self) -> str:
+        return self._order._titles[self._index]
+
+    @property
+    def present(self) -> PresentType:
+        order, index = self._order, self._index
+        shape_type = ShapeRegistry.find_by_code(order._shapes[index])
+        if shape_type is None:
+            return None
+        return shape_type.present_type.from_dimensions(
+            order._length_one[index], order._length_two[index],
+            order._length_three[index])
+
+    @property
+    def wrapping_paper(self) -> WrappingPaper:
+        order, index = self._order, self._index
+        grade = order._paper_names[order._papers[index]]
+        wrapping_paper = Translator.translate_wrapping_paper_type(
+            paper=grade, colour=order._colour_names[order._colours[index]])
+        if wrapping_paper is None:
+            # the grade was taken out of the catalogue after the row was
+            # added.
+            raise ValueError(f"Paper not in the catalogue: {grade}")
+        return wrapping_paper
+
+    @property
+    def gift_card(self) -> GiftCard:
+        order, index = self._order, self._index
+        if not order._flags[index] & ColumnarOrder.FLAG_GIFT_CARD:
+            return None
+        return GiftCard(order._messages[
+            order._message_offsets[index]:
+            order._message_offsets[index + 1]].decode("utf-8"))
+
+    @property
+    def bow(self) -> Bow:
+        return Translator.translate_bow(
+            bow=self._order._flags[self._index] & ColumnarOrder.FLAG_BOW)
+
+    def calculate_price(self) -> Money:
+        return Money(self._order._prices[self._index])
+
+
+class _RowPriceBreakdowns:
+    # the price breakdowns of the rows of a ColumnarOrder, read as they
+    # are needed rather than held as an object per row.
+
+    __slots__ = ("_order",)
+
+    def __init__(self, order: "ColumnarOrder", /) -> None:
+        self._order = order
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, index: int, /) -> PriceBreakdown:
+        return self._order.get_quote_price_breakdown(index)
+
+    def __iter__(self) -> typing.Iterator[PriceBreakdown]:
+        return map(self._order.get_quote_price_breakdown,
+                   range(len(self._order)))
+
+
+class ColumnarOrder(Order):
+    # an order held as one array per field rather than a list of quotes,
+    # see get_column. quotes are read back as QuoteView rows and keep only
+    # the catalogue paper, bow and gift card prices.
+
+    # the paper code of quotes without a paper, see get_paper_table.
+    PAPER_NONE: int = 0
+
+    FLAG_BOW: int = 1
+    FLAG_GIFT_CARD: int = 2
+
+    # the array typecode of each column, messages are utf-8 encoded and
+    # the message of row i is messages[message_offsets[i]:
+    # message_offsets[i + 1]]. paper areas are in units of
+    # 1/WrappingPaper.AREA_SCALE cm^2, as in PaperUsage.
+    COLUMNS: typing.Dict[str, str] = {
+        "shapes": "b",
+        "length_one": "d",
+        "length_two": "d",
+        "length_three": "d",
+        "papers": "H",
+        "colours": "H",
+        "flags": "B",
+        "message_offsets": "q",
+        "prices": "q",
+        "paper_areas": "q",
+        "paper_prices": "q",
+    }
+
+    def __init__(self, order_number: int, /) -> None:
+        # the quote and price lists of Order are replaced by the columns.
+        self._order_number = order_number
+        self._total_price: Money = Money()
+        self._titles: typing.List[str] = []
+        self._shapes = array.array(ColumnarOrder.COLUMNS["shapes"])
+        self._length_one = array.array(ColumnarOrder.COLUMNS["length_one"])
+        self._length_two = array.array(ColumnarOrder.COLUMNS["length_two"])
+        self._length_three = array.array(
+            ColumnarOrder.COLUMNS["length_three"])
+        self._papers = array.array(ColumnarOrder.COLUMNS["papers"])
+        self._colours = array.array(ColumnarOrder.COLUMNS["colours"])
+        self._flags = array.array(ColumnarOrder.COLUMNS["flags"])
+        self._message_offsets = array.array(
+            ColumnarOrder.COLUMNS["message_offsets"], (0,))
+        self._prices = array.array(ColumnarOrder.COLUMNS["prices"])
+        # the area and paper price each row added to the paper usage.
+        self._paper_areas = array.array(ColumnarOrder.COLUMNS["paper_areas"])
+        self._paper_prices = array.array(
+            ColumnarOrder.COLUMNS["paper_prices"])
+        self._messages = bytearray()
+        # paper grades and colours are stored as codes into these tables.
+        self._paper_names: typing.List[str] = [Translator.NONE]
+        self._paper_codes: typing.Dict[str, int] = {
+            Translator.NONE: ColumnarOrder.PAPER_NONE}
+        self._colour_names: typing.List[str] = []
+        self._colour_codes: typing.Dict[str, int] = {}
+        self._paper_usage: PaperUsage = PaperUsage()
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def __iter__(self) -> typing.Iterator[Quote]:
+        return (QuoteView(self, index) for index in range(len(self)))
+
+    @property
+    def quotes(self) -> typing.Tuple[Quote, ...]:
+        return tuple(self)
+
+    def get_quote(self, index: int, /) -> Quote:
+        return QuoteView(self, range(len(self))[index])
+
+    def get_quote_count(self) -> int:
+        return len(self)
+
+    def get_quote_price(self, index: int, /) -> Money:
+        return Money(self._prices[index])
+
+    def get_quote_paper_usage(self, index: int, /
+                              ) -> typing.Tuple[float, Money]:
+        return (self._paper_areas[index] / WrappingPaper.AREA_SCALE,
+                Money(self._paper_prices[index]))
+
+    def get_quote_price_breakdown(self, index: int, /) -> PriceBreakdown:
+        # rows keep the total and paper price, not the gift card and bow
+        # prices, so whichever of them comes last on the receipt takes the
+        # rest of the total; the lines of a receipt always add up.
+        index = range(len(self))[index]
+        view = QuoteView(self, index)
+        area, paper = self.get_quote_paper_usage(index)
+        total = Money(self._prices[index])
+        flags = self._flags[index]
+        gift_card = (view.gift_card.calculate_price()
+                     if flags & ColumnarOrder.FLAG_GIFT_CARD else Money())
+        bow = (Bow.DEFAULT_PRICE
+               if flags & ColumnarOrder.FLAG_BOW else Money())
+        # quotes without an area are not charged, but their gift card and
+        # bow are listed at their prices, as in Quote.
+        if area > 0:
+            if flags & ColumnarOrder.FLAG_BOW:
+                bow = total - paper - gift_card
+            elif flags & ColumnarOrder.FLAG_GIFT_CARD:
+                gift_card = total - paper
+        return PriceBreakdown(area, paper, gift_card, bow, total)
+
+    def snapshot(self) -> OrderSnapshot:
+        # QuoteView rows are only valid until the order changes, so the
+        # snapshot reads from a copy of the columns, which is far smaller
+        # than a quote object per row.
+        frozen = ColumnarOrder(self._order_number)
+        for name in ColumnarOrder.COLUMNS:
+            setattr(frozen, f"_{name}", getattr(self, f"_{name}")[:])
+        frozen._titles = self._titles.copy()
+        frozen._messages = self._messages[:]
+        frozen._paper_names = self._paper_names.copy()
+        frozen._colour_names = self._colour_names.copy()
+        frozen._total_price = self._total_price
+        return OrderSnapshot(
+            self._order_number, get_current_time_date(), frozen,
+            _RowPriceBreakdowns(frozen), self._total_price)
+
+    def recalculate_total_price(self) -> Money:
+        # every row priced again from its dimensions and the catalogue
+        # rates, not read back from the prices column, so it agrees with
+        # the running total unless the catalogue has changed since.
+        total: Money = Money()
+        for quote in self:
+            total += Quote.calculate_price(quote)
+        return total
 
-# the user interface.
+    def get_column(self, name: str, /) -> memoryview:
+        # zero-copy access for writers and analytics, e.g. numpy.frombuffer.
+        # the view must be released before the order is changed again.
+        if name == "messages":
+            return memoryview(self._messages)
+        if name not in ColumnarOrder.COLUMNS:
+            raise KeyError(name)
+        return memoryview(getattr(self, f"_{name}"))
+
+    def get_paper_table(self) -> typing.Tuple[str, ...]:
+        # the paper grade of each code in the papers column.
+        return tuple(self._paper_names)
+
+    def get_colour_table(self) -> typing.Tuple[str, ...]:
+        # the colour of each code in the colours column.
+        return tuple(self._colour_names)
+
+    def count_shapes(self) -> typing.Dict[int, int]:
+        # quotes per QuoteBatch shape code.
+        return {
+            shape: self._shapes.count(shape) for shape in (
+                QuoteBatch.SHAPE_NONE,
+                *(shape_type.code
+                  for shape_type in ShapeRegistry.get_shape_types()))}
+
+    def add_quote(self, quote: Quote, /) -> int:
+        breakdown = _price_cache.get_price_breakdown(quote)
+        row = self._encode_quote(quote, breakdown)
+        self._titles.append(quote.title)
+        for column, value in zip(self._row_columns(), row[:-1]):
+            column.append(value)
+        self._messages += row[-1]
+        self._message_offsets.append(len(self._messages))
+        self._total_price += Money(self._prices[-1])
+        self._paper_usage.add_quote(quote, breakdown.area, breakdown.paper)
+        return len(self) - 1
+
+    def add_stored_quotes(self, records: typing.Iterable[
+            typing.Sequence[typing.Any]], usage: PaperUsage, /) -> None:
+        # quotes as they were priced and saved (see wpqc_store), column by
+        # column. nothing is repriced, so the order keeps its historical
+        # totals. each record is (title, shape, length_one, length_two,
+        # length_three, paper, colour, bow, message, price in pence, paper
+        # area, paper price in pence), shape and paper as from
+        # Translator.describe_present_type and describe_wrapping_paper_type
+        # and message None without a gift card. usage is the paper usage of
+        # the records, as summed when they were saved.
+        records = list(records)
+        if not records:
+            return
+        (titles, shapes, length_one, length_two, length_three, papers,
+         colours, bows, messages, prices, areas,
+         paper_prices) = zip(*records)
+        shape_codes = {
+            shape_type.name: shape_type.code
+            for shape_type in ShapeRegistry.get_shape_types()}
+        shape_codes[Translator.NONE] = QuoteBatch.SHAPE_NONE
+        paper_codes = {paper: self._get_paper_code(paper)
+                       for paper in set(papers)}
+        colour_codes = {colour: self._get_colour_code(colour)
+                        for colour in set(colours)}
+        self._titles.extend(titles)
+        self._shapes.extend(map(shape_codes.__getitem__, shapes))
+        self._length_one.extend(length_one)
+        self._length_two.extend(length_two)
+        self._length_three.extend(length_three)
+        self._papers.extend(map(paper_codes.__getitem__, papers))
+        self._colours.extend(map(colour_codes.__getitem__, colours))
+        self._flags.extend(
+            (ColumnarOrder.FLAG_BOW if bow else 0)
+            | (0 if message is None else ColumnarOrder.FLAG_GIFT_CARD)
+            for bow, message in zip(bows, messages))
+        encoded = [b"" if message is None else message.encode("utf-8")
+                   for message in messages]
+        # the offset the accumulation starts from is already there.
+        self._message_offsets.extend(itertools.islice(itertools.accumulate(
+            map(len, encoded), initial=len(self._messages)), 1, None))
+        self._messages += b"".join(encoded)
+        self._prices.extend(prices)
+        self._paper_areas.extend(areas)
+        self._paper_prices.extend(paper_prices)
+        self._total_price += Money(sum(prices))
+        self._paper_usage.merge(usage)
+
+    def replace_quote(self, index: int, quote: Quote, /) -> None:
+        index = range(len(self))[index]
+        breakdown = _price_cache.get_price_breakdown(quote)
+        row = self._encode_quote(quote, breakdown)
+        self._remove_paper_usage(index)
+        self._total_price -= Money(self._prices[index])
+        self._titles[index] = quote.title
+        for column, value in zip(self._row_columns(), row[:-1]):
+            column[index] = value
+        self._splice_message(index, row[-1])
+        self._total_price += Money(self._prices[index])
+        self._paper_usage.add_quote(quote, breakdown.area, breakdown.paper)
+
+    def delete_quote(self, index: int, /) -> None:
+        index = range(len(self))[index]
+        self._remove_paper_usage(index)
+        self._total_price -= Money(self._prices[index])
+        self._splice_message(index, b"")
+        del self._titles[index]
+        for column in self._row_columns():
+            del column[index]
+        del self._message_offsets[index + 1]
+
+    def _remove_paper_usage(self, index: int, /) -> None:
+        self._paper_usage.remove_quote(
+            (self._paper_names[self._papers[index]],
+             self._colour_names[self._colours[index]]),
+            self._paper_areas[index] / WrappingPaper.AREA_SCALE,
+            Money(self._paper_prices[index]))
+
+    def _row_columns(self) -> typing.Tuple[array.array, ...]:
+        # in the order of the values from _encode_quote.
+        return (
+            self._shapes, self._length_one, self._length_two,
+            self._length_three, self._papers, self._colours, self._flags,
+            self._prices, self._paper_areas, self._paper_prices)
+
+    def _encode_quote(self, quote: Quote, breakdown: PriceBreakdown, /
+                      ) -> typing.Tuple[typing.Any, ...]:
+        present = quote.present
+        if (shape_type := ShapeRegistry.find_for(present)) is None:
+            shape = QuoteBatch.SHAPE_NONE
+            dimensions = (0, 0, 0)
+        else:
+            shape = shape_type.code
+            dimensions = present.get_dimensions()
+        grade = Translator.describe_wrapping_paper_type(quote.wrapping_paper)
+        # rows keep only the grade, so it must be read back from the
+        # catalogue, see QuoteView.wrapping_paper.
+        if (grade not in self._paper_codes
+                and get_catalogue().get_grade(grade) is None):
+            raise ValueError(f"Paper not in the catalogue: {grade}")
+        paper = self._get_paper_code(grade)
+        code = self._get_colour_code(quote.wrapping_paper.get_colour())
+        flags = 0
+        message = b""
+        if isinstance(quote.bow, Bow):
+            flags |= ColumnarOrder.FLAG_BOW
+        if isinstance(quote.gift_card, GiftCard):
+            flags |= ColumnarOrder.FLAG_GIFT_CARD
+            message = quote.gift_card.get_message().encode("utf-8")
+        return (shape, *dimensions, paper, code, flags,
+                breakdown.total.get_pence(),
+                round(max(breakdown.area, 0) * WrappingPaper.AREA_SCALE),
+                breakdown.paper.get_pence(), message)
+
+    def _get_paper_code(self, grade: str, /) -> int:
+        if (code := self._paper_codes.get(grade)) is None:
+            code = self._paper_codes[grade] = len(self._paper_names)
+            self._paper_names.append(grade)
+        return code
+
+    def _get_colour_code(self, colour: str, /) -> int:
+        if (code := self._colour_codes.get(colour)) is None:
+            code = self._colour_codes[colour] = len(self._colour_names)
+            self._colour_names.append(colour)
+        return code
+
+    def _splice_message(self, index: int, message: bytes, /) -> None:
+        start = self._message_offsets[index]
+        end = self._message_offsets[index + 1]
+        self._messages[start:end] = message
+        if (change := len(message) - (end - start)):
+            offsets = self._message_offsets
+            for position in range(index + 1, len(offsets)):
+                offsets[position] += change
+
+
+# the user input translation.
 
 
 class Translator:
@@ -377,12 +1815,19 @@ class Translator:
     CUBE: str = "cube"
     CUBOID: str = "cuboid"
     CYLINDER: str = "cylinder"
+    SPHERE: str = "sphere"
+    TRIANGULAR_PRISM: str = "triangularprism"
     CHEAP_WRAPPING: str = "cheap"
     EXPENSIVE_WRAPPING: str = "expensive"
     BOW: str = "bow"
     GIFT_CARD: str = "giftcard"
     NONE: str = "none"
 
+    # papers and bows hold no per-quote state, so quotes built here share
+    # one instance of each, which must not be changed through a quote.
+    _shared_papers: typing.Dict[typing.Tuple[str, str], WrappingPaper] = {}
+    _shared_bow: Bow = None
+
     @staticmethod
     def check_quote_title(title: str, /) -> str:
         if title == "":
@@ -403,74 +1848,66 @@ class Translator:
             dimension_three = abs(float(length_three))
         except ValueError:
             return None
-        if shape == Translator.CUBE:
-            return Cube(
-                length=dimension_one)
-        elif shape == Translator.CUBOID:
-            return Cuboid(
-                width=dimension_one,
-                height=dimension_two,
-                depth=dimension_three)
-        elif shape == Translator.CYLINDER:
-            return Cylinder(
-                radius=dimension_one,
-                depth=dimension_two)
-        else:
+        if not (math.isfinite(dimension_one) and math.isfinite(dimension_two)
+                and math.isfinite(dimension_three)):
+            return None
+        if (shape_type := ShapeRegistry.find_by_name(shape)) is None:
             return None
+        return shape_type.present_type.from_dimensions(
+            dimension_one, dimension_two, dimension_three)
+
+    @staticmethod
+    def describe_present_type(
+            shape: PresentType, /
+            ) -> typing.Tuple[str, float, float, float]:
+        # the reverse of translate_present_type.
+        if (shape_type := ShapeRegistry.find_for(shape)) is None:
+            return Translator.NONE, 0, 0, 0
+        return (shape_type.name, *shape.get_dimensions())
 
     @staticmethod
     def check_present_lengths(shape: PresentType, /) -> int:
-        if isinstance(shape, Cube):
-            if (shape.get_length() <= 0):
-                return 1
-        elif isinstance(shape, Cuboid):
-            if (shape.get_width() <= 0 or shape.get_height() <= 0
-                    or shape.get_depth() <= 0):
-                return 1
-        elif isinstance(shape, Cylinder):
-            if (shape.get_depth() <= 0 or shape.get_radius() <= 0):
+        # every dimension the shape uses must be finite and above 0.
+        if (shape_type := ShapeRegistry.find_for(shape)) is None:
+            return 0
+        for dimension in shape.get_dimensions()[:len(shape_type.dimensions)]:
+            if not (dimension > 0 and math.isfinite(dimension)):
                 return 1
         return 0
 
     @staticmethod
     def translate_wrapping_paper_type(*, paper: str,
                                       colour: str) -> WrappingPaper:
-        if paper == Translator.CHEAP_WRAPPING:
-            return CheapWrappingPaper(colour)
-        elif paper == Translator.EXPENSIVE_WRAPPING:
-            return ExpensiveWrappingPaper(colour)
-        else:
+        if (shared := Translator._shared_papers.get((paper, colour))):
+            return shared
+        catalogue = get_catalogue()
+        if (grade := catalogue.get_grade(paper)) is None:
             return None
+        wrapping_paper = WrappingPaper(
+            colour, grade.price_cm_sq, grade=grade.name)
+        # only the catalogue colours are shared, so free-form colours
+        # cannot grow the table without bound.
+        if catalogue.has_colour(colour):
+            Translator._shared_papers[(paper, colour)] = wrapping_paper
+        return wrapping_paper
+
+    @staticmethod
+    def describe_wrapping_paper_type(paper: WrappingPaper, /) -> str:
+        # the reverse of translate_wrapping_paper_type.
+        if isinstance(paper, WrappingPaper):
+            return paper.get_grade()
+        return Translator.NONE
 
     @staticmethod
     def translate_colour(colour: str, /, *,
                          human_readable: bool = True) -> str:
+        # a colour name to its label, or with human_readable=False a label
+        # back to its name; "#000000" (black) when not in the catalogue.
         if human_readable:
-            try:
-                return WrappingPaper.colours[colour]
-            except Exception:
-                return "#000000"
+            result = get_catalogue().get_colour_label(colour)
         else:
-            if (colour == WrappingPaper.colours[
-                    WrappingPaper.PRESET_PURPLE]):
-                return WrappingPaper.PRESET_PURPLE
-            elif (colour == WrappingPaper.colours[
-                    WrappingPaper.PRESET_DARK_SLATE_GREY]):
-                return WrappingPaper.PRESET_DARK_SLATE_GREY
-            elif (colour == WrappingPaper.colours[
-                    WrappingPaper.PRESET_DEEP_SKY_BLUE]):
-                return WrappingPaper.PRESET_DEEP_SKY_BLUE
-            elif (colour == WrappingPaper.colours[
-                    WrappingPaper.PRESET_LIGHT_SEA_GREEN]):
-                return WrappingPaper.PRESET_LIGHT_SEA_GREEN
-            elif (colour == WrappingPaper.colours[
-                    WrappingPaper.PRESET_VIOLET_RED]):
-                return WrappingPaper.PRESET_VIOLET_RED
-            elif (colour == WrappingPaper.colours[
-                    WrappingPaper.PRESET_GOLD]):
-                return WrappingPaper.PRESET_GOLD
-            else:
-                return "#000000"
+            result = get_catalogue().get_colour_name(colour)
+        return "#000000" if result is None else result
 
     @staticmethod
     def translate_gift_card(*, gift_card: int, message: str) -> GiftCard:
@@ -482,1135 +1919,531 @@ class Translator:
     @staticmethod
     def translate_bow(*, bow: int) -> Bow:
         if bow:
-            return Bow()
+            if Translator._shared_bow is None:
+                Translator._shared_bow = Bow()
+            return Translator._shared_bow
         else:
             return None
 
 
-class ColourScheme:
-    # storage class
-
-    WHITE: str = "#FFFFFF"
-    BLACK: str = "#000000"
-    GREY: str = "#F6F6F6"
-    LIGHT_MINT_GREEN: str = "#00858E"
-    DARK_MINT_GREEN: str = "#00585E"
-    RED: str = "#FF0000"
-
-
-class WindowHeader(tk.Frame):
-
-    def __init__(self, parent: tk.Tk, /) -> None:
-        super().__init__(parent)
-        self.config(
-            bg=ColourScheme.WHITE, padx=15, pady=10)
-        self._construct()
-        self._display()
-
-    def _construct(self) -> None:
-        self._header_text = tk.StringVar()
-        self._header_title = tk.Label(self)
-        self._header_title.config(
-            bg=ColourScheme.WHITE, fg=ColourScheme.DARK_MINT_GREEN,
-            font="helvetica 14 bold", textvariable=self._header_text)
-
-    def _display(self) -> None:
-        self._header_title.pack(anchor="w", side="top")
-
-    def set_title(self, title: str, /) -> None:
-        self._header_text.set(title)
-
-
-class QuoteSummaryPane(tk.Frame):
-
-    def __init__(self, parent: tk.Tk, /):
-        super().__init__(parent)
-        self._shape_displayed: str = Translator.NONE
-        self._pattern_displayed: str = Translator.NONE
-        self._colour_displayed: str = "#000000"
-        self.config(
-            bg=ColourScheme.WHITE, height=100, padx=15, pady=15)
-        self._construct()
-        self._display()
-
-    def _construct(self) -> None:
-        self._shape_preview = tk.Canvas(self)
-        self._shape_preview.config(
-            bg=ColourScheme.WHITE, height=100, width=100)
-        self._pattern_preview = tk.Canvas(self)
-        self._pattern_preview.config(
-            bg=ColourScheme.WHITE, height=100, width=100)
-        self._info_container = tk.Frame(self)
-        self._info_container.config(
-            bg=ColourScheme.WHITE, padx=10, pady=10)
-        self._title = tk.StringVar()
-        self._quote_title = tk.Label(self._info_container)
-        self._quote_title.config(
-            bg=ColourScheme.WHITE, font="helvetica 10 bold",
-            textvariable=self._title)
-        self._shape = tk.StringVar()
-        self._quote_shape = tk.Label(self._info_container)
-        self._quote_shape.config(
-            bg=ColourScheme.WHITE, font="helvetica 10",
-            textvariable=self._shape)
-        self._paper = tk.StringVar()
-        self._quote_paper = tk.Label(self._info_container)
-        self._quote_paper.config(
-            bg=ColourScheme.WHITE, font="helvetica 10",
-            textvariable=self._paper)
-        self._additional = tk.StringVar()
-        self._quote_additional = tk.Label(self._info_container)
-        self._quote_additional.config(
-            bg=ColourScheme.WHITE, font="helvetica 10",
-            textvariable=self._additional)
-
-    def _display(self) -> None:
-        self._shape_preview.pack(
-            anchor="w", side="left")
-        self._pattern_preview.pack(
-            anchor="w", padx=10, side="left")
-        self._info_container.pack(
-            anchor="nw", fill="both", side="left")
-        self._quote_title.pack(
-            anchor="nw", side="top")
-        self._quote_shape.pack(
-            anchor="nw", side="top")
-        self._quote_paper.pack(
-            anchor="nw", side="top")
-        self._quote_additional.pack(
-            anchor="nw", side="top")
-
-    def get_shape_displayed(self) -> str:
-        return self._shape_displayed
-
-    def set_shape_displayed(self, shape: str, /) -> None:
-        self._shape_displayed = shape
-
-    def get_pattern_displayed(self) -> str:
-        return self._pattern_displayed
-
-    def set_pattern_displayed(self, pattern: str, /) -> None:
-        self._pattern_displayed = pattern
-
-    def get_colour_displayed(self) -> str:
-        return self._colour_displayed
-
-    def set_colour_displayed(self, colour: str, /) -> None:
-        self._colour_displayed = colour
-
-    def set_quote_title(self, price: float, title: str, /) -> None:
-        self._title.set(f"£{price:.2f}     {title}")
-
-    def set_quote_shape(self, shape: PresentType, /) -> None:
-        if shape.get_recommended_area() > 0:
-            self._shape.set(str(shape))
-            if isinstance(shape, Cube):
-                self.preview_cube_shape()
-            elif isinstance(shape, Cuboid):
-                self.preview_cuboid_shape()
-            elif isinstance(shape, Cylinder):
-                self.preview_cylinder_shape()
-        else:
-            self._shape.set("Invalid dimensions")
-
-    def set_quote_paper(self, paper: WrappingPaper, /) -> None:
-        self._paper.set(str(paper))
-        self.set_colour_displayed(paper.get_colour())
-        if isinstance(paper, CheapWrappingPaper):
-            self.preview_cheap_pattern()
-        if isinstance(paper, ExpensiveWrappingPaper):
-            self.preview_expensive_pattern()
-
-    def set_additional_options(self, bow: Bow, gift_card: GiftCard, /) -> None:
-        display_string: str = ""
-        if isinstance(bow, Bow):
-            display_string += f"   {str(bow)}"
-        if isinstance(gift_card, GiftCard):
-            display_string += f"   {str(gift_card)}"
-        self._additional.set(display_string)
-
-    def clear_preview(self) -> None:
-        self._shape_preview.delete(tk.ALL)
-        self._pattern_preview.delete(tk.ALL)
-        self._title.set("")
-        self._shape.set("")
-        self._paper.set("")
-        self._additional.set("")
-        self.set_pattern_displayed(Translator.NONE)
-        self.set_shape_displayed(Translator.NONE)
-
-    def preview_cube_shape(self) -> None:
-        self._shape_preview.delete(tk.ALL)
-        self.set_shape_displayed(Translator.CUBE)
-        self._shape_preview.create_rectangle(
-            42, 42, 72, 72, outline="#000000")
-        self._shape_preview.create_rectangle(
-            27, 27, 57, 57, outline="#000000")
-        self._shape_preview.create_line(
-            27, 27, 42, 42, fill="#000000")
-        self._shape_preview.create_line(
-            57, 57, 72, 72, fill="#000000")
-        self._shape_preview.create_line(
-            57, 27, 72, 42, fill="#000000")
-        self._shape_preview.create_line(
-            27, 57, 42, 72, fill="#000000")
-
-    def preview_cuboid_shape(self) -> None:
-        self._shape_preview.delete(tk.ALL)
-        self.set_shape_displayed(Translator.CUBOID)
-        self._shape_preview.create_rectangle(
-            36, 52, 81, 72, outline="#000000")
-        self._shape_preview.create_rectangle(
-            21, 37, 66, 57, outline="#000000")
-        self._shape_preview.create_line(
-            21, 37, 36, 52, fill="#000000")
-        self._shape_preview.create_line(
-            66, 57, 81, 72, fill="#000000")
-        self._shape_preview.create_line(
-            66, 37, 81, 52, fill="#000000")
-        self._shape_preview.create_line(
-            21, 57, 36, 72, fill="#000000")
-
-    def preview_cylinder_shape(self) -> None:
-        self._shape_preview.delete(tk.ALL)
-        self.set_shape_displayed(Translator.CYLINDER)
-        self._shape_preview.create_oval(
-            35, 27, 66, 42, outline="#000000")
-        self._shape_preview.create_oval(
-            35, 57, 66, 72, outline="#000000")
-        self._shape_preview.create_line(
-            35, 34, 35, 67, fill="#000000")
-        self._shape_preview.create_line(
-            66, 34, 66, 67, fill="#000000")
-
-    def preview_cheap_pattern(self) -> None:
-        self._pattern_preview.delete(tk.ALL)
-        self.set_pattern_displayed(Translator.CHEAP_WRAPPING)
-        for num in range(5):
-            if num % 2 == 0:
-                self._pattern_preview.create_rectangle(
-                    0 + (num * 10), 0 + (num * 10),
-                    20 + (num * 10), 20 + (num * 10),
-                    fill=self.get_colour_displayed(),
-                    outline=self.get_colour_displayed())
-                self._pattern_preview.create_rectangle(
-                    80 - (num * 10), 20 + (num * 10),
-                    100 - (num * 10), 0 + (num * 10),
-                    fill=self.get_colour_displayed(),
-                    outline=self.get_colour_displayed())
-                self._pattern_preview.create_rectangle(
-                    100 - (num * 10), 100 - (num * 10),
-                    80 - (num * 10), 80 - (num * 10),
-                    fill=self.get_colour_displayed(),
-                    outline=self.get_colour_displayed())
-                self._pattern_preview.create_rectangle(
-                    0 + (num * 10), 80 - (num * 10),
-                    20 + (num * 10), 100 - (num * 10),
-                    fill=self.get_colour_displayed(),
-                    outline=self.get_colour_displayed())
-            else:
-                self._pattern_preview.create_rectangle(
-                    0 + (num * 10), 0 + (num * 10),
-                    20 + (num * 10), 20 + (num * 10),
-                    fill="#ffffff",
-                    outline=self.get_colour_displayed())
-                self._pattern_preview.create_rectangle(
-                    80 - (num * 10), 20 + (num * 10),
-                    100 - (num * 10), 0 + (num * 10),
-                    fill="#ffffff",
-                    outline=self.get_colour_displayed())
-                self._pattern_preview.create_rectangle(
-                    100 - (num * 10), 100 - (num * 10),
-                    80 - (num * 10), 80 - (num * 10),
-                    fill="#ffffff",
-                    outline=self.get_colour_displayed())
-                self._pattern_preview.create_rectangle(
-                    0 + (num * 10), 80 - (num * 10),
-                    20 + (num * 10), 100 - (num * 10),
-                    fill="#ffffff",
-                    outline=self.get_colour_displayed())
-
-    def preview_expensive_pattern(self) -> None:
-        self._pattern_preview.delete(tk.ALL)
-        self.set_pattern_displayed(Translator.EXPENSIVE_WRAPPING)
-        for num in range(2):
-            self._pattern_preview.create_rectangle(
-                0 + (num * 50), 0 + (num * 50),
-                50 + (num * 50), 50 + (num * 50),
-                fill=self.get_colour_displayed(),
-                outline=self.get_colour_displayed())
-        for num in range(5):
-            if num % 2 == 0:
-                self._pattern_preview.create_rectangle(
-                    50 + (num * 10), 0 - (num * 10),
-                    100 + (num * 10), 50 - (num * 10),
-                    fill="#ffffff",
-                    outline="#000000")
-                self._pattern_preview.create_rectangle(
-                    0 - (num * 10), 50 + (num * 10),
-                    50 - (num * 10), 100 + (num * 10),
-                    fill="#ffffff",
-                    outline="#000000")
-            else:
-                self._pattern_preview.create_rectangle(
-                    50 + (num * 10), 0 - (num * 10),
-                    100 + (num * 10), 50 - (num * 10),
-                    fill=self.get_colour_displayed(),
-                    outline="#000000")
-                self._pattern_preview.create_rectangle(
-                    0 - (num * 10), 50 + (num * 10),
-                    50 - (num * 10), 100 + (num * 10),
-                    fill=self.get_colour_displayed(),
-                    outline="#000000")
-
-
-class QuoteConfigurationWindow(tk.Toplevel):
-
-    window_running_check: bool = False
-
-    @staticmethod
-    def raise_window_running_message() -> None:
-        tkmsg.showinfo(
-            "Information",
-            "An instance of the quote configuration window is open. "
-            + "Please close the previous instance before opening another.")
-
-    def __new__(cls,
-                parent: tk.Tk,
-                new_quote: bool,
-                quote_list: typing.List[Quote],
-                quote_index: int = None, /) -> None:
-        cls.window_running_check = True
-        return super(QuoteConfigurationWindow, cls).__new__(cls)
-
-    def __init__(self,
-                 parent: tk.Tk,
-                 new_quote: bool,
-                 quote_list: typing.List[Quote],
-                 quote_index: int = None, /) -> None:
-        super().__init__(parent)
-        self._new_quote = new_quote
-        self._quote_list = quote_list
-        self._quote_index = quote_index
-        self.minsize(800, 600)
-        self.resizable(False, False)
-        self.title(f"Quote Configuration | {APPLICATION_NAME}")
-        self._avoid_message_box_exit: bool = False
-        self._the_quote: Quote = None
-        self._construct()
-        self._actions()
-        self._track()
-        self._display()
-        self._load_quote()
-
-    def _construct(self) -> None:
-        self._construct_header()
-        self._construct_quote_preview()
-        self._construct_quote_options()
-        self._construct_footer()
-
-    def _construct_header(self) -> None:
-        self._header = WindowHeader(self)
-        self._header.set_title("Quote configuration.")
-
-    def _construct_quote_preview(self) -> None:
-        self._preview_pane = QuoteSummaryPane(self)
-
-    def _construct_quote_options(self) -> None:
-        self._options = tk.Frame(self)
-        self._options.config(
-            bg=ColourScheme.GREY, padx=25, pady=15)
-        self._options_col_shape = tk.Label(self._options)
-        self._options_col_shape.config(
-            bg=ColourScheme.GREY, font="helvetica 10 bold", pady=2,
-            text="Shape")
-        self._options_shape = tk.LabelFrame(self._options)
-        self._options_shape.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Shape Type")
-        self._shape = tk.StringVar()
-        self._shape_cube = tk.Radiobutton(self._options_shape)
-        self._shape_cube.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Cube",
-            value=Translator.CUBE, variable=self._shape)
-        self._shape_cuboid = tk.Radiobutton(self._options_shape)
-        self._shape_cuboid.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Cuboid",
-            value=Translator.CUBOID, variable=self._shape)
-        self._shape_cylinder = tk.Radiobutton(self._options_shape)
-        self._shape_cylinder.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Cylinder",
-            value=Translator.CYLINDER, variable=self._shape)
-        self._options_dimensions = tk.LabelFrame(self._options)
-        self._options_dimensions.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Shape Dimensions")
-        self._length_one = tk.StringVar()
-        self._dimension_one_label = tk.Label(self._options_dimensions)
-        self._dimension_one_label.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text=" - ")
-        self._dimension_one = tk.Entry(self._options_dimensions)
-        self._dimension_one.config(
-            textvariable=self._length_one)
-        self._length_two = tk.StringVar()
-        self._dimension_two_label = tk.Label(self._options_dimensions)
-        self._dimension_two_label.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text=" - ")
-        self._dimension_two = tk.Entry(self._options_dimensions)
-        self._dimension_two.config(
-            textvariable=self._length_two)
-        self._length_three = tk.StringVar()
-        self._dimension_three_label = tk.Label(self._options_dimensions)
-        self._dimension_three_label.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text=" - ")
-        self._dimension_three = tk.Entry(self._options_dimensions)
-        self._dimension_three.config(
-            textvariable=self._length_three)
-        self._options_col_paper = tk.Label(self._options)
-        self._options_col_paper.config(
-            bg=ColourScheme.GREY, font="helvetica 10 bold", pady=2,
-            text="Wrapping Paper")
-        self._options_paper = tk.LabelFrame(self._options)
-        self._options_paper.config(
-            bg=ColourScheme.GREY, padx=5, pady=5,
-            text="Wrapping Paper Type")
-        self._paper = tk.StringVar()
-        self._paper_cheap = tk.Radiobutton(self._options_paper)
-        self._paper_cheap.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Cheap",
-            value=Translator.CHEAP_WRAPPING, variable=self._paper)
-        self._paper_expensive = tk.Radiobutton(self._options_paper)
-        self._paper_expensive.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Expensive",
-            value=Translator.EXPENSIVE_WRAPPING, variable=self._paper)
-        self._options_colour = tk.LabelFrame(self._options)
-        self._options_colour.config(
-            bg=ColourScheme.GREY, padx=5, pady=5,
-            text="Wrapping Paper Colour")
-        self._colour = tk.StringVar()
-        self._colour_selection = ttk.Combobox(self._options_colour)
-        self._colour_selection.config(
-            textvariable=self._colour)
-        self._colour_selection["values"] = [
-            Translator.translate_colour(WrappingPaper.PRESET_DARK_SLATE_GREY),
-            Translator.translate_colour(WrappingPaper.PRESET_DEEP_SKY_BLUE),
-            Translator.translate_colour(WrappingPaper.PRESET_GOLD),
-            Translator.translate_colour(WrappingPaper.PRESET_LIGHT_SEA_GREEN),
-            Translator.translate_colour(WrappingPaper.PRESET_PURPLE),
-            Translator.translate_colour(WrappingPaper.PRESET_VIOLET_RED)]
-        self._colour_selection["state"] = "readonly"
-        self._colour_black_disclaimer = tk.Label(self._options_colour)
-        self._colour_black_disclaimer.config(
-            bg=ColourScheme.GREY, fg=ColourScheme.BLACK,
-            font="helvetica 10 bold", pady=5, text=" ", justify="left")
-        self._options_col_additional = tk.Label(self._options)
-        self._options_col_additional.config(
-            bg=ColourScheme.GREY, font="helvetica 10 bold", pady=2,
-            text="Additional")
-        self._options_bow = tk.LabelFrame(self._options)
-        self._options_bow.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Bow")
-        self._bow = tk.IntVar()
-        self._bow_addition = tk.Checkbutton(self._options_bow)
-        self._bow_addition.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Add Bow",
-            variable=self._bow)
-        self._options_giftcard = tk.LabelFrame(self._options)
-        self._options_giftcard.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Gift Card")
-        self._giftcard = tk.IntVar()
-        self._giftcard_addition = tk.Checkbutton(self._options_giftcard)
-        self._giftcard_addition.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Add Gift Card",
-            variable=self._giftcard)
-        self._giftcard_message_label = tk.Label(self._options_giftcard)
-        self._giftcard_message_label.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Message ")
-        self._giftcard_message = tk.StringVar()
-        self._giftcard_message_entry = tk.Entry(self._options_giftcard)
-        self._giftcard_message_entry.config(
-            textvariable=self._giftcard_message)
-        self._options_quote_id = tk.LabelFrame(self._options)
-        self._options_quote_id.config(
-            bg=ColourScheme.GREY, padx=5, pady=5,
-            text="Quote Identification")
-        self._id_name_label = tk.Label(self._options_quote_id)
-        self._id_name_label.config(
-            bg=ColourScheme.GREY, padx=5, pady=5, text="Quote Name ")
-        self._quote_name = tk.StringVar()
-        self._id_name = tk.Entry(self._options_quote_id)
-        self._id_name.config(
-            textvariable=self._quote_name)
-
-    def _construct_footer(self) -> None:
-        self._footer = tk.Frame(self)
-        self._footer.config(
-            bg=ColourScheme.WHITE, padx=5, pady=5)
-        self._footer_save = tk.Button(self._footer)
-        self._footer_save.config(
-            bg=ColourScheme.DARK_MINT_GREEN, borderwidth=1,
-            fg=ColourScheme.WHITE, font="helvetica 10 bold",
-            highlightthickness=1, highlightcolor=ColourScheme.GREY,
-            padx=10, pady=3, text="Save")
-        self._footer_cancel = tk.Button(self._footer)
-        self._footer_cancel.config(
-            bg=ColourScheme.WHITE, borderwidth=1,
-            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
-            highlightthickness=1, highlightcolor=ColourScheme.GREY,
-            padx=10, pady=3, text="Cancel")
-
-    def _actions(self) -> None:
-        self._shape_cube.config(
-            command=lambda: [
-                self._preview_pane.preview_cube_shape(),
-                self._handle_dimension_display_change()])
-        self._shape_cuboid.config(
-            command=lambda: [
-                self._preview_pane.preview_cuboid_shape(),
-                self._handle_dimension_display_change()])
-        self._shape_cylinder.config(
-            command=lambda: [
-                self._preview_pane.preview_cylinder_shape(),
-                self._handle_dimension_display_change()])
-        self._paper_cheap.config(
-            command=lambda: [
-                self._preview_pane.preview_cheap_pattern(),
-                self._handle_colour_check()])
-        self._paper_expensive.config(
-            command=lambda: [
-                self._preview_pane.preview_expensive_pattern(),
-                self._handle_colour_check()])
-        self._colour_selection.bind(
-            "<<ComboboxSelected>>", lambda event: [
-                self._handle_colour_selection_change(event),
-                self._handle_colour_check()])
-        self._footer_cancel.config(
-            command=self._handle_cancel_button)
-        self._footer_save.config(
-            command=self._handle_save_button)
-
-    def _track(self) -> None:
-        self._quote_name.trace("w", self._handle_callback_quote_update)
-        self._length_one.trace("w", self._handle_callback_quote_update)
-        self._length_two.trace("w", self._handle_callback_quote_update)
-        self._length_three.trace("w", self._handle_callback_quote_update)
-        self._shape.trace("w", self._handle_callback_quote_update)
-        self._paper.trace("w", self._handle_callback_quote_update)
-        self._colour.trace("w", self._handle_callback_quote_update)
-        self._bow.trace("w", self._handle_callback_quote_update)
-        self._giftcard.trace("w", self._handle_callback_quote_update)
-        self._giftcard_message.trace("w", self._handle_callback_quote_update)
-
-    def _display(self) -> None:
-        self._header.pack(
-            anchor="w", fill="x", side="top")
-        self._preview_pane.pack(
-            anchor="nw", fill="x", side="top")
-        self._footer.pack(
-            anchor="e", fill="x", side="bottom")
-        self._footer_save.pack(
-            anchor="e", side="right")
-        self._footer_cancel.pack(
-            anchor="e", padx=10, side="right")
-        self._options.pack(
-            anchor="nw", expand=True, fill="both", side="left")
-        self._options_col_shape.grid(
-            column=0, row=0, padx=5, pady=5)
-        self._options_shape.grid(
-            column=0, row=1, padx=5, pady=5, sticky="nesw")
-        self._shape_cube.grid(
-            column=0, row=0, padx=5, pady=5)
-        self._shape_cuboid.grid(
-            column=1, row=0, padx=5, pady=5)
-        self._shape_cylinder.grid(
-            column=2, row=0, padx=5, pady=5)
-        self._options_dimensions.grid(
-            column=0, row=2, padx=5, pady=5, sticky="nesw")
-        self._dimension_one_label.grid(
-            column=0, row=0, padx=5, pady=5)
-        self._dimension_one.grid(
-            column=1, row=0, padx=5, pady=5)
-        self._dimension_two_label.grid(
-            column=0, row=1, padx=5, pady=5)
-        self._dimension_two.grid(
-            column=1, row=1, padx=5, pady=5)
-        self._dimension_three_label.grid(
-            column=0, row=2, padx=5, pady=5)
-        self._dimension_three.grid(
-            column=1, row=2, padx=5, pady=5)
-        self._options_paper.grid(
-            column=1, row=1, padx=5, pady=5, sticky="nesw")
-        self._paper_cheap.grid(
-            column=0, row=0, padx=5, pady=5)
-        self._paper_expensive.grid(
-            column=1, row=0, padx=5, pady=5)
-        self._options_colour.grid(
-            column=1, row=2, padx=5, pady=5, sticky="nesw")
-        self._colour_selection.grid(
-            column=0, row=0, padx=5, pady=5, sticky="nesw")
-        self._colour_black_disclaimer.grid(
-            column=0, row=1, padx=5, pady=5, sticky="nesw")
-        self._options_col_paper.grid(
-            column=1, row=0, padx=5, pady=5)
-        self._options_col_additional.grid(
-            column=2, row=0, padx=5, pady=5)
-        self._options_bow.grid(
-            column=2, row=1, padx=5, pady=5, sticky="nesw")
-        self._bow_addition.grid(
-            column=0, row=0, padx=5, pady=5)
-        self._options_giftcard.grid(
-            column=2, row=2, padx=5, pady=5, sticky="nesw")
-        self._giftcard_addition.grid(
-            column=0, row=0, padx=5, pady=5)
-        self._giftcard_message_label.grid(
-            column=0, row=1, padx=5, pady=5)
-        self._giftcard_message_entry.grid(
-            column=1, row=1, padx=5, pady=5)
-        self._options_quote_id.grid(
-            column=0, row=3, columnspan=3, padx=5, pady=5, sticky="nesw")
-        self._id_name_label.grid(
-            column=0, row=0, padx=5, pady=5)
-        self._id_name.grid(
-            column=1, row=0, padx=5, pady=5)
-
-    def _handle_dimension_display_change(self) -> None:
-        if self._shape.get() == Translator.CUBE:
-            self._dimension_one_label.config(
-                text="Length (cm)   ")
-            self._dimension_two_label.config(
-                text=" ")
-            self._dimension_two.config(
-                state="disabled")
-            self._dimension_three_label.config(
-                text=" ")
-            self._dimension_three.config(
-                state="disabled")
-        elif self._shape.get() == Translator.CUBOID:
-            self._dimension_one_label.config(
-                text="Width (cm)   ")
-            self._dimension_two_label.config(
-                text="Height (cm)   ")
-            self._dimension_two.config(
-                state="normal")
-            self._dimension_three_label.config(
-                text="Depth (cm)   ")
-            self._dimension_three.config(
-                state="normal")
-        elif self._shape.get() == Translator.CYLINDER:
-            self._dimension_one_label.config(
-                text="Radius (cm)   ")
-            self._dimension_two_label.config(
-                text="Depth (cm)   ")
-            self._dimension_two.config(
-                state="normal")
-            self._dimension_three_label.config(
-                text=" ")
-            self._dimension_three.config(
-                state="disabled")
-
-    def _handle_colour_selection_change(self, event: tk.Event, /) -> None:
-        self._preview_pane.set_colour_displayed(
-            Translator.translate_colour(
-                self._colour.get(), human_readable=False))
-        if self._paper.get() == Translator.CHEAP_WRAPPING:
-            self._preview_pane.preview_cheap_pattern()
-        elif self._paper.get() == Translator.EXPENSIVE_WRAPPING:
-            self._preview_pane.preview_expensive_pattern()
-
-    def _handle_colour_check(self) -> None:
-        if self._preview_pane.get_colour_displayed() == "#000000":
-            self._colour_black_disclaimer.config(
-                text=(
-                    "Please Note:\n"
-                    + "   Black is not a wrapping\n   paper colour option."))
-        else:
-            self._colour_black_disclaimer.config(text=" ")
-
-    def _handle_callback_quote_update(self, var, index, mode) -> int:
-        ready_to_calculate: bool = True
-        the_shape: PresentType = Translator.translate_present_type(
-            shape=self._shape.get(),
-            length_one=self._length_one.get(),
-            length_two=self._length_two.get(),
-            length_three=self._length_three.get())
-        the_paper: WrappingPaper = Translator.translate_wrapping_paper_type(
-            paper=self._paper.get(),
-            colour=self._preview_pane.get_colour_displayed())
-        the_gift_card: GiftCard = Translator.translate_gift_card(
-            gift_card=self._giftcard.get(),
-            message=self._giftcard_message.get())
-        the_bow: Bow = Translator.translate_bow(bow=self._bow.get())
-        if (not the_shape) or (not the_paper):
-            ready_to_calculate = False
-            return 1
-        if ready_to_calculate:
-            self._the_quote = Quote(
-                quote_title=self._quote_name.get(),
-                present_type=the_shape,
-                wrapping_paper=the_paper,
-                gift_card=the_gift_card,
-                bow=the_bow)
-            self._preview_pane.set_quote_title(
-                self._the_quote.calculate_price(),
-                self._quote_name.get())
-            self._preview_pane.set_quote_shape(
-                the_shape)
-        if self._preview_pane.get_colour_displayed() == "#000000":
-            return 2
-        if Translator.check_present_lengths(the_shape):
-            return 3
-        if the_shape.get_recommended_area() <= 0:
-            return 3
-        return 0
-
-    def _handle_cancel_button(self) -> None:
-        self._avoid_message_box_exit = True
-        self.destroy()
-
-    def _handle_save_button(self) -> None:
-        self._avoid_message_box_exit = True
-        if not self._check_quote():
-            self._save_quote()
-            self.destroy()
-
-    def _check_quote(self) -> int:
-        if (value := self._handle_callback_quote_update(None, None, None)):
-            if value == 1:
-                tkmsg.showerror(
-                    "Quote Error",
-                    "This quote is not complete.")
-            elif value == 2:
-                tkmsg.showerror(
-                    "Quote Error",
-                    "Invalid wrapping paper colour within the quote..")
-            elif value == 3:
-                tkmsg.showerror(
-                    "Quote Error",
-                    "Invalid dimensions provided for present.")
-            return 1
-        return 0
-
-    def _load_quote(self) -> None:
-        self._length_one.set("0")
-        self._length_two.set("0")
-        self._length_three.set("0")
-        if not self._new_quote:
-            self._quote_name.set(self._quote_list[self._quote_index].title)
-            if isinstance(self._quote_list[self._quote_index].present,
-                          Cube):
-                self._shape.set(Translator.CUBE)
-                self._preview_pane.preview_cube_shape()
-                self._length_one.set(
-                    str(self._quote_list[
-                            self._quote_index].present.get_length()))
-            elif isinstance(self._quote_list[self._quote_index].present,
-                            Cuboid):
-                self._shape.set(Translator.CUBOID)
-                self._preview_pane.preview_cuboid_shape()
-                self._length_one.set(
-                    str(self._quote_list[
-                            self._quote_index].present.get_width()))
-                self._length_two.set(
-                    str(self._quote_list[
-                            self._quote_index].present.get_height()))
-                self._length_three.set(
-                    str(self._quote_list[
-                            self._quote_index].present.get_depth()))
-            elif isinstance(self._quote_list[self._quote_index].present,
-                            Cylinder):
-                self._shape.set(Translator.CYLINDER)
-                self._preview_pane.preview_cylinder_shape()
-                self._length_one.set(
-                    str(self._quote_list[
-                            self._quote_index].present.get_radius()))
-                self._length_two.set(
-                    str(self._quote_list[
-                            self._quote_index].present.get_depth()))
-            self._preview_pane.set_colour_displayed(
-                self._quote_list[
-                    self._quote_index].wrapping_paper.get_colour())
-            self._colour.set(WrappingPaper.colours[
-                self._preview_pane.get_colour_displayed()])
-            if isinstance(self._quote_list[self._quote_index].wrapping_paper,
-                          CheapWrappingPaper):
-                self._paper.set(Translator.CHEAP_WRAPPING)
-                self._preview_pane.preview_cheap_pattern()
-            elif isinstance(self._quote_list[self._quote_index].wrapping_paper,
-                            ExpensiveWrappingPaper):
-                self._paper.set(Translator.EXPENSIVE_WRAPPING)
-                self._preview_pane.preview_expensive_pattern()
-            if isinstance(self._quote_list[self._quote_index].bow,
-                          Bow):
-                self._bow.set(1)
-            if isinstance(self._quote_list[self._quote_index].gift_card,
-                          GiftCard):
-                self._giftcard.set(1)
-                self._giftcard_message.set(
-                    self._quote_list[
-                        self._quote_index].gift_card.get_message())
-            self._handle_dimension_display_change()
-
-    def _save_quote(self) -> None:
-        if not self._new_quote:
-            self._quote_list[self._quote_index].title = (
-                Translator.check_quote_title(self._quote_name.get()))
-            del self._quote_list[self._quote_index].present
-            self._quote_list[self._quote_index].present = (
-                Translator.translate_present_type(
-                    shape=self._preview_pane.get_shape_displayed(),
-                    length_one=self._length_one.get(),
-                    length_two=self._length_two.get(),
-                    length_three=self._length_three.get()))
-            del self._quote_list[self._quote_index].wrapping_paper
-            self._quote_list[self._quote_index].wrapping_paper = (
-                Translator.translate_wrapping_paper_type(
-                    paper=self._preview_pane.get_pattern_displayed(),
-                    colour=self._preview_pane.get_colour_displayed()))
-            if isinstance(self._quote_list[self._quote_index].bow, Bow):
-                del self._quote_list[self._quote_index].bow
-            self._quote_list[self._quote_index].bow = (
-                Translator.translate_bow(bow=self._bow.get()))
-            if isinstance(self._quote_list[self._quote_index].gift_card,
-                          GiftCard):
-                del self._quote_list[self._quote_index].gift_card
-            self._quote_list[self._quote_index].gift_card = (
-                Translator.translate_gift_card(
-                    gift_card=self._giftcard.get(),
-                    message=self._giftcard_message.get()))
-        else:
-            self._quote_list.append(
-                Quote(
-                    quote_title=Translator.check_quote_title(
-                        self._quote_name.get()),
-                    present_type=Translator.translate_present_type(
-                        shape=self._preview_pane.get_shape_displayed(),
-                        length_one=self._length_one.get(),
-                        length_two=self._length_two.get(),
-                        length_three=self._length_three.get()),
-                    wrapping_paper=Translator.translate_wrapping_paper_type(
-                        paper=self._preview_pane.get_pattern_displayed(),
-                        colour=self._preview_pane.get_colour_displayed()),
-                    gift_card=Translator.translate_gift_card(
-                        gift_card=self._giftcard.get(),
-                        message=self._giftcard_message.get()),
-                    bow=Translator.translate_bow(
-                        bow=self._bow.get())))
-
-    def destroy(self) -> None:
-        if not self._avoid_message_box_exit:
-            result = tkmsg.askyesnocancel(
-                "Save Quote?",
-                "Would you want save the current quote?")
-            if result:
-                if self._check_quote():
-                    return
-                self._save_quote()
-            elif result is None:
-                return
-        __class__.window_running_check = False
-        self.master.update()
-        return super().destroy()
-
-
-class MainWindow(tk.Tk):
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.minsize(800, 600)
-        self.title(f"Main Window | {APPLICATION_NAME}")
-        self._order_count: int = 1
-        self._order = Order(self._order_count)
-        self._ask_export: bool = True
-        self._selected_index: int = -1
-        self._currently_editing_index: int = -1
-        self._construct()
-        self._actions()
-        self._display()
-
-    def _construct(self) -> None:
-        self._construct_header()
-        self._construct_sidebar()
-        self._construct_quote_viewer()
-
-    def _construct_header(self) -> None:
-        self._header = WindowHeader(self)
-        self._header.set_title("Current quotes for this order.")
-
-    def _construct_sidebar(self) -> None:
-        self._sidebar = tk.Frame(self)
-        self._sidebar.config(
-            bg=ColourScheme.WHITE, padx=15, pady=15, width=100)
-        self._sidebar_quote_actions = tk.Label(self._sidebar)
-        self._sidebar_quote_actions.config(
-            bg=ColourScheme.WHITE, font="helvetica 11 bold",
-            text="Quote actions")
-        self._sidebar_add_quote = tk.Button(self._sidebar)
-        self._sidebar_add_quote.config(
-            bg=ColourScheme.WHITE, borderwidth=0,
-            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
-            text="Add quote")
-        self._sidebar_edit_quote = tk.Button(self._sidebar)
-        self._sidebar_edit_quote.config(
-            bg=ColourScheme.WHITE, borderwidth=0,
-            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
-            text="Edit quote")
-        self._sidebar_del_quote = tk.Button(self._sidebar)
-        self._sidebar_del_quote.config(
-            bg=ColourScheme.WHITE, borderwidth=0,
-            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
-            text="Delete quote")
-        self._sidebar_actions_seperator = tk.Frame(self._sidebar)
-        self._sidebar_actions_seperator.config(
-            bg=ColourScheme.WHITE, height=20)
-        self._sidebar_order_actions = tk.Label(self._sidebar)
-        self._sidebar_order_actions.config(
-            bg=ColourScheme.WHITE, font="helvetica 11 bold",
-            text="Order actions")
-        self._sidebar_export_order = tk.Button(self._sidebar)
-        self._sidebar_export_order.config(
-            bg=ColourScheme.WHITE, borderwidth=0,
-            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
-            text="Export order")
-        self._sidebar_new_order = tk.Button(self._sidebar)
-        self._sidebar_new_order.config(
-            bg=ColourScheme.WHITE, borderwidth=0,
-            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
-            text="New order")
-        self._sidebar_checkout = tk.Button(self._sidebar)
-        self._sidebar_checkout.config(
-            bg=ColourScheme.WHITE, borderwidth=0,
-            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
-            text="Checkout")
-        self._sidebar_version = tk.Label(self._sidebar)
-        self._sidebar_version.config(
-            bg=ColourScheme.WHITE, font="helvetica 9", text="Version")
-        self._sidebar_version_number = tk.Label(self._sidebar)
-        self._sidebar_version_number.config(
-            bg=ColourScheme.WHITE, font="helvetica 9",
-            text=APPLICATION_VERSION)
-
-    def _construct_quote_viewer(self) -> None:
-        self._quotes_frame = tk.Frame(self)
-        self._quotes_frame.config(bg=ColourScheme.GREY, padx=15, pady=15)
-        self._order_details = tk.StringVar()
-        self._order_summary = tk.Label(self._quotes_frame)
-        self._order_summary.config(
-            bg=ColourScheme.GREY, borderwidth=0, fg=ColourScheme.BLACK,
-            font="helvetica 11 bold", textvariable=self._order_details)
-        self._order_details.set(
-            f"Order {self._order.get_order_number()}     "
-            + f"      {len(self._order.quotes)} Quote(s)     "
-            + f"      £{self._order.calculate_total_price():.2f}")
-        self._quotes_listbox = tk.Listbox(self._quotes_frame)
-        self._quotes_listbox.config(font="helvetica 10")
-        self._quote_preview_pane = QuoteSummaryPane(self._quotes_frame)
-
-    def _actions(self) -> None:
-        self._sidebar_add_quote.config(
-            command=lambda: self._handle_add_quote())
-        self._sidebar_edit_quote.config(
-            command=lambda: self._handle_edit_quote())
-        self._sidebar_del_quote.config(
-            command=lambda: self._handle_delete_quote())
-        self._sidebar_export_order.config(
-            command=lambda: self._handle_export_order())
-        self._sidebar_new_order.config(
-            command=lambda: self._handle_new_order())
-        self._sidebar_checkout.config(
-            command=lambda: self._handle_checkout())
-        self._quotes_listbox.bind(
-            "<<ListboxSelect>>", self._handle_quote_selection_change)
-
-    def _display(self) -> None:
-        self._header.pack(
-            anchor="w", fill="x", side="top")
-        self._sidebar.pack(
-            anchor="nw", fill="y", side="left")
-        self._sidebar_quote_actions.pack(
-            anchor="nw", side="top")
-        self._sidebar_add_quote.pack(
-            anchor="nw", side="top")
-        self._sidebar_edit_quote.pack(
-            anchor="nw", side="top")
-        self._sidebar_del_quote.pack(
-            anchor="nw", side="top")
-        self._sidebar_actions_seperator.pack(
-            anchor="nw", side="top")
-        self._sidebar_order_actions.pack(
-            anchor="nw", side="top")
-        self._sidebar_export_order.pack(
-            anchor="nw", side="top")
-        self._sidebar_new_order.pack(
-            anchor="nw", side="top")
-        self._sidebar_checkout.pack(
-            anchor="nw", side="top")
-        self._sidebar_version_number.pack(
-            anchor="nw", side="bottom")
-        self._sidebar_version.pack(
-            anchor="nw", side="bottom")
-        self._quotes_frame.pack(
-            anchor="nw", expand=True, fill="both", side="top")
-        self._quote_preview_pane.pack(
-            anchor="nw", fill="x", side="bottom")
-        self._order_summary.pack(
-            anchor="nw", side="top")
-        self._quotes_listbox.pack(
-            anchor="nw", expand=True, fill="both", pady=10, side="top")
-
-    def _handle_quote_update(self) -> None:
-        self._ask_export = True
-        self._quotes_listbox.delete(0, "end")
-        for i in range(len(self._order.quotes)):
-            self._quotes_listbox.insert(
-                i, f" {str(self._order.quotes[i])}")
-        self._order_details.set(
-            f"Order {self._order.get_order_number()}     "
-            + f"      {len(self._order.quotes)} Quote(s)     "
-            + f"      £{self._order.calculate_total_price():.2f}")
-
-    def _handle_add_quote(self) -> None:
-        if not QuoteConfigurationWindow.window_running_check:
-            quote_config_window = QuoteConfigurationWindow(
-                self, True, self._order.quotes, len(self._order.quotes))
+# the shapes on offer, see ShapeRegistry.
+
+
+for _shape_type in (
+        ShapeType(
+            QuoteBatch.SHAPE_CUBE, Translator.CUBE, "Cube", Cube,
+            ("Length (cm)",),
+            (("rectangle", (42, 42, 72, 72)),
+             ("rectangle", (27, 27, 57, 57)),
+             ("line", (27, 27, 42, 42)), ("line", (57, 57, 72, 72)),
+             ("line", (57, 27, 72, 42)), ("line", (27, 57, 42, 72)))),
+        ShapeType(
+            QuoteBatch.SHAPE_CUBOID, Translator.CUBOID, "Cuboid", Cuboid,
+            ("Width (cm)", "Height (cm)", "Depth (cm)"),
+            (("rectangle", (36, 52, 81, 72)),
+             ("rectangle", (21, 37, 66, 57)),
+             ("line", (21, 37, 36, 52)), ("line", (66, 57, 81, 72)),
+             ("line", (66, 37, 81, 52)), ("line", (21, 57, 36, 72)))),
+        ShapeType(
+            QuoteBatch.SHAPE_CYLINDER, Translator.CYLINDER, "Cylinder",
+            Cylinder, ("Radius (cm)", "Depth (cm)"),
+            (("oval", (35, 27, 66, 42)), ("oval", (35, 57, 66, 72)),
+             ("line", (35, 34, 35, 67)), ("line", (66, 34, 66, 67)))),
+        ShapeType(
+            QuoteBatch.SHAPE_SPHERE, Translator.SPHERE, "Sphere", Sphere,
+            ("Radius (cm)",),
+            (("oval", (30, 30, 70, 70)), ("oval", (30, 45, 70, 55)))),
+        ShapeType(
+            QuoteBatch.SHAPE_TRIANGULAR_PRISM, Translator.TRIANGULAR_PRISM,
+            "Triangular Prism", TriangularPrism,
+            ("Side (cm)", "Length (cm)"),
+            (("polygon", (40, 60, 60, 25, 80, 60)),
+             ("polygon", (20, 75, 40, 40, 60, 75)),
+             ("line", (20, 75, 40, 60)), ("line", (40, 40, 60, 25)),
+             ("line", (60, 75, 80, 60))))):
+    ShapeRegistry.register(_shape_type)
+del _shape_type
+
+
+# the instrumentation, see wpqc_metrics.
+
+
+wpqc_metrics.register(Quote, "calculate_price", "calculate_price_breakdown")
+wpqc_metrics.register(PriceCache, "get_price_breakdown")
+wpqc_metrics.register(Order, "export_order")
+wpqc_metrics.register(OrderSnapshot, "export_order")
+wpqc_metrics.register(
+    Translator, "translate_present_type", "translate_wrapping_paper_type",
+    "translate_colour", "translate_gift_card", "translate_bow")
+
+
+# the headless interface.
+
+
+HEADLESS_FIELDS: typing.Tuple[str, ...] = (
+    "title", "shape", "length_one", "length_two", "length_three",
+    "paper", "colour", "bow", "gift_card", "message")
+HEADLESS_OUTPUT_FIELDS: typing.Tuple[str, ...] = (
+    HEADLESS_FIELDS + ("area", "paper_price", "price"))
+HEADLESS_REJECT_FIELDS: typing.Tuple[str, ...] = (
+    ("line",) + HEADLESS_FIELDS + ("reason",))
+# rows handed to a worker process at a time, see _price_quote_file.
+HEADLESS_CHUNK_ROWS: int = 20000
+
+
+def _headless_flag(value: typing.Any, /) -> int:
+    return int(str(value).strip().lower() in ("1", "true", "yes", "y"))
+
+
+def _headless_colour(colour: str, /) -> str:
+    # a catalogue colour name or label.
+    if get_catalogue().has_colour(colour):
+        return colour
+    return Translator.translate_colour(colour, human_readable=False)
+
+
+def _has_non_finite_length(lengths: typing.Iterable[str], /) -> bool:
+    # "nan" and "inf" parse as floats but are not dimensions.
+    for length in lengths:
+        try:
+            if not math.isfinite(float(length)):
+                return True
+        except ValueError:
+            pass
+    return False
+
+
+def translate_quote_row(
+        row: typing.Mapping[str, typing.Any], /
+        ) -> typing.Tuple[Quote, str]:
+    def field(name: str) -> str:
+        value = row.get(name)
+        return "" if value is None else str(value).strip()
+
+    lengths = (
+        field("length_one") or "0", field("length_two") or "0",
+        field("length_three") or "0")
+    the_shape: PresentType = Translator.translate_present_type(
+        shape=field("shape").lower(),
+        length_one=lengths[0],
+        length_two=lengths[1],
+        length_three=lengths[2])
+    if the_shape is None and _has_non_finite_length(lengths):
+        return None, "Invalid dimensions provided for present."
+    colour: str = _headless_colour(field("colour"))
+    the_paper: WrappingPaper = Translator.translate_wrapping_paper_type(
+        paper=field("paper").lower(),
+        colour=colour)
+    if (not the_shape) or (not the_paper):
+        return None, "This quote is not complete."
+    if colour == "#000000":
+        return None, "Invalid wrapping paper colour within the quote."
+    if (Translator.check_present_lengths(the_shape)
+            or the_shape.get_recommended_area() <= 0):
+        return None, "Invalid dimensions provided for present."
+    return Quote(
+        quote_title=Translator.check_quote_title(field("title")),
+        present_type=the_shape,
+        wrapping_paper=the_paper,
+        gift_card=Translator.translate_gift_card(
+            gift_card=_headless_flag(field("gift_card")),
+            message=field("message")),
+        bow=Translator.translate_bow(bow=_headless_flag(field("bow")))), ""
+
+
+def describe_price_breakdown(title: str, breakdown: PriceBreakdown, /
+                             ) -> typing.Dict[str, str]:
+    # the priced columns of a headless output row.
+    return {
+        "title": title,
+        "area": f"{breakdown.area:.2f}",
+        "paper_price": f"{breakdown.paper:.2f}",
+        "price": f"{breakdown.total:.2f}"}
+
+
+def describe_quote_price(quote: Quote, /) -> typing.Dict[str, str]:
+    return describe_price_breakdown(
+        quote.title, _price_cache.get_price_breakdown(quote))
+
+
+def describe_paper_usage(usage: PaperUsage, /) -> typing.Dict[str, typing.Any]:
+    # the paper usage of a headless run, as written by --usage.
+    def describe(total: PaperUsageTotal) -> typing.Dict[str, str]:
+        return {
+            "area": f"{total.area:.2f}",
+            "revenue": f"{total.revenue:.2f}",
+            "quotes": total.quotes}
+    return {
+        "papers": [
+            {"paper": paper, "colour": colour, **describe(total)}
+            for paper, colour, total in usage],
+        "total": describe(usage.get_total())}
+
+
+def read_quote_rows(
+        handler: typing.TextIO, file_format: str, /
+        ) -> typing.Iterator[typing.Tuple[typing.Dict[str, typing.Any], str]]:
+    # yields (row, error) pairs lazily, one line at a time.
+    if file_format == "jsonl":
+        for line in handler:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                yield {"title": line.rstrip("\n")}, "Malformed JSON line."
+                continue
+            if not isinstance(row, dict):
+                yield {"title": line.rstrip("\n")}, "Malformed JSON line."
+                continue
+            yield row, ""
+    else:
+        for row in csv.DictReader(handler):
+            yield row, ""
+
+
+class _RowWriter:
+
+    def __init__(self, handler: typing.TextIO, file_format: str,
+                 fields: typing.Tuple[str, ...], /, *,
+                 header: bool = True) -> None:
+        self._handler = handler
+        self._fields = fields
+        self._csv_writer = None
+        if file_format != "jsonl":
+            self._csv_writer = csv.DictWriter(
+                handler, fieldnames=fields, extrasaction="ignore")
+            if header:
+                self._csv_writer.writeheader()
+
+    def write(self, row: typing.Mapping[str, typing.Any], /) -> None:
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(row)
         else:
-            QuoteConfigurationWindow.raise_window_running_message()
-
-    def _handle_edit_quote(self) -> None:
+            self._handler.write(json.dumps(
+                {name: row.get(name, "") for name in self._fields}) + "\n")
+
+
+def price_quote_stream(
+        rows: typing.Iterable[typing.Tuple[typing.Dict[str, typing.Any], str]],
+        output: _RowWriter,
+        rejects: _RowWriter, /, *,
+        first_line: int = 1,
+        usage: PaperUsage = None) -> typing.Tuple[int, int]:
+    # the paper of every priced quote is added to usage, when given.
+    priced: int = 0
+    rejected: int = 0
+    for line, (row, error) in enumerate(rows, start=first_line):
+        quote: Quote = None
+        if not error:
+            quote, error = translate_quote_row(row)
+        if error:
+            rejected += 1
+            rejects.write({**row, "line": line, "reason": error})
+            continue
+        priced += 1
+        breakdown = _price_cache.get_price_breakdown(quote)
+        output.write({
+            **row, **describe_price_breakdown(quote.title, breakdown)})
+        if usage is not None:
+            usage.add_quote(quote, breakdown.area, breakdown.paper)
+    return priced, rejected
+
+
+def _price_quote_chunk(
+        name: str, size: int, header: str, input_format: str,
+        output_format: str, rejects_format: str, first_line: int,
+        with_usage: bool, /) -> typing.Tuple[typing.Any, ...]:
+    # runs in a worker process: prices the rows held in the shared memory
+    # block name and hands the output and rejects back the same way. the
+    # paper usage of the chunk (if asked for) and the price cache hits and
+    # misses are small, so they are pickled.
+    from multiprocessing import shared_memory
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        text = bytes(block.buf[:size]).decode("utf-8")
+    finally:
+        block.close()
+    output = io.StringIO()
+    rejects = io.StringIO()
+    usage = PaperUsage() if with_usage else None
+    before = _price_cache.get_statistics()
+    priced, rejected = price_quote_stream(
+        read_quote_rows(io.StringIO(header + text), input_format),
+        _RowWriter(output, output_format, HEADLESS_OUTPUT_FIELDS,
+                   header=False),
+        _RowWriter(rejects, rejects_format, HEADLESS_REJECT_FIELDS,
+                   header=False),
+        first_line=first_line, usage=usage)
+    results: typing.List[typing.Any] = []
+    for text in (output.getvalue(), rejects.getvalue()):
+        data = text.encode("utf-8")
+        block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        block.buf[:len(data)] = data
+        results += [block.name, len(data)]
+        block.close()
+    after = _price_cache.get_statistics()
+    return (*results, priced, rejected, usage,
+            after.hits - before.hits, after.misses - before.misses)
+
+
+def _start_price_worker(cache_size: int, catalogue: Catalogue, /) -> None:
+    # workers price with the catalogue and cache size of the parent.
+    set_catalogue(catalogue)
+    _price_cache.set_max_size(cache_size)
+
+
+def _take_shared_text(name: str, size: int, /) -> str:
+    # reads and frees a block created by a worker.
+    from multiprocessing import shared_memory
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return bytes(block.buf[:size]).decode("utf-8")
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _price_quote_file(
+        source: typing.TextIO, target: typing.TextIO,
+        reject_target: typing.TextIO, /, *, input_format: str,
+        output_format: str, rejects_format: str,
+        workers: int, usage: PaperUsage = None
+        ) -> typing.Tuple[int, int, int, int]:
+    # the input is split into chunks of HEADLESS_CHUNK_ROWS lines which are
+    # passed to the workers through shared memory rather than pickled, and
+    # the results are written back in input order, so the output is the
+    # same as price_quote_stream gives. csv fields must not span lines.
+    # returns the rows priced and rejected, and the price cache hits and
+    # misses of the workers.
+    import collections
+    import concurrent.futures
+    from multiprocessing import shared_memory
+    _RowWriter(target, output_format, HEADLESS_OUTPUT_FIELDS)
+    _RowWriter(reject_target, rejects_format, HEADLESS_REJECT_FIELDS)
+    header = source.readline() if input_format != "jsonl" else ""
+    blank = str.isspace if input_format == "jsonl" else (
+        lambda line: not line.strip("\r\n"))
+    priced: int = 0
+    rejected: int = 0
+    hits: int = 0
+    misses: int = 0
+    line: int = 1
+    pending: typing.Deque[typing.Tuple[
+        shared_memory.SharedMemory, concurrent.futures.Future]] = (
+            collections.deque())
+
+    def finish_oldest() -> None:
+        nonlocal priced, rejected, hits, misses
+        block, future = pending.popleft()
         try:
-            if self._selected_index != -1:
-                if not QuoteConfigurationWindow.window_running_check:
-                    self._currently_editing_index = self._selected_index
-                    quote_config_window = QuoteConfigurationWindow(
-                        self, False, self._order.quotes, self._selected_index)
-                else:
-                    QuoteConfigurationWindow.raise_window_running_message()
-            else:
-                raise IndexError
-        except IndexError:
-            tkmsg.showerror(
-                "Selection Error",
-                "No quote selected to edit.")
-
-    def _handle_delete_quote(self) -> None:
+            (output_name, output_size, rejects_name, rejects_size,
+             chunk_priced, chunk_rejected, chunk_usage, chunk_hits,
+             chunk_misses) = future.result()
+        finally:
+            block.close()
+            block.unlink()
+        target.write(_take_shared_text(output_name, output_size))
+        reject_target.write(_take_shared_text(rejects_name, rejects_size))
+        priced += chunk_priced
+        rejected += chunk_rejected
+        hits += chunk_hits
+        misses += chunk_misses
+        if usage is not None:
+            usage.merge(chunk_usage)
+
+    with concurrent.futures.ProcessPoolExecutor(
+            workers, initializer=_start_price_worker,
+            initargs=(_price_cache.get_max_size(), get_catalogue())
+            ) as executor:
         try:
-            if (self._selected_index == self._currently_editing_index
-                    and self._selected_index != -1):
-                tkmsg.showerror(
-                    "Deletion Error",
-                    "You cannot delete the quote you are currently editing.")
+            while lines := list(
+                    itertools.islice(source, HEADLESS_CHUNK_ROWS)):
+                data = "".join(lines).encode("utf-8")
+                block = shared_memory.SharedMemory(create=True, size=len(data))
+                block.buf[:len(data)] = data
+                pending.append((block, executor.submit(
+                    _price_quote_chunk, block.name, len(data), header,
+                    input_format, output_format, rejects_format, line,
+                    usage is not None)))
+                line += sum(1 for text in lines if text and not blank(text))
+                if len(pending) >= 2 * workers:
+                    finish_oldest()
+            while pending:
+                finish_oldest()
+        finally:
+            for block, future in pending:
+                future.cancel()
+                block.close()
+                block.unlink()
+    return priced, rejected, hits, misses
+
+
+def _headless_format(path: str, requested: str, default: str, /) -> str:
+    if requested:
+        return requested
+    if path.lower().endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if path.lower().endswith(".csv"):
+        return "csv"
+    return default
+
+
+def _headless_open(path: str, mode: str, /) -> typing.ContextManager:
+    if path == "-":
+        # the standard streams are left open for the caller.
+        return contextlib.nullcontext(sys.stdin if mode == "r" else sys.stdout)
+    return open(path, mode, newline="", encoding="utf-8")
+
+
+def run_headless(*, input_path: str,
+                 output_path: str = "-",
+                 rejects_path: str = os.devnull,
+                 input_format: str = "",
+                 output_format: str = "",
+                 usage_path: str = "",
+                 workers: int = 1) -> int:
+    input_format = _headless_format(input_path, input_format, "csv")
+    output_format = _headless_format(
+        output_path, output_format, input_format)
+    rejects_format = _headless_format(rejects_path, "", input_format)
+    usage = PaperUsage() if usage_path else None
+    before = _price_cache.get_statistics()
+    start = time.perf_counter()
+    try:
+        with _headless_open(input_path, "r") as source, \
+                _headless_open(output_path, "w") as target, \
+                _headless_open(rejects_path, "w") as reject_target:
+            if workers > 1:
+                priced, rejected, hits, misses = _price_quote_file(
+                    source, target, reject_target,
+                    input_format=input_format,
+                    output_format=output_format,
+                    rejects_format=rejects_format,
+                    workers=workers, usage=usage)
             else:
-                del self._order.quotes[self._selected_index]
-        except IndexError:
-            tkmsg.showerror(
-                "Selection Error",
-                "No quote selected to delete.")
-        self._handle_quote_update()
-        self._quote_preview_pane.clear_preview()
-        self._selected_index = -1
-
-    def _handle_export_order(self) -> None:
-        if len(self._order.quotes) == 0:
-            tkmsg.showerror(
-                "Export Error",
-                "You cannot export an empty order.")
-            return
-        if not self._order.export_order():
-            self._ask_export = False
-            tkmsg.showinfo(
-                "Quotes Exported",
-                f"Quotes have been successfully exported to:\n"
-                + f"{os.path.dirname(os.path.abspath(__file__))}")
-        else:
-            tkmsg.showerror(
-                "Export Error",
-                f"Failed to export quotes.\n"
-                + "Please ensure the program has write access to the "
-                + "relative directory.")
-
-    def _handle_new_order(self) -> None:
-        if self._ask_export and len(self._order.quotes) > 0:
-            result = tkmsg.askyesno(
-                "New Order",
-                "Export the quotes before starting a new order?")
-            if result:
-                self._order.export_order()
-        del self._order
-        self._order_count += 1
-        self._order = Order(self._order_count)
-        self._order_details.set(
-            f"Order {self._order.get_order_number()}     "
-            + f"      {len(self._order.quotes)} Quote(s)     "
-            + f"      £{self._order.calculate_total_price():.2f}")
-        self.update()
-        self._ask_export = True
-
-    def _handle_checkout(self) -> None:
-        if not QuoteConfigurationWindow.window_running_check:
-            tkmsg.showwarning(
-                "Checkout Warning",
-                "The checkout procedure has not been implemented "
-                + "as this is a proof of concept.\n\n"
-                + "The order will now be exported to the relative directory "
-                + "and a new order will be started to simulate the "
-                + "checkout process.\n\n"
-                + "If the order is empty, there will not be an exported file.")
-            if len(self._order.quotes) > 0:
-                self._handle_export_order()
-            self._ask_export = False
-            self._handle_new_order()
-        else:
-            tkmsg.showerror(
-                "Checkout Error",
-                "Please make sure that the quote configuration window is "
-                + "closed before checking out.")
-
-    def _handle_quote_selection_change(self, event: tk.Event, /) -> None:
-        selection = event.widget.curselection()
-        try:
-            self._selected_index = selection[0]
-        except IndexError:
-            return
-        self._quote_preview_pane.set_quote_title(
-            self._order.quotes[self._selected_index].calculate_price(),
-            self._order.quotes[self._selected_index].title)
-        self._quote_preview_pane.set_quote_shape(
-            self._order.quotes[self._selected_index].present)
-        self._quote_preview_pane.set_quote_paper(
-            self._order.quotes[self._selected_index].wrapping_paper)
-        self._quote_preview_pane.set_additional_options(
-            self._order.quotes[self._selected_index].bow,
-            self._order.quotes[self._selected_index].gift_card)
-
-    def destroy(self) -> None:
-        if not QuoteConfigurationWindow.window_running_check:
-            if self._ask_export and len(self._order.quotes) > 0:
-                result = tkmsg.askyesnocancel(
-                    "Export Quotes?",
-                    "Export the quotes before exiting application?")
-                if result:
-                    self._order.export_order()
-                elif result is None:
-                    return
-            return super().destroy()
+                priced, rejected = price_quote_stream(
+                    read_quote_rows(source, input_format),
+                    _RowWriter(target, output_format, HEADLESS_OUTPUT_FIELDS),
+                    _RowWriter(reject_target, rejects_format,
+                               HEADLESS_REJECT_FIELDS),
+                    usage=usage)
+                after = _price_cache.get_statistics()
+                hits = after.hits - before.hits
+                misses = after.misses - before.misses
+        if usage is not None:
+            with _headless_open(usage_path, "w") as usage_target:
+                json.dump(describe_paper_usage(usage), usage_target,
+                          indent=2)
+                usage_target.write("\n")
+    except OSError as error:
+        print(f"{APPLICATION_NAME}: {error}", file=sys.stderr)
+        return 1
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(
+        f"{APPLICATION_NAME}: priced {priced} row(s), rejected {rejected} "
+        + f"row(s) in {elapsed:.2f}s "
+        + f"({(priced + rejected) / elapsed:.0f} rows/s), "
+        + f"{hits / max(hits + misses, 1):.0%} price cache hits.",
+        file=sys.stderr)
+    return 0
+
+
+def main(argv: typing.Sequence[str] = None, /) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog="wpqc", description=APPLICATION_NAME)
+    parser.add_argument(
+        "--price", metavar="FILE",
+        help="price a CSV or JSONL quote file without the GUI "
+        + "('-' reads standard input)")
+    parser.add_argument(
+        "--output", metavar="FILE", default="-",
+        help="where priced rows are written (default: standard output)")
+    parser.add_argument(
+        "--rejects", metavar="FILE", default=os.devnull,
+        help="where invalid rows are written (default: discarded)")
+    parser.add_argument(
+        "--input-format", choices=("csv", "jsonl"), default="",
+        help="input format (default: from the file extension)")
+    parser.add_argument(
+        "--output-format", choices=("csv", "jsonl"), default="",
+        help="output format (default: from the file extension)")
+    parser.add_argument(
+        "--usage", metavar="FILE", default="",
+        help="write the paper area and revenue per paper type and colour "
+        + "of the priced rows to FILE as JSON")
+    parser.add_argument(
+        "--workers", type=int, default=1, metavar="N",
+        help="price in N worker processes, 0 uses every core "
+        + "(default: 1, no worker processes)")
+    parser.add_argument(
+        "--catalogue", metavar="FILE",
+        help="read the paper grades and colours from FILE "
+        + "(default: wpqc_catalogue.json next to wpqc.py)")
+    parser.add_argument(
+        "--price-cache", type=int, default=PriceCache.DEFAULT_SIZE,
+        metavar="N",
+        help="price quotes through a cache of the N most recently used "
+        + "quote specifications, 0 turns it off (default: "
+        + f"{PriceCache.DEFAULT_SIZE})")
+    parser.add_argument(
+        "--serve", action="store_true",
+        help="run the HTTP/JSON pricing service instead of the GUI")
+    parser.add_argument(
+        "--host", default="127.0.0.1",
+        help="address the pricing service listens on (default: 127.0.0.1)")
+    parser.add_argument(
+        "--port", type=int, default=8765,
+        help="port the pricing service listens on, 0 picks a free port "
+        + "(default: 8765)")
+    parser.add_argument(
+        "--metrics", metavar="FILE",
+        help="record call counts and timings of the hot paths and write "
+        + "them to FILE at exit ('-' for standard error)")
+    args = parser.parse_args(argv)
+    if args.metrics:
+        wpqc_metrics.enable(dump_path=args.metrics)
+    _price_cache.set_max_size(args.price_cache)
+    try:
+        if args.catalogue:
+            set_catalogue(Catalogue.load(args.catalogue))
         else:
-            tkmsg.showinfo(
-                "Window Instances Information",
-                "Please close all windows before exiting the application.")
+            get_catalogue()
+    except (OSError, ValueError) as error:
+        print(f"{APPLICATION_NAME}: the catalogue could not be loaded "
+              + f"({error}).", file=sys.stderr)
+        return 1
+    if args.price:
+        return run_headless(
+            input_path=args.price,
+            output_path=args.output,
+            rejects_path=args.rejects,
+            input_format=args.input_format,
+            output_format=args.output_format,
+            usage_path=args.usage,
+            workers=args.workers or os.cpu_count() or 1)
+    if args.serve:
+        from wpqc_service import serve
+        return serve(host=args.host, port=args.port)
+    from wpqc_gui import MainWindow
+    window = MainWindow()
+    window.show()
+    return 0
 
-    def show(self) -> None:
-        self.mainloop()
 
-    def update(self) -> None:
-        self._handle_quote_update()
-        self._quote_preview_pane.clear_preview()
-        self._ask_export = True
-        if not QuoteConfigurationWindow.window_running_check:
-            self._currently_editing_index = -1
-        return super().update()
+GUI_NAMES: typing.Tuple[str, ...] = (
+    "ColourScheme", "WindowHeader", "QuoteSummaryPane",
+    "QuoteConfigurationWindow", "MainWindow")
 
 
-def main() -> None:
-    window = MainWindow()
-    window.show()
+def __getattr__(name: str) -> typing.Any:
+    # the windows are loaded (with tkinter) on first access only.
+    if name in GUI_NAMES:
+        import wpqc_gui
+        return getattr(wpqc_gui, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Module: Wrapping Paper Quotes Calculator, Cutting Plans (wpqc_cutting.py)
+Author: Harsh Jayprakash <harshjayprakash@outlook.com>
+Date: (Original) May 2022
+License: MIT
+
+Requires Python 3.8 or newer.
+
+Plans how the wrapping sheets of an order are cut from rolls of a fixed
+width. The sheets of each paper type and colour are packed onto their
+own roll as a strip packing problem: each sheet is turned so its long
+side runs across the roll where it fits, the sheets are sorted by the
+length they take along the roll, and each is placed on the existing
+shelf (a row across the roll) it fills best, or starts a new shelf.
+The shelves are kept sorted by the width they have left, so a sheet is
+placed with a binary search rather than by trying every shelf.
+"""
+import bisect
+import typing
+
+from wpqc import Order, Translator, get_catalogue
+
+DEFAULT_ROLL_WIDTH: float = 100.0
+# widths within this of each other (in cm) are treated as equal.
+TOLERANCE: float = 1e-9
+
+
+class SheetPlacement(typing.NamedTuple):
+    # x runs across the roll and y along it, both in cm from the start
+    # of the roll. rotated sheets have their height across the roll.
+    quote_index: int
+    x: float
+    y: float
+    across: float
+    along: float
+    rotated: bool
+
+
+class CuttingPlan(typing.NamedTuple):
+    paper: str
+    colour: str
+    roll_width: float
+    roll_length: float
+    sheet_area: float
+    placements: typing.Tuple[SheetPlacement, ...]
+    # quotes whose sheet is wider than the roll either way round.
+    oversized: typing.Tuple[int, ...]
+
+    def get_waste_percentage(self) -> float:
+        roll_area = self.roll_width * self.roll_length
+        if roll_area <= 0:
+            return 0
+        return 100 * (1 - (self.sheet_area / roll_area))
+
+
+def pack_sheets(
+        sheets: typing.Iterable[typing.Tuple[int, float, float]],
+        roll_width: float, /
+        ) -> typing.Tuple[float, typing.List[SheetPlacement],
+                          typing.List[int]]:
+    # sheets are (quote index, height, width). returns the roll length
+    # used, the placements and the quote indexes of oversized sheets.
+    oriented: typing.List[typing.Tuple[float, float, int, bool]] = []
+    oversized: typing.List[int] = []
+    for quote_index, height, width in sheets:
+        if max(height, width) <= roll_width + TOLERANCE:
+            # the long side across the roll keeps the shelves short.
+            rotated = height > width
+        elif min(height, width) <= roll_width + TOLERANCE:
+            rotated = height < width
+        else:
+            oversized.append(quote_index)
+            continue
+        across, along = (height, width) if rotated else (width, height)
+        oriented.append((along, across, quote_index, rotated))
+    oriented.sort(reverse=True)
+    placements: typing.List[SheetPlacement] = []
+    # (width left, shelf) sorted by width left, with the start of each
+    # shelf along the roll. every shelf is at least as long as the sheets
+    # which come after it, as they are sorted by length along the roll.
+    shelves: typing.List[typing.Tuple[float, int]] = []
+    shelf_starts: typing.List[float] = []
+    roll_length: float = 0
+    for along, across, quote_index, rotated in oriented:
+        position = bisect.bisect_left(shelves, (across - TOLERANCE, -1))
+        if position < len(shelves):
+            remaining, shelf = shelves.pop(position)
+        else:
+            remaining, shelf = roll_width, len(shelf_starts)
+            shelf_starts.append(roll_length)
+            roll_length += along
+        placements.append(SheetPlacement(
+            quote_index, roll_width - remaining, shelf_starts[shelf],
+            across, along, rotated))
+        if remaining - across > TOLERANCE:
+            bisect.insort(shelves, (remaining - across, shelf))
+    return roll_length, placements, oversized
+
+
+def plan_order_cutting(order: Order, /, *,
+                       roll_width: float = DEFAULT_ROLL_WIDTH
+                       ) -> typing.List[CuttingPlan]:
+    # one plan per paper type and colour, in the order they first appear.
+    groups: typing.Dict[
+        typing.Tuple[str, str],
+        typing.List[typing.Tuple[int, float, float]]] = {}
+    for quote_index, quote in enumerate(order):
+        height, width = quote.present.get_sheet_dimensions()
+        if height <= 0 or width <= 0:
+            continue
+        key = (Translator.describe_wrapping_paper_type(quote.wrapping_paper),
+               quote.wrapping_paper.get_colour())
+        groups.setdefault(key, []).append((quote_index, height, width))
+    plans: typing.List[CuttingPlan] = []
+    for (paper, colour), sheets in groups.items():
+        roll_length, placements, oversized = pack_sheets(sheets, roll_width)
+        plans.append(CuttingPlan(
+            paper, colour, roll_width, roll_length,
+            sum(placement.across * placement.along
+                for placement in placements),
+            tuple(placements), tuple(oversized)))
+    return plans
+
+
+def describe_cutting_plans(plans: typing.Sequence[CuttingPlan], /) -> str:
+    lines: typing.List[str] = []
+    catalogue = get_catalogue()
+    for plan in plans:
+        paper = catalogue.describe_grade(plan.paper)
+        colour = catalogue.describe_colour(plan.colour)
+        line = (
+            f"{paper} {colour}: "
+            + f"{len(plan.placements)} sheet(s), "
+            + f"{plan.roll_length / 100:.2f}m of a {plan.roll_width:g}cm "
+            + f"roll, {plan.get_waste_percentage():.1f}% waste")
+        if plan.oversized:
+            line += f", {len(plan.oversized)} sheet(s) wider than the roll"
+        lines.append(line)
+    return "\n".join(lines)
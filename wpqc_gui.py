@@ -0,0 +1,1677 @@
+"""
+Module: Wrapping Paper Quotes Calculator, User Interface (wpqc_gui.py)
+Author: Harsh Jayprakash <harshjayprakash@outlook.com>
+Date: (Original) May 2022
+License: MIT
+
+Requires Python 3.8 or newer with Tkinter support.
+
+The Tkinter windows of the Wrapping Paper Quotes Calculator. The pricing
+model lives in wpqc.py, which only imports this module once the user
+interface is required (see wpqc.main), so the model can be used on hosts
+without Tk.
+"""
+import concurrent.futures
+import os
+import sqlite3
+import tkinter as tk
+import tkinter.filedialog as tkfile
+import tkinter.font as tkfont
+import tkinter.ttk as ttk
+import tkinter.messagebox as tkmsg
+import typing
+
+from wpqc import (
+    APPLICATION_NAME,
+    APPLICATION_VERSION,
+    Bow,
+    GiftCard,
+    Money,
+    Order,
+    OrderSnapshot,
+    PresentType,
+    Quote,
+    ShapeRegistry,
+    Translator,
+    WrappingPaper,
+    get_catalogue,
+    get_current_time_date,
+    get_price_cache)
+import wpqc_metrics
+from wpqc_cutting import describe_cutting_plans, plan_order_cutting
+from wpqc_import import QuoteImport
+from wpqc_journal import OrderJournal
+from wpqc_store import OrderStore
+
+# the user interface.
+
+
+class ColourScheme:
+    # storage class
+
+    WHITE: str = "#FFFFFF"
+    BLACK: str = "#000000"
+    GREY: str = "#F6F6F6"
+    LIGHT_MINT_GREEN: str = "#00858E"
+    DARK_MINT_GREEN: str = "#00585E"
+    RED: str = "#FF0000"
+
+
+class WindowHeader(tk.Frame):
+
+    def __init__(self, parent: tk.Tk, /) -> None:
+        super().__init__(parent)
+        self.config(
+            bg=ColourScheme.WHITE, padx=15, pady=10)
+        self._construct()
+        self._display()
+
+    def _construct(self) -> None:
+        self._header_text = tk.StringVar()
+        self._header_title = tk.Label(self)
+        self._header_title.config(
+            bg=ColourScheme.WHITE, fg=ColourScheme.DARK_MINT_GREEN,
+            font="helvetica 14 bold", textvariable=self._header_text)
+
+    def _display(self) -> None:
+        self._header_title.pack(anchor="w", side="top")
+
+    def set_title(self, title: str, /) -> None:
+        self._header_text.set(title)
+
+
+class QuoteSummaryPane(tk.Frame):
+
+    SHAPE_TAG: str = "shape"
+    PATTERN_TAG: str = "pattern"
+
+    def __init__(self, parent: tk.Tk, /):
+        super().__init__(parent)
+        self._shape_displayed: str = Translator.NONE
+        self._pattern_displayed: str = Translator.NONE
+        self._colour_displayed: str = "#000000"
+        # what the canvases currently show, (pattern, colour) for patterns.
+        self._shown_shape: str = Translator.NONE
+        self._shown_pattern: typing.Tuple[str, str] = (Translator.NONE, "")
+        self.config(
+            bg=ColourScheme.WHITE, height=100, padx=15, pady=15)
+        self._construct()
+        self._display()
+
+    def _construct(self) -> None:
+        self._shape_preview = tk.Canvas(self)
+        self._shape_preview.config(
+            bg=ColourScheme.WHITE, height=100, width=100)
+        self._pattern_preview = tk.Canvas(self)
+        self._pattern_preview.config(
+            bg=ColourScheme.WHITE, height=100, width=100)
+        self._create_shape_items()
+        self._create_pattern_items()
+        self._info_container = tk.Frame(self)
+        self._info_container.config(
+            bg=ColourScheme.WHITE, padx=10, pady=10)
+        self._title = tk.StringVar()
+        self._quote_title = tk.Label(self._info_container)
+        self._quote_title.config(
+            bg=ColourScheme.WHITE, font="helvetica 10 bold",
+            textvariable=self._title)
+        self._shape = tk.StringVar()
+        self._quote_shape = tk.Label(self._info_container)
+        self._quote_shape.config(
+            bg=ColourScheme.WHITE, font="helvetica 10",
+            textvariable=self._shape)
+        self._paper = tk.StringVar()
+        self._quote_paper = tk.Label(self._info_container)
+        self._quote_paper.config(
+            bg=ColourScheme.WHITE, font="helvetica 10",
+            textvariable=self._paper)
+        self._additional = tk.StringVar()
+        self._quote_additional = tk.Label(self._info_container)
+        self._quote_additional.config(
+            bg=ColourScheme.WHITE, font="helvetica 10",
+            textvariable=self._additional)
+
+    def _display(self) -> None:
+        self._shape_preview.pack(
+            anchor="w", side="left")
+        self._pattern_preview.pack(
+            anchor="w", padx=10, side="left")
+        self._info_container.pack(
+            anchor="nw", fill="both", side="left")
+        self._quote_title.pack(
+            anchor="nw", side="top")
+        self._quote_shape.pack(
+            anchor="nw", side="top")
+        self._quote_paper.pack(
+            anchor="nw", side="top")
+        self._quote_additional.pack(
+            anchor="nw", side="top")
+
+    def get_shape_displayed(self) -> str:
+        return self._shape_displayed
+
+    def set_shape_displayed(self, shape: str, /) -> None:
+        self._shape_displayed = shape
+
+    def get_pattern_displayed(self) -> str:
+        return self._pattern_displayed
+
+    def set_pattern_displayed(self, pattern: str, /) -> None:
+        self._pattern_displayed = pattern
+
+    def get_colour_displayed(self) -> str:
+        return self._colour_displayed
+
+    def set_colour_displayed(self, colour: str, /) -> None:
+        self._colour_displayed = colour
+
+    def set_quote_title(self, price: Money, title: str, /) -> None:
+        self._title.set(f"£{price:.2f}     {title}")
+
+    def set_quote_shape(self, shape: PresentType, /) -> None:
+        if shape.get_recommended_area() > 0:
+            self._shape.set(str(shape))
+            if (shape_type := ShapeRegistry.find_for(shape)) is not None:
+                self.preview_shape(shape_type.name)
+        else:
+            self._shape.set("Invalid dimensions")
+
+    def set_quote_paper(self, paper: WrappingPaper, /) -> None:
+        self._paper.set(str(paper))
+        self.set_colour_displayed(paper.get_colour())
+        self.preview_grade_pattern(paper.get_grade())
+
+    def set_additional_options(self, bow: Bow, gift_card: GiftCard, /) -> None:
+        display_string: str = ""
+        if isinstance(bow, Bow):
+            display_string += f"   {str(bow)}"
+        if isinstance(gift_card, GiftCard):
+            display_string += f"   {str(gift_card)}"
+        self._additional.set(display_string)
+
+    def clear_preview(self) -> None:
+        self._shape_preview.itemconfigure(
+            QuoteSummaryPane.SHAPE_TAG, state="hidden")
+        self._pattern_preview.itemconfigure(
+            QuoteSummaryPane.PATTERN_TAG, state="hidden")
+        self._shown_shape = Translator.NONE
+        self._shown_pattern = (Translator.NONE, "")
+        self._title.set("")
+        self._shape.set("")
+        self._paper.set("")
+        self._additional.set("")
+        self.set_pattern_displayed(Translator.NONE)
+        self.set_shape_displayed(Translator.NONE)
+
+    def preview_shape(self, shape: str, /) -> None:
+        # shape is the name of a registered shape.
+        self.set_shape_displayed(shape)
+        self._show_shape(shape)
+
+    def preview_cube_shape(self) -> None:
+        self.preview_shape(Translator.CUBE)
+
+    def preview_cuboid_shape(self) -> None:
+        self.preview_shape(Translator.CUBOID)
+
+    def preview_cylinder_shape(self) -> None:
+        self.preview_shape(Translator.CYLINDER)
+
+    def preview_cheap_pattern(self) -> None:
+        self.set_pattern_displayed(Translator.CHEAP_WRAPPING)
+        self._show_pattern(Translator.CHEAP_WRAPPING)
+
+    def preview_expensive_pattern(self) -> None:
+        self.set_pattern_displayed(Translator.EXPENSIVE_WRAPPING)
+        self._show_pattern(Translator.EXPENSIVE_WRAPPING)
+
+    def preview_grade_pattern(self, grade: str, /) -> None:
+        # the pattern the catalogue gives the paper grade.
+        if (paper_grade := get_catalogue().get_grade(grade)) is None:
+            return
+        if paper_grade.pattern == Translator.EXPENSIVE_WRAPPING:
+            self.preview_expensive_pattern()
+        else:
+            self.preview_cheap_pattern()
+
+    def _show_shape(self, shape: str, /) -> None:
+        if shape == self._shown_shape:
+            return
+        self._shape_preview.itemconfigure(
+            QuoteSummaryPane.SHAPE_TAG, state="hidden")
+        self._shape_preview.itemconfigure(shape, state="normal")
+        self._shown_shape = shape
+
+    def _show_pattern(self, pattern: str, /) -> None:
+        colour = self.get_colour_displayed()
+        if (pattern, colour) == self._shown_pattern:
+            return
+        if pattern != self._shown_pattern[0]:
+            self._pattern_preview.itemconfigure(
+                QuoteSummaryPane.PATTERN_TAG, state="hidden")
+            self._pattern_preview.itemconfigure(pattern, state="normal")
+        if pattern == Translator.CHEAP_WRAPPING:
+            self._pattern_preview.itemconfigure(
+                "cheap_filled", fill=colour, outline=colour)
+            self._pattern_preview.itemconfigure(
+                "cheap_outlined", outline=colour)
+        elif pattern == Translator.EXPENSIVE_WRAPPING:
+            self._pattern_preview.itemconfigure(
+                "expensive_filled", fill=colour, outline=colour)
+            self._pattern_preview.itemconfigure(
+                "expensive_accent", fill=colour)
+        self._shown_pattern = (pattern, colour)
+
+    def _create_shape_items(self) -> None:
+        # every preview is drawn once, hidden, and later only shown or
+        # recoloured (see _show_shape and _show_pattern).
+        # the items of each registered shape are tagged with its name.
+        creators = {
+            "rectangle": self._shape_preview.create_rectangle,
+            "oval": self._shape_preview.create_oval,
+            "polygon": self._shape_preview.create_polygon}
+        for shape_type in ShapeRegistry.get_shape_types():
+            tags = (QuoteSummaryPane.SHAPE_TAG, shape_type.name)
+            for kind, coordinates in shape_type.preview:
+                if kind == "line":
+                    self._shape_preview.create_line(
+                        *coordinates, fill="#000000", state="hidden",
+                        tags=tags)
+                else:
+                    creators[kind](
+                        *coordinates, fill="", outline="#000000",
+                        state="hidden", tags=tags)
+
+    def _create_pattern_items(self) -> None:
+        colour = self.get_colour_displayed()
+        for num in range(5):
+            if num % 2 == 0:
+                tags = (QuoteSummaryPane.PATTERN_TAG,
+                        Translator.CHEAP_WRAPPING, "cheap_filled")
+                fill = colour
+            else:
+                tags = (QuoteSummaryPane.PATTERN_TAG,
+                        Translator.CHEAP_WRAPPING, "cheap_outlined")
+                fill = "#ffffff"
+            self._pattern_preview.create_rectangle(
+                0 + (num * 10), 0 + (num * 10),
+                20 + (num * 10), 20 + (num * 10),
+                fill=fill, outline=colour, state="hidden", tags=tags)
+            self._pattern_preview.create_rectangle(
+                80 - (num * 10), 20 + (num * 10),
+                100 - (num * 10), 0 + (num * 10),
+                fill=fill, outline=colour, state="hidden", tags=tags)
+            self._pattern_preview.create_rectangle(
+                100 - (num * 10), 100 - (num * 10),
+                80 - (num * 10), 80 - (num * 10),
+                fill=fill, outline=colour, state="hidden", tags=tags)
+            self._pattern_preview.create_rectangle(
+                0 + (num * 10), 80 - (num * 10),
+                20 + (num * 10), 100 - (num * 10),
+                fill=fill, outline=colour, state="hidden", tags=tags)
+        for num in range(2):
+            self._pattern_preview.create_rectangle(
+                0 + (num * 50), 0 + (num * 50),
+                50 + (num * 50), 50 + (num * 50),
+                fill=colour, outline=colour, state="hidden",
+                tags=(QuoteSummaryPane.PATTERN_TAG,
+                      Translator.EXPENSIVE_WRAPPING, "expensive_filled"))
+        for num in range(5):
+            if num % 2 == 0:
+                tags = (QuoteSummaryPane.PATTERN_TAG,
+                        Translator.EXPENSIVE_WRAPPING)
+                fill = "#ffffff"
+            else:
+                tags = (QuoteSummaryPane.PATTERN_TAG,
+                        Translator.EXPENSIVE_WRAPPING, "expensive_accent")
+                fill = colour
+            self._pattern_preview.create_rectangle(
+                50 + (num * 10), 0 - (num * 10),
+                100 + (num * 10), 50 - (num * 10),
+                fill=fill, outline="#000000", state="hidden", tags=tags)
+            self._pattern_preview.create_rectangle(
+                0 - (num * 10), 50 + (num * 10),
+                50 - (num * 10), 100 + (num * 10),
+                fill=fill, outline="#000000", state="hidden", tags=tags)
+
+
+class QuoteListView(tk.Frame):
+    # virtualised list, the listbox only holds the rows currently visible
+    # and a refresh only rewrites the rows whose text has changed.
+
+    SCROLL_UNITS: int = 3
+
+    def __init__(self, parent: tk.Widget, /) -> None:
+        super().__init__(parent)
+        self._order: Order = None
+        self._first_row: int = 0
+        self._visible_rows: int = 1
+        self._line_height: int = 0
+        self._selected_index: int = -1
+        self._rendered: typing.List[str] = []
+        self._selection_command: typing.Callable[[int], None] = None
+        self.config(bg=ColourScheme.GREY)
+        self._construct()
+        self._actions()
+        self._display()
+
+    def _construct(self) -> None:
+        self._listbox = tk.Listbox(self)
+        self._listbox.config(font="helvetica 10")
+        self._scrollbar = tk.Scrollbar(self)
+        self._scrollbar.config(orient="vertical")
+
+    def _actions(self) -> None:
+        self._scrollbar.config(command=self._handle_scroll)
+        self._listbox.bind("<<ListboxSelect>>", self._handle_listbox_select)
+        self._listbox.bind("<Configure>", self._handle_resize)
+        self._listbox.bind("<MouseWheel>", self._handle_mouse_wheel)
+        self._listbox.bind("<Button-4>", self._handle_mouse_wheel)
+        self._listbox.bind("<Button-5>", self._handle_mouse_wheel)
+        self._listbox.bind("<Up>", lambda event: self._handle_step(-1))
+        self._listbox.bind("<Down>", lambda event: self._handle_step(1))
+
+    def _display(self) -> None:
+        self._scrollbar.pack(
+            anchor="ne", fill="y", side="right")
+        self._listbox.pack(
+            anchor="nw", expand=True, fill="both", side="left")
+
+    def set_order(self, order: Order, /) -> None:
+        self._order = order
+        self._first_row = 0
+        self._selected_index = -1
+        self.refresh()
+
+    def set_selection_command(
+            self, command: typing.Callable[[int], None], /) -> None:
+        self._selection_command = command
+
+    def get_selected_index(self) -> int:
+        return self._selected_index
+
+    def clear_selection(self) -> None:
+        self._selected_index = -1
+        self._listbox.selection_clear(0, "end")
+
+    def get_row_count(self) -> int:
+        if self._order is None:
+            return 0
+        return self._order.get_quote_count()
+
+    def see(self, index: int, /) -> None:
+        if index < self._first_row:
+            self._scroll_to(index)
+        elif index >= self._first_row + self._visible_rows:
+            self._scroll_to(index - self._visible_rows + 1)
+
+    def refresh(self) -> None:
+        count = self.get_row_count()
+        self._first_row = max(
+            0, min(self._first_row, count - self._visible_rows))
+        last_row = min(count, self._first_row + self._visible_rows)
+        rows: typing.List[str] = [
+            f" {str(self._order.get_quote(index))}"
+            for index in range(self._first_row, last_row)]
+        for position, text in enumerate(rows):
+            if position >= len(self._rendered):
+                self._listbox.insert("end", text)
+            elif self._rendered[position] != text:
+                self._listbox.delete(position)
+                self._listbox.insert(position, text)
+        if len(self._rendered) > len(rows):
+            self._listbox.delete(len(rows), "end")
+        self._rendered = rows
+        self._listbox.selection_clear(0, "end")
+        if self._first_row <= self._selected_index < last_row:
+            self._listbox.selection_set(
+                self._selected_index - self._first_row)
+        if count > 0:
+            self._scrollbar.set(self._first_row / count, last_row / count)
+        else:
+            self._scrollbar.set(0, 1)
+
+    def _scroll_to(self, first_row: int, /) -> None:
+        first_row = max(
+            0, min(first_row, self.get_row_count() - self._visible_rows))
+        if first_row != self._first_row:
+            self._first_row = first_row
+            self.refresh()
+
+    def _handle_scroll(self, action: str, amount: str,
+                       unit: str = None, /) -> None:
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * self.get_row_count()))
+        elif action == "scroll":
+            rows = int(amount)
+            if unit == "pages":
+                rows *= self._visible_rows
+            self._scroll_to(self._first_row + rows)
+
+    def _handle_mouse_wheel(self, event: tk.Event, /) -> str:
+        if event.num == 4 or event.delta > 0:
+            self._scroll_to(self._first_row - QuoteListView.SCROLL_UNITS)
+        else:
+            self._scroll_to(self._first_row + QuoteListView.SCROLL_UNITS)
+        return "break"
+
+    def _handle_step(self, step: int, /) -> str:
+        index = self._selected_index + step
+        if 0 <= index < self.get_row_count():
+            self._selected_index = index
+            self.see(index)
+            self.refresh()
+            if self._selection_command is not None:
+                self._selection_command(index)
+        return "break"
+
+    def _handle_resize(self, event: tk.Event, /) -> None:
+        if not self._line_height:
+            # matches the row height used by the Tk listbox.
+            self._line_height = (
+                tkfont.Font(root=self, font=self._listbox.cget("font"))
+                .metrics("linespace")
+                + 1 + (2 * self._listbox.winfo_pixels(
+                    self._listbox.cget("selectborderwidth"))))
+        inner_height = event.height - 2 * (
+            self._listbox.winfo_pixels(self._listbox.cget("borderwidth"))
+            + self._listbox.winfo_pixels(
+                self._listbox.cget("highlightthickness")))
+        visible_rows = max(1, inner_height // self._line_height)
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self.refresh()
+
+    def _handle_listbox_select(self, event: tk.Event, /) -> None:
+        selection = self._listbox.curselection()
+        if not selection:
+            return
+        self._selected_index = self._first_row + selection[0]
+        if self._selection_command is not None:
+            self._selection_command(self._selected_index)
+
+
+class QuoteConfigurationWindow(tk.Toplevel):
+
+    window_running_check: bool = False
+    # live price updates, see _schedule_quote_update.
+    quote_updates_run: int = 0
+    quote_updates_avoided: int = 0
+
+    @staticmethod
+    def raise_window_running_message() -> None:
+        tkmsg.showinfo(
+            "Information",
+            "An instance of the quote configuration window is open. "
+            + "Please close the previous instance before opening another.")
+
+    def __new__(cls,
+                parent: tk.Tk,
+                new_quote: bool,
+                order: Order,
+                quote_index: int = None, /, *,
+                journal: OrderJournal = None) -> None:
+        cls.window_running_check = True
+        return super(QuoteConfigurationWindow, cls).__new__(cls)
+
+    def __init__(self,
+                 parent: tk.Tk,
+                 new_quote: bool,
+                 order: Order,
+                 quote_index: int = None, /, *,
+                 journal: OrderJournal = None) -> None:
+        super().__init__(parent)
+        self._new_quote = new_quote
+        self._order = order
+        self._journal = journal
+        self._quote_index = quote_index
+        self.minsize(800, 600)
+        self.resizable(False, False)
+        self.title(f"Quote Configuration | {APPLICATION_NAME}")
+        self._avoid_message_box_exit: bool = False
+        self._the_quote: Quote = None
+        self._pending_quote_update: str = None
+        self._construct()
+        self._actions()
+        self._track()
+        self._display()
+        self._load_quote()
+
+    def _construct(self) -> None:
+        self._construct_header()
+        self._construct_quote_preview()
+        self._construct_quote_options()
+        self._construct_footer()
+
+    def _construct_header(self) -> None:
+        self._header = WindowHeader(self)
+        self._header.set_title("Quote configuration.")
+
+    def _construct_quote_preview(self) -> None:
+        self._preview_pane = QuoteSummaryPane(self)
+
+    def _construct_quote_options(self) -> None:
+        self._options = tk.Frame(self)
+        self._options.config(
+            bg=ColourScheme.GREY, padx=25, pady=15)
+        self._options_col_shape = tk.Label(self._options)
+        self._options_col_shape.config(
+            bg=ColourScheme.GREY, font="helvetica 10 bold", pady=2,
+            text="Shape")
+        self._options_shape = tk.LabelFrame(self._options)
+        self._options_shape.config(
+            bg=ColourScheme.GREY, padx=5, pady=5, text="Shape Type")
+        self._shape = tk.StringVar()
+        # one button per registered shape.
+        self._shape_types: typing.List[tk.Radiobutton] = []
+        for shape_type in ShapeRegistry.get_shape_types():
+            shape_button = tk.Radiobutton(self._options_shape)
+            shape_button.config(
+                bg=ColourScheme.GREY, padx=5, pady=5, text=shape_type.label,
+                value=shape_type.name, variable=self._shape)
+            self._shape_types.append(shape_button)
+        self._options_dimensions = tk.LabelFrame(self._options)
+        self._options_dimensions.config(
+            bg=ColourScheme.GREY, padx=5, pady=5, text="Shape Dimensions")
+        self._length_one = tk.StringVar()
+        self._dimension_one_label = tk.Label(self._options_dimensions)
+        self._dimension_one_label.config(
+            bg=ColourScheme.GREY, padx=5, pady=5, text=" - ")
+        self._dimension_one = tk.Entry(self._options_dimensions)
+        self._dimension_one.config(
+            textvariable=self._length_one)
+        self._length_two = tk.StringVar()
+        self._dimension_two_label = tk.Label(self._options_dimensions)
+        self._dimension_two_label.config(
+            bg=ColourScheme.GREY, padx=5, pady=5, text=" - ")
+        self._dimension_two = tk.Entry(self._options_dimensions)
+        self._dimension_two.config(
+            textvariable=self._length_two)
+        self._length_three = tk.StringVar()
+        self._dimension_three_label = tk.Label(self._options_dimensions)
+        self._dimension_three_label.config(
+            bg=ColourScheme.GREY, padx=5, pady=5, text=" - ")
+        self._dimension_three = tk.Entry(self._options_dimensions)
+        self._dimension_three.config(
+            textvariable=self._length_three)
+        self._options_col_paper = tk.Label(self._options)
+        self._options_col_paper.config(
+            bg=ColourScheme.GREY, font="helvetica 10 bold", pady=2,
+            text="Wrapping Paper")
+        self._options_paper = tk.LabelFrame(self._options)
+        self._options_paper.config(
+            bg=ColourScheme.GREY, padx=5, pady=5,
+            text="Wrapping Paper Type")
+        self._paper = tk.StringVar()
+        # one button per catalogue paper grade.
+        self._paper_grades: typing.List[tk.Radiobutton] = []
+        for grade in get_catalogue().get_grades():
+            paper_grade = tk.Radiobutton(self._options_paper)
+            paper_grade.config(
+                bg=ColourScheme.GREY, padx=5, pady=5, text=grade.label,
+                value=grade.name, variable=self._paper)
+            self._paper_grades.append(paper_grade)
+        self._options_colour = tk.LabelFrame(self._options)
+        self._options_colour.config(
+            bg=ColourScheme.GREY, padx=5, pady=5,
+            text="Wrapping Paper Colour")
+        self._colour = tk.StringVar()
+        self._colour_selection = ttk.Combobox(self._options_colour)
+        self._colour_selection.config(
+            textvariable=self._colour)
+        self._colour_selection["values"] = (
+            get_catalogue().get_colour_labels())
+        self._colour_selection["state"] = "readonly"
+        self._colour_black_disclaimer = tk.Label(self._options_colour)
+        self._colour_black_disclaimer.config(
+            bg=ColourScheme.GREY, fg=ColourScheme.BLACK,
+            font="helvetica 10 bold", pady=5, text=" ", justify="left")
+        self._options_col_additional = tk.Label(self._options)
+        self._options_col_additional.config(
+            bg=ColourScheme.GREY, font="helvetica 10 bold", pady=2,
+            text="Additional")
+        self._options_bow = tk.LabelFrame(self._options)
+        self._options_bow.config(
+            bg=ColourScheme.GREY, padx=5, pady=5, text="Bow")
+        self._bow = tk.IntVar()
+        self._bow_addition = tk.Checkbutton(self._options_bow)
+        self._bow_addition.config(
+            bg=ColourScheme.GREY, padx=5, pady=5, text="Add Bow",
+            variable=self._bow)
+        self._options_giftcard = tk.LabelFrame(self._options)
+        self._options_giftcard.config(
+            bg=ColourScheme.GREY, padx=5, pady=5, text="Gift Card")
+        self._giftcard = tk.IntVar()
+        self._giftcard_addition = tk.Checkbutton(self._options_giftcard)
+        self._giftcard_addition.config(
+            bg=ColourScheme.GREY, padx=5, pady=5, text="Add Gift Card",
+            variable=self._giftcard)
+        self._giftcard_message_label = tk.Label(self._options_giftcard)
+        self._giftcard_message_label.config(
+            bg=ColourScheme.GREY, padx=5, pady=5, text="Message ")
+        self._giftcard_message = tk.StringVar()
+        self._giftcard_message_entry = tk.Entry(self._options_giftcard)
+        self._giftcard_message_entry.config(
+            textvariable=self._giftcard_message)
+        self._options_quote_id = tk.LabelFrame(self._options)
+        self._options_quote_id.config(
+            bg=ColourScheme.GREY, padx=5, pady=5,
+            text="Quote Identification")
+        self._id_name_label = tk.Label(self._options_quote_id)
+        self._id_name_label.config(
+            bg=ColourScheme.GREY, padx=5, pady=5, text="Quote Name ")
+        self._quote_name = tk.StringVar()
+        self._id_name = tk.Entry(self._options_quote_id)
+        self._id_name.config(
+            textvariable=self._quote_name)
+
+    def _construct_footer(self) -> None:
+        self._footer = tk.Frame(self)
+        self._footer.config(
+            bg=ColourScheme.WHITE, padx=5, pady=5)
+        self._footer_save = tk.Button(self._footer)
+        self._footer_save.config(
+            bg=ColourScheme.DARK_MINT_GREEN, borderwidth=1,
+            fg=ColourScheme.WHITE, font="helvetica 10 bold",
+            highlightthickness=1, highlightcolor=ColourScheme.GREY,
+            padx=10, pady=3, text="Save")
+        self._footer_cancel = tk.Button(self._footer)
+        self._footer_cancel.config(
+            bg=ColourScheme.WHITE, borderwidth=1,
+            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
+            highlightthickness=1, highlightcolor=ColourScheme.GREY,
+            padx=10, pady=3, text="Cancel")
+
+    def _actions(self) -> None:
+        for shape_button in self._shape_types:
+            shape_button.config(
+                command=lambda: [
+                    self._preview_pane.preview_shape(self._shape.get()),
+                    self._handle_dimension_display_change()])
+        for paper_grade in self._paper_grades:
+            paper_grade.config(
+                command=lambda: [
+                    self._preview_pane.preview_grade_pattern(
+                        self._paper.get()),
+                    self._handle_colour_check()])
+        self._colour_selection.bind(
+            "<<ComboboxSelected>>", lambda event: [
+                self._handle_colour_selection_change(event),
+                self._handle_colour_check()])
+        self._footer_cancel.config(
+            command=self._handle_cancel_button)
+        self._footer_save.config(
+            command=self._handle_save_button)
+
+    def _track(self) -> None:
+        self._quote_name.trace("w", self._schedule_quote_update)
+        self._length_one.trace("w", self._schedule_quote_update)
+        self._length_two.trace("w", self._schedule_quote_update)
+        self._length_three.trace("w", self._schedule_quote_update)
+        self._shape.trace("w", self._schedule_quote_update)
+        self._paper.trace("w", self._schedule_quote_update)
+        self._colour.trace("w", self._schedule_quote_update)
+        self._bow.trace("w", self._schedule_quote_update)
+        self._giftcard.trace("w", self._schedule_quote_update)
+        self._giftcard_message.trace("w", self._schedule_quote_update)
+
+    def _display(self) -> None:
+        self._header.pack(
+            anchor="w", fill="x", side="top")
+        self._preview_pane.pack(
+            anchor="nw", fill="x", side="top")
+        self._footer.pack(
+            anchor="e", fill="x", side="bottom")
+        self._footer_save.pack(
+            anchor="e", side="right")
+        self._footer_cancel.pack(
+            anchor="e", padx=10, side="right")
+        self._options.pack(
+            anchor="nw", expand=True, fill="both", side="left")
+        self._options_col_shape.grid(
+            column=0, row=0, padx=5, pady=5)
+        self._options_shape.grid(
+            column=0, row=1, padx=5, pady=5, sticky="nesw")
+        for position, shape_button in enumerate(self._shape_types):
+            shape_button.grid(
+                column=position % 3, row=position // 3, padx=5, pady=5,
+                sticky="w")
+        self._options_dimensions.grid(
+            column=0, row=2, padx=5, pady=5, sticky="nesw")
+        self._dimension_one_label.grid(
+            column=0, row=0, padx=5, pady=5)
+        self._dimension_one.grid(
+            column=1, row=0, padx=5, pady=5)
+        self._dimension_two_label.grid(
+            column=0, row=1, padx=5, pady=5)
+        self._dimension_two.grid(
+            column=1, row=1, padx=5, pady=5)
+        self._dimension_three_label.grid(
+            column=0, row=2, padx=5, pady=5)
+        self._dimension_three.grid(
+            column=1, row=2, padx=5, pady=5)
+        self._options_paper.grid(
+            column=1, row=1, padx=5, pady=5, sticky="nesw")
+        for position, paper_grade in enumerate(self._paper_grades):
+            paper_grade.grid(
+                column=position % 2, row=position // 2, padx=5, pady=5)
+        self._options_colour.grid(
+            column=1, row=2, padx=5, pady=5, sticky="nesw")
+        self._colour_selection.grid(
+            column=0, row=0, padx=5, pady=5, sticky="nesw")
+        self._colour_black_disclaimer.grid(
+            column=0, row=1, padx=5, pady=5, sticky="nesw")
+        self._options_col_paper.grid(
+            column=1, row=0, padx=5, pady=5)
+        self._options_col_additional.grid(
+            column=2, row=0, padx=5, pady=5)
+        self._options_bow.grid(
+            column=2, row=1, padx=5, pady=5, sticky="nesw")
+        self._bow_addition.grid(
+            column=0, row=0, padx=5, pady=5)
+        self._options_giftcard.grid(
+            column=2, row=2, padx=5, pady=5, sticky="nesw")
+        self._giftcard_addition.grid(
+            column=0, row=0, padx=5, pady=5)
+        self._giftcard_message_label.grid(
+            column=0, row=1, padx=5, pady=5)
+        self._giftcard_message_entry.grid(
+            column=1, row=1, padx=5, pady=5)
+        self._options_quote_id.grid(
+            column=0, row=3, columnspan=3, padx=5, pady=5, sticky="nesw")
+        self._id_name_label.grid(
+            column=0, row=0, padx=5, pady=5)
+        self._id_name.grid(
+            column=1, row=0, padx=5, pady=5)
+
+    def _handle_dimension_display_change(self) -> None:
+        shape_type = ShapeRegistry.find_by_name(self._shape.get())
+        if shape_type is None:
+            return
+        for position, (label, entry) in enumerate((
+                (self._dimension_one_label, self._dimension_one),
+                (self._dimension_two_label, self._dimension_two),
+                (self._dimension_three_label, self._dimension_three))):
+            if position < len(shape_type.dimensions):
+                label.config(
+                    text=f"{shape_type.dimensions[position]}   ")
+                entry.config(
+                    state="normal")
+            else:
+                label.config(
+                    text=" ")
+                entry.config(
+                    state="disabled")
+
+    def _handle_colour_selection_change(self, event: tk.Event, /) -> None:
+        self._preview_pane.set_colour_displayed(
+            Translator.translate_colour(
+                self._colour.get(), human_readable=False))
+        self._preview_pane.preview_grade_pattern(self._paper.get())
+
+    def _handle_colour_check(self) -> None:
+        if self._preview_pane.get_colour_displayed() == "#000000":
+            self._colour_black_disclaimer.config(
+                text=(
+                    "Please Note:\n"
+                    + "   Black is not a wrapping\n   paper colour option."))
+        else:
+            self._colour_black_disclaimer.config(text=" ")
+
+    def _handle_callback_quote_update(self, var, index, mode) -> int:
+        ready_to_calculate: bool = True
+        the_shape: PresentType = Translator.translate_present_type(
+            shape=self._shape.get(),
+            length_one=self._length_one.get(),
+            length_two=self._length_two.get(),
+            length_three=self._length_three.get())
+        the_paper: WrappingPaper = Translator.translate_wrapping_paper_type(
+            paper=self._paper.get(),
+            colour=self._preview_pane.get_colour_displayed())
+        the_gift_card: GiftCard = Translator.translate_gift_card(
+            gift_card=self._giftcard.get(),
+            message=self._giftcard_message.get())
+        the_bow: Bow = Translator.translate_bow(bow=self._bow.get())
+        if (not the_shape) or (not the_paper):
+            ready_to_calculate = False
+            return 1
+        if ready_to_calculate:
+            self._the_quote = Quote(
+                quote_title=self._quote_name.get(),
+                present_type=the_shape,
+                wrapping_paper=the_paper,
+                gift_card=the_gift_card,
+                bow=the_bow)
+            self._preview_pane.set_quote_title(
+                get_price_cache().get_price(self._the_quote),
+                self._quote_name.get())
+            self._preview_pane.set_quote_shape(
+                the_shape)
+        if self._preview_pane.get_colour_displayed() == "#000000":
+            return 2
+        if Translator.check_present_lengths(the_shape):
+            return 3
+        if the_shape.get_recommended_area() <= 0:
+            return 3
+        return 0
+
+    def _schedule_quote_update(self, var, index, mode) -> None:
+        # a burst of variable changes (a keystroke, loading a quote) is
+        # coalesced into a single recalculation once Tk is idle.
+        if self._pending_quote_update is not None:
+            __class__.quote_updates_avoided += 1
+            return
+        self._pending_quote_update = self.after_idle(
+            self._run_scheduled_quote_update)
+
+    def _run_scheduled_quote_update(self) -> None:
+        self._pending_quote_update = None
+        __class__.quote_updates_run += 1
+        self._handle_callback_quote_update(None, None, None)
+
+    def _cancel_scheduled_quote_update(self) -> None:
+        if self._pending_quote_update is not None:
+            self.after_cancel(self._pending_quote_update)
+            self._pending_quote_update = None
+
+    def _handle_cancel_button(self) -> None:
+        self._avoid_message_box_exit = True
+        self.destroy()
+
+    def _handle_save_button(self) -> None:
+        self._avoid_message_box_exit = True
+        if not self._check_quote():
+            self._save_quote()
+            self.destroy()
+
+    def _check_quote(self) -> int:
+        if (value := self._handle_callback_quote_update(None, None, None)):
+            if value == 1:
+                tkmsg.showerror(
+                    "Quote Error",
+                    "This quote is not complete.")
+            elif value == 2:
+                tkmsg.showerror(
+                    "Quote Error",
+                    "Invalid wrapping paper colour within the quote..")
+            elif value == 3:
+                tkmsg.showerror(
+                    "Quote Error",
+                    "Invalid dimensions provided for present.")
+            return 1
+        return 0
+
+    def _load_quote(self) -> None:
+        self._length_one.set("0")
+        self._length_two.set("0")
+        self._length_three.set("0")
+        if not self._new_quote:
+            quote = self._order.get_quote(self._quote_index)
+            self._quote_name.set(quote.title)
+            shape_type = ShapeRegistry.find_for(quote.present)
+            if shape_type is not None:
+                self._shape.set(shape_type.name)
+                self._preview_pane.preview_shape(shape_type.name)
+                lengths = (
+                    self._length_one, self._length_two, self._length_three)
+                dimensions = quote.present.get_dimensions()
+                for position in range(len(shape_type.dimensions)):
+                    lengths[position].set(str(dimensions[position]))
+            self._preview_pane.set_colour_displayed(
+                quote.wrapping_paper.get_colour())
+            self._colour.set(get_catalogue().describe_colour(
+                self._preview_pane.get_colour_displayed()))
+            self._paper.set(quote.wrapping_paper.get_grade())
+            self._preview_pane.preview_grade_pattern(
+                quote.wrapping_paper.get_grade())
+            if isinstance(quote.bow, Bow):
+                self._bow.set(1)
+            if isinstance(quote.gift_card, GiftCard):
+                self._giftcard.set(1)
+                self._giftcard_message.set(
+                    quote.gift_card.get_message())
+            self._handle_dimension_display_change()
+
+    def _save_quote(self) -> None:
+        quote = Quote(
+            quote_title=Translator.check_quote_title(
+                self._quote_name.get()),
+            present_type=Translator.translate_present_type(
+                shape=self._preview_pane.get_shape_displayed(),
+                length_one=self._length_one.get(),
+                length_two=self._length_two.get(),
+                length_three=self._length_three.get()),
+            wrapping_paper=Translator.translate_wrapping_paper_type(
+                paper=self._preview_pane.get_pattern_displayed(),
+                colour=self._preview_pane.get_colour_displayed()),
+            gift_card=Translator.translate_gift_card(
+                gift_card=self._giftcard.get(),
+                message=self._giftcard_message.get()),
+            bow=Translator.translate_bow(
+                bow=self._bow.get()))
+        if not self._new_quote:
+            self._order.replace_quote(self._quote_index, quote)
+            if self._journal is not None:
+                self._journal.replace_quote(self._quote_index, quote)
+        else:
+            self._order.add_quote(quote)
+            if self._journal is not None:
+                self._journal.add_quote(quote)
+
+    def destroy(self) -> None:
+        if not self._avoid_message_box_exit:
+            result = tkmsg.askyesnocancel(
+                "Save Quote?",
+                "Would you want save the current quote?")
+            if result:
+                if self._check_quote():
+                    return
+                self._save_quote()
+            elif result is None:
+                return
+        self._cancel_scheduled_quote_update()
+        __class__.window_running_check = False
+        self.master.update()
+        return super().destroy()
+
+
+class QuoteImportWindow(tk.Toplevel):
+    # shows the progress of a QuoteImport and hands its quotes to
+    # add_quotes on the Tk thread, a batch at a time between events.
+
+    # milliseconds between batches.
+    POLL_INTERVAL: int = 10
+    # rejected rows listed once the import has finished.
+    MAX_REJECTS_SHOWN: int = 5
+
+    def __init__(self,
+                 parent: tk.Tk,
+                 quote_import: QuoteImport,
+                 add_quotes: typing.Callable[[typing.Sequence[Quote]], None],
+                 /) -> None:
+        super().__init__(parent)
+        self._import = quote_import
+        self._add_quotes = add_quotes
+        self._rejects: typing.List[typing.Tuple[int, str]] = []
+        self._pending_poll: str = None
+        self.minsize(420, 200)
+        self.resizable(False, False)
+        self.title(f"Quote Import | {APPLICATION_NAME}")
+        self._construct()
+        self._actions()
+        self._display()
+        self._import.start()
+        self._pending_poll = self.after(self.POLL_INTERVAL, self._poll)
+
+    def _construct(self) -> None:
+        self._header = WindowHeader(self)
+        self._header.set_title("Importing quotes.")
+        self._body = tk.Frame(self)
+        self._body.config(
+            bg=ColourScheme.GREY, padx=25, pady=15)
+        self._file_label = tk.Label(self._body)
+        self._file_label.config(
+            bg=ColourScheme.GREY, font="helvetica 10", justify="left",
+            text=os.path.basename(self._import.get_path()))
+        self._progress = tk.DoubleVar()
+        self._progress_bar = ttk.Progressbar(self._body)
+        self._progress_bar.config(
+            length=370, maximum=100, mode="determinate",
+            variable=self._progress)
+        self._status = tk.StringVar()
+        self._status_label = tk.Label(self._body)
+        self._status_label.config(
+            bg=ColourScheme.GREY, font="helvetica 10", justify="left",
+            textvariable=self._status)
+        self._footer = tk.Frame(self)
+        self._footer.config(
+            bg=ColourScheme.WHITE, padx=5, pady=5)
+        self._footer_cancel = tk.Button(self._footer)
+        self._footer_cancel.config(
+            bg=ColourScheme.WHITE, borderwidth=1,
+            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
+            highlightthickness=1, highlightcolor=ColourScheme.GREY,
+            padx=10, pady=3, text="Cancel")
+
+    def _actions(self) -> None:
+        self._footer_cancel.config(
+            command=self._handle_cancel_button)
+        self.protocol("WM_DELETE_WINDOW", self._handle_cancel_button)
+
+    def _display(self) -> None:
+        self._header.pack(
+            anchor="w", fill="x", side="top")
+        self._footer.pack(
+            anchor="e", fill="x", side="bottom")
+        self._footer_cancel.pack(
+            anchor="e", side="right")
+        self._body.pack(
+            anchor="nw", expand=True, fill="both", side="top")
+        self._file_label.pack(
+            anchor="nw", pady=5, side="top")
+        self._progress_bar.pack(
+            anchor="nw", pady=5, side="top")
+        self._status_label.pack(
+            anchor="nw", pady=5, side="top")
+
+    def get_import(self) -> QuoteImport:
+        return self._import
+
+    def _poll(self) -> None:
+        self._pending_poll = None
+        for batch in self._import.take_batches():
+            if batch.quotes:
+                self._add_quotes(batch.quotes)
+            self._rejects.extend(
+                batch.rejected[:self.MAX_REJECTS_SHOWN - len(self._rejects)])
+            self._progress.set(batch.progress * 100)
+        self._status.set(
+            f"{self._import.get_imported_count()} quote(s) imported, "
+            + f"{self._import.get_rejected_count()} row(s) rejected.")
+        if self._import.is_finished():
+            self._handle_import_finished()
+        else:
+            self._pending_poll = self.after(self.POLL_INTERVAL, self._poll)
+
+    def _handle_import_finished(self) -> None:
+        if self._pending_poll is not None:
+            self.after_cancel(self._pending_poll)
+            self._pending_poll = None
+        if self._import.is_cancelled():
+            self._header.set_title("Import cancelled.")
+        elif self._import.get_error():
+            self._header.set_title("Import stopped.")
+        else:
+            self._header.set_title("Quotes imported.")
+            self._progress.set(100)
+        lines = [
+            f"{self._import.get_imported_count()} quote(s) imported, "
+            + f"{self._import.get_rejected_count()} row(s) rejected."]
+        if self._import.get_error():
+            lines.append("The file could not be read to the end:\n"
+                         + f"   {self._import.get_error()}")
+        lines.extend(
+            f"   Row {row_number}: {reason}"
+            for row_number, reason in self._rejects)
+        if self._import.get_rejected_count() > len(self._rejects):
+            lines.append("   ...")
+        self._status.set("\n".join(lines))
+        self._footer_cancel.config(text="Close")
+
+    def _handle_cancel_button(self) -> None:
+        if not self._import.is_finished():
+            # the quotes imported so far are kept.
+            self._import.cancel()
+            self._handle_import_finished()
+        else:
+            self.destroy()
+
+    def destroy(self) -> None:
+        if not self._import.is_finished():
+            self._import.cancel()
+        if self._pending_poll is not None:
+            self.after_cancel(self._pending_poll)
+            self._pending_poll = None
+        return super().destroy()
+
+
+class MainWindow(tk.Tk):
+
+    # the journal is synced at most this often, see _schedule_journal_sync.
+    JOURNAL_SYNC_INTERVAL: int = 500
+    # milliseconds between checks on the receipts being written.
+    EXPORT_CHECK_INTERVAL: int = 100
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.minsize(800, 600)
+        self.title(f"Main Window | {APPLICATION_NAME}")
+        self._store: OrderStore = None
+        self._order_count: int = 1
+        try:
+            self._store = OrderStore()
+            self._order_count = self._store.get_last_order_number() + 1
+            if (skipped := self._store.get_skipped_count()):
+                tkmsg.showwarning(
+                    "Order Store Warning",
+                    f"{skipped} saved quote(s) could not be priced while "
+                    + "the order store was upgraded, as their shape or "
+                    + "paper is no longer on offer. They keep their "
+                    + "prices but are left out of the paper usage.")
+        except sqlite3.Error:
+            tkmsg.showwarning(
+                "Order Store Warning",
+                "The order store could not be opened, orders will not be "
+                + "saved when they are finished.")
+        self._order = Order(self._order_count)
+        self._journal: OrderJournal = OrderJournal()
+        self._pending_journal_sync: str = None
+        self._recover_order()
+        self._ask_export: bool = True
+        self._selected_index: int = -1
+        self._currently_editing_index: int = -1
+        self._import_window: QuoteImportWindow = None
+        # receipts are written one at a time on the export thread, from a
+        # snapshot of the order.
+        self._exporter = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ReceiptExport")
+        self._pending_exports: typing.List[typing.Tuple[
+            OrderSnapshot, concurrent.futures.Future, bool]] = []
+        self._pending_export_check: str = None
+        self._construct()
+        self._actions()
+        self._display()
+
+    def _construct(self) -> None:
+        self._construct_header()
+        self._construct_sidebar()
+        self._construct_quote_viewer()
+
+    def _construct_header(self) -> None:
+        self._header = WindowHeader(self)
+        self._header.set_title("Current quotes for this order.")
+
+    def _construct_sidebar(self) -> None:
+        self._sidebar = tk.Frame(self)
+        self._sidebar.config(
+            bg=ColourScheme.WHITE, padx=15, pady=15, width=100)
+        self._sidebar_quote_actions = tk.Label(self._sidebar)
+        self._sidebar_quote_actions.config(
+            bg=ColourScheme.WHITE, font="helvetica 11 bold",
+            text="Quote actions")
+        self._sidebar_add_quote = tk.Button(self._sidebar)
+        self._sidebar_add_quote.config(
+            bg=ColourScheme.WHITE, borderwidth=0,
+            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
+            text="Add quote")
+        self._sidebar_edit_quote = tk.Button(self._sidebar)
+        self._sidebar_edit_quote.config(
+            bg=ColourScheme.WHITE, borderwidth=0,
+            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
+            text="Edit quote")
+        self._sidebar_del_quote = tk.Button(self._sidebar)
+        self._sidebar_del_quote.config(
+            bg=ColourScheme.WHITE, borderwidth=0,
+            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
+            text="Delete quote")
+        self._sidebar_import_quotes = tk.Button(self._sidebar)
+        self._sidebar_import_quotes.config(
+            bg=ColourScheme.WHITE, borderwidth=0,
+            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
+            text="Import quotes")
+        self._sidebar_actions_seperator = tk.Frame(self._sidebar)
+        self._sidebar_actions_seperator.config(
+            bg=ColourScheme.WHITE, height=20)
+        self._sidebar_order_actions = tk.Label(self._sidebar)
+        self._sidebar_order_actions.config(
+            bg=ColourScheme.WHITE, font="helvetica 11 bold",
+            text="Order actions")
+        self._sidebar_export_order = tk.Button(self._sidebar)
+        self._sidebar_export_order.config(
+            bg=ColourScheme.WHITE, borderwidth=0,
+            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
+            text="Export order")
+        self._sidebar_cutting_plan = tk.Button(self._sidebar)
+        self._sidebar_cutting_plan.config(
+            bg=ColourScheme.WHITE, borderwidth=0,
+            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
+            text="Cutting plan")
+        self._sidebar_paper_usage = tk.Button(self._sidebar)
+        self._sidebar_paper_usage.config(
+            bg=ColourScheme.WHITE, borderwidth=0,
+            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
+            text="Paper usage")
+        self._sidebar_new_order = tk.Button(self._sidebar)
+        self._sidebar_new_order.config(
+            bg=ColourScheme.WHITE, borderwidth=0,
+            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
+            text="New order")
+        self._sidebar_checkout = tk.Button(self._sidebar)
+        self._sidebar_checkout.config(
+            bg=ColourScheme.WHITE, borderwidth=0,
+            fg=ColourScheme.DARK_MINT_GREEN, font="helvetica 10 bold",
+            text="Checkout")
+        self._sidebar_version = tk.Label(self._sidebar)
+        self._sidebar_version.config(
+            bg=ColourScheme.WHITE, font="helvetica 9", text="Version")
+        self._sidebar_version_number = tk.Label(self._sidebar)
+        self._sidebar_version_number.config(
+            bg=ColourScheme.WHITE, font="helvetica 9",
+            text=APPLICATION_VERSION)
+
+    def _construct_quote_viewer(self) -> None:
+        self._quotes_frame = tk.Frame(self)
+        self._quotes_frame.config(bg=ColourScheme.GREY, padx=15, pady=15)
+        self._order_details = tk.StringVar()
+        self._order_summary = tk.Label(self._quotes_frame)
+        self._order_summary.config(
+            bg=ColourScheme.GREY, borderwidth=0, fg=ColourScheme.BLACK,
+            font="helvetica 11 bold", textvariable=self._order_details)
+        self._order_details.set(
+            f"Order {self._order.get_order_number()}     "
+            + f"      {self._order.get_quote_count()} Quote(s)     "
+            + f"      £{self._order.calculate_total_price():.2f}")
+        self._quotes_view = QuoteListView(self._quotes_frame)
+        self._quotes_view.set_order(self._order)
+        self._quote_preview_pane = QuoteSummaryPane(self._quotes_frame)
+
+    def _actions(self) -> None:
+        self._sidebar_add_quote.config(
+            command=lambda: self._handle_add_quote())
+        self._sidebar_edit_quote.config(
+            command=lambda: self._handle_edit_quote())
+        self._sidebar_del_quote.config(
+            command=lambda: self._handle_delete_quote())
+        self._sidebar_import_quotes.config(
+            command=lambda: self._handle_import_quotes())
+        self._sidebar_export_order.config(
+            command=lambda: self._handle_export_order())
+        self._sidebar_cutting_plan.config(
+            command=lambda: self._handle_cutting_plan())
+        self._sidebar_paper_usage.config(
+            command=lambda: self._handle_paper_usage())
+        self._sidebar_new_order.config(
+            command=lambda: self._handle_new_order())
+        self._sidebar_checkout.config(
+            command=lambda: self._handle_checkout())
+        self._quotes_view.set_selection_command(
+            self._handle_quote_selection_change)
+
+    def _display(self) -> None:
+        self._header.pack(
+            anchor="w", fill="x", side="top")
+        self._sidebar.pack(
+            anchor="nw", fill="y", side="left")
+        self._sidebar_quote_actions.pack(
+            anchor="nw", side="top")
+        self._sidebar_add_quote.pack(
+            anchor="nw", side="top")
+        self._sidebar_edit_quote.pack(
+            anchor="nw", side="top")
+        self._sidebar_del_quote.pack(
+            anchor="nw", side="top")
+        self._sidebar_import_quotes.pack(
+            anchor="nw", side="top")
+        self._sidebar_actions_seperator.pack(
+            anchor="nw", side="top")
+        self._sidebar_order_actions.pack(
+            anchor="nw", side="top")
+        self._sidebar_export_order.pack(
+            anchor="nw", side="top")
+        self._sidebar_cutting_plan.pack(
+            anchor="nw", side="top")
+        self._sidebar_paper_usage.pack(
+            anchor="nw", side="top")
+        self._sidebar_new_order.pack(
+            anchor="nw", side="top")
+        self._sidebar_checkout.pack(
+            anchor="nw", side="top")
+        self._sidebar_version_number.pack(
+            anchor="nw", side="bottom")
+        self._sidebar_version.pack(
+            anchor="nw", side="bottom")
+        self._quotes_frame.pack(
+            anchor="nw", expand=True, fill="both", side="top")
+        self._quote_preview_pane.pack(
+            anchor="nw", fill="x", side="bottom")
+        self._order_summary.pack(
+            anchor="nw", side="top")
+        self._quotes_view.pack(
+            anchor="nw", expand=True, fill="both", pady=10, side="top")
+
+    def _recover_order(self) -> None:
+        # an order left in the journal by an earlier run is carried on,
+        # unless it reached the order store before the run stopped.
+        order = self._journal.replay()
+        if (order is not None and order.get_quote_count() > 0
+                and order.get_order_number() >= self._order_count):
+            self._order = order
+            self._order_count = order.get_order_number()
+            tkmsg.showinfo(
+                "Order Recovered",
+                f"Order {self._order_count} was not finished when the "
+                + "application last closed and has been recovered with "
+                + f"{order.get_quote_count()} quote(s)."
+                + (f"\n\n{skipped} change(s) could not be recovered, as "
+                   + "the paper catalogue has changed since."
+                   if (skipped := self._journal.get_skipped_count())
+                   else ""))
+        elif self._journal.begin(self._order_count):
+            self._journal = None
+            tkmsg.showwarning(
+                "Order Journal Warning",
+                "The order journal could not be opened, the order in "
+                + "progress will not be recovered if the application "
+                + "stops unexpectedly.")
+
+    def _schedule_journal_sync(self) -> None:
+        # changes are written to the journal straight away but synced to
+        # disk as a group, once per interval at most.
+        if (self._journal is None or self._pending_journal_sync is not None
+                or not self._journal.has_unsynced_records()):
+            return
+        self._pending_journal_sync = self.after(
+            self.JOURNAL_SYNC_INTERVAL, self._run_journal_sync)
+
+    def _run_journal_sync(self) -> None:
+        self._pending_journal_sync = None
+        if self._journal is not None:
+            self._journal.sync()
+
+    def _handle_quote_update(self) -> None:
+        self._ask_export = True
+        if self._journal is not None:
+            self._journal.check_compaction(self._order)
+            self._schedule_journal_sync()
+        self._quotes_view.refresh()
+        self._order_details.set(
+            f"Order {self._order.get_order_number()}     "
+            + f"      {self._order.get_quote_count()} Quote(s)     "
+            + f"      £{self._order.calculate_total_price():.2f}")
+
+    def _handle_add_quote(self) -> None:
+        if not QuoteConfigurationWindow.window_running_check:
+            quote_config_window = QuoteConfigurationWindow(
+                self, True, self._order, self._order.get_quote_count(),
+                journal=self._journal)
+        else:
+            QuoteConfigurationWindow.raise_window_running_message()
+
+    def _handle_edit_quote(self) -> None:
+        try:
+            if self._selected_index != -1:
+                if not QuoteConfigurationWindow.window_running_check:
+                    self._currently_editing_index = self._selected_index
+                    quote_config_window = QuoteConfigurationWindow(
+                        self, False, self._order, self._selected_index,
+                        journal=self._journal)
+                else:
+                    QuoteConfigurationWindow.raise_window_running_message()
+            else:
+                raise IndexError
+        except IndexError:
+            tkmsg.showerror(
+                "Selection Error",
+                "No quote selected to edit.")
+
+    def _handle_delete_quote(self) -> None:
+        try:
+            if (self._selected_index == self._currently_editing_index
+                    and self._selected_index != -1):
+                tkmsg.showerror(
+                    "Deletion Error",
+                    "You cannot delete the quote you are currently editing.")
+            else:
+                self._order.delete_quote(self._selected_index)
+                if self._journal is not None:
+                    self._journal.delete_quote(self._selected_index)
+        except IndexError:
+            tkmsg.showerror(
+                "Selection Error",
+                "No quote selected to delete.")
+        self._quotes_view.clear_selection()
+        self._handle_quote_update()
+        self._quote_preview_pane.clear_preview()
+        self._selected_index = -1
+
+    def _is_importing(self) -> bool:
+        return (self._import_window is not None
+                and not self._import_window.get_import().is_finished())
+
+    def _handle_import_quotes(self) -> None:
+        if self._is_importing():
+            self._import_window.lift()
+            return
+        path = tkfile.askopenfilename(
+            parent=self, title="Import Quotes",
+            filetypes=(("Quote files", "*.csv *.jsonl"), ("All files", "*")))
+        if not path:
+            return
+        if self._import_window is not None:
+            self._import_window.destroy()
+        self._import_window = QuoteImportWindow(
+            self, QuoteImport(path), self._handle_imported_quotes)
+
+    def _handle_imported_quotes(self, quotes: typing.Sequence[Quote], /
+                                ) -> None:
+        # a batch from the import window, added as one update and written
+        # to the journal as one.
+        for quote in quotes:
+            self._order.add_quote(quote)
+        if self._journal is not None:
+            self._journal.add_quotes(quotes)
+        self._handle_quote_update()
+
+    def _check_import_finished(self, title: str, /) -> int:
+        # orders are not finished while quotes are still being imported.
+        if not self._is_importing():
+            return 0
+        tkmsg.showerror(
+            title,
+            "Please wait for the quote import to finish, or cancel it, "
+            + "before finishing the order.")
+        return 1
+
+    def _handle_export_order(self) -> None:
+        if self._order.get_quote_count() == 0:
+            tkmsg.showerror(
+                "Export Error",
+                "You cannot export an empty order.")
+            return
+        self._export_order(report_success=True)
+        self._ask_export = False
+
+    def _export_order(self, *, report_success: bool) -> None:
+        # returns straight away, the outcome is reported once the receipt
+        # has been written (see _run_export_check). failures are always
+        # reported.
+        snapshot = self._order.snapshot()
+        future = self._exporter.submit(snapshot.export_order)
+        self._pending_exports.append((snapshot, future, report_success))
+        self._schedule_export_check()
+
+    def _schedule_export_check(self) -> None:
+        if self._pending_export_check is not None or not self._pending_exports:
+            return
+        self._pending_export_check = self.after(
+            self.EXPORT_CHECK_INTERVAL, self._run_export_check)
+
+    def _run_export_check(self) -> None:
+        self._pending_export_check = None
+        self._report_finished_exports()
+        self._schedule_export_check()
+
+    def _report_finished_exports(self) -> None:
+        finished = []
+        pending = []
+        for export in self._pending_exports:
+            (finished if export[1].done() else pending).append(export)
+        self._pending_exports = pending
+        for snapshot, future, report_success in finished:
+            if future.exception() is None and not future.result():
+                if report_success:
+                    tkmsg.showinfo(
+                        "Quotes Exported",
+                        f"The quotes of order {snapshot.order_number} have "
+                        + "been successfully exported to:\n"
+                        + os.path.abspath(snapshot.get_receipt_name()))
+                continue
+            if snapshot.order_number == self._order.get_order_number():
+                self._ask_export = True
+            tkmsg.showerror(
+                "Export Error",
+                "Failed to export the quotes of order "
+                + f"{snapshot.order_number}.\n"
+                + "Please ensure the program has write access to the "
+                + "relative directory.")
+
+    def _handle_cutting_plan(self) -> None:
+        if self._order.get_quote_count() == 0:
+            tkmsg.showerror(
+                "Cutting Plan Error",
+                "There are no quotes to plan the cutting of.")
+            return
+        tkmsg.showinfo(
+            "Cutting Plan",
+            f"Order {self._order.get_order_number()}\n\n"
+            + describe_cutting_plans(plan_order_cutting(self._order)))
+
+    def _handle_paper_usage(self) -> None:
+        # this order as it stands, and the orders saved to the store today.
+        usage = self._order.get_paper_usage()
+        total = usage.get_total()
+        text = (
+            f"Order {self._order.get_order_number()}: {total.area:.2f}cm^2, "
+            + f"£{total.revenue:.2f}\n\n"
+            + (usage.describe() or "No paper used yet."))
+        if self._store is not None:
+            today = self._store.get_paper_usage(
+                date=get_current_time_date()[:10])
+            total = today.get_total()
+            text += (
+                f"\n\nSaved today: {total.area:.2f}cm^2, "
+                + f"£{total.revenue:.2f}\n\n"
+                + (today.describe() or "No orders saved yet."))
+        tkmsg.showinfo("Paper Usage", text)
+
+    def _handle_new_order(self) -> None:
+        if self._check_import_finished("New Order Error"):
+            return
+        if self._ask_export and self._order.get_quote_count() > 0:
+            result = tkmsg.askyesno(
+                "New Order",
+                "Export the quotes before starting a new order?")
+            if result:
+                self._export_order(report_success=False)
+        # the journal is only finished with once the order is in the
+        # store, so an order which could not be saved is carried on.
+        if self._save_order():
+            return
+        del self._order
+        self._order_count += 1
+        self._order = Order(self._order_count)
+        if self._journal is not None:
+            self._journal.begin(self._order_count)
+        self._quotes_view.set_order(self._order)
+        self._order_details.set(
+            f"Order {self._order.get_order_number()}     "
+            + f"      {self._order.get_quote_count()} Quote(s)     "
+            + f"      £{self._order.calculate_total_price():.2f}")
+        self.update()
+        self._ask_export = True
+
+    def _save_order(self) -> int:
+        if self._store is None or self._order.get_quote_count() == 0:
+            return 0
+        if self._store.save_order(self._order):
+            tkmsg.showerror(
+                "Save Error",
+                f"Failed to save order {self._order.get_order_number()} "
+                + "to the order store. The order has been kept, so it can "
+                + "be saved again.")
+            return 1
+        return 0
+
+    def _handle_checkout(self) -> None:
+        if self._check_import_finished("Checkout Error"):
+            return
+        if not QuoteConfigurationWindow.window_running_check:
+            tkmsg.showwarning(
+                "Checkout Warning",
+                "The checkout procedure has not been implemented "
+                + "as this is a proof of concept.\n\n"
+                + "The order will now be exported to the relative directory "
+                + "and a new order will be started to simulate the "
+                + "checkout process.\n\n"
+                + "If the order is empty, there will not be an exported file.")
+            if self._order.get_quote_count() > 0:
+                self._handle_export_order()
+            self._ask_export = False
+            self._handle_new_order()
+        else:
+            tkmsg.showerror(
+                "Checkout Error",
+                "Please make sure that the quote configuration window is "
+                + "closed before checking out.")
+
+    def _handle_quote_selection_change(self, index: int, /) -> None:
+        self._selected_index = index
+        self._quote_preview_pane.set_quote_title(
+            self._order.get_quote(self._selected_index).calculate_price(),
+            self._order.get_quote(self._selected_index).title)
+        self._quote_preview_pane.set_quote_shape(
+            self._order.get_quote(self._selected_index).present)
+        self._quote_preview_pane.set_quote_paper(
+            self._order.get_quote(self._selected_index).wrapping_paper)
+        self._quote_preview_pane.set_additional_options(
+            self._order.get_quote(self._selected_index).bow,
+            self._order.get_quote(self._selected_index).gift_card)
+
+    def destroy(self) -> None:
+        if not QuoteConfigurationWindow.window_running_check:
+            if self._is_importing():
+                # the quotes imported so far are kept.
+                self._import_window.destroy()
+            if self._ask_export and self._order.get_quote_count() > 0:
+                result = tkmsg.askyesnocancel(
+                    "Export Quotes?",
+                    "Export the quotes before exiting application?")
+                if result:
+                    self._export_order(report_success=False)
+                elif result is None:
+                    return
+            # the journal is only finished with once the order is in the
+            # store, or has no quotes to keep.
+            finished = self._order.get_quote_count() == 0 or (
+                self._store is not None and not self._save_order())
+            if self._store is not None:
+                self._store.close()
+            if self._pending_journal_sync is not None:
+                self.after_cancel(self._pending_journal_sync)
+            if self._journal is not None:
+                # kept for the next run if the order could not be saved.
+                if finished:
+                    self._journal.discard()
+                else:
+                    self._journal.close()
+            # receipts still being written are finished before exiting.
+            self._exporter.shutdown(wait=True)
+            if self._pending_export_check is not None:
+                self.after_cancel(self._pending_export_check)
+                self._pending_export_check = None
+            self._pending_exports = [
+                (snapshot, future, False)
+                for snapshot, future, _ in self._pending_exports]
+            self._report_finished_exports()
+            return super().destroy()
+        else:
+            tkmsg.showinfo(
+                "Window Instances Information",
+                "Please close all windows before exiting the application.")
+
+    def show(self) -> None:
+        self.mainloop()
+
+    def update(self) -> None:
+        self._handle_quote_update()
+        self._quote_preview_pane.clear_preview()
+        self._ask_export = True
+        if not QuoteConfigurationWindow.window_running_check:
+            self._currently_editing_index = -1
+        return super().update()
+
+
+# the instrumentation, see wpqc_metrics.
+
+
+wpqc_metrics.register(
+    QuoteSummaryPane, "set_quote_title", "set_quote_shape",
+    "set_quote_paper", "set_additional_options", "clear_preview",
+    "preview_shape", "preview_cube_shape", "preview_cuboid_shape",
+    "preview_cylinder_shape", "preview_cheap_pattern",
+    "preview_expensive_pattern", "preview_grade_pattern")
+wpqc_metrics.register(
+    QuoteConfigurationWindow, "_handle_callback_quote_update")
+wpqc_metrics.register(QuoteImportWindow, "_poll")
+wpqc_metrics.register(
+    MainWindow, "_handle_quote_update", "_handle_imported_quotes")
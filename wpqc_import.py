@@ -0,0 +1,160 @@
+"""
+Module: Wrapping Paper Quotes Calculator, Quote Import (wpqc_import.py)
+Author: Harsh Jayprakash <harshjayprakash@outlook.com>
+Date: (Original) May 2022
+License: MIT
+
+Requires Python 3.8 or newer.
+
+Imports a CSV or JSONL file of quotes, with the fields of the headless
+interface, into an order. The file is read and every row is validated
+on a worker thread, and the quotes are handed over in batches through a
+bounded queue, so the thread which owns the order (the Tk thread in the
+Quote Manager) takes them when it is ready and never waits on the file.
+The worker waits while the queue is full, so memory use does not grow
+with the size of the file, and can be cancelled at any time.
+"""
+import csv
+import os
+import queue
+import threading
+import typing
+
+from wpqc import Quote, read_quote_rows, translate_quote_row
+
+BATCH_SIZE: int = 500
+# batches waiting to be taken, the worker waits while this many are.
+MAX_PENDING_BATCHES: int = 8
+# seconds the worker waits for room in the queue before checking whether
+# it has been cancelled.
+PUT_TIMEOUT: float = 0.1
+
+
+class ImportBatch(typing.NamedTuple):
+    quotes: typing.Tuple[Quote, ...]
+    # (row number, reason) of the rows which are not valid quotes.
+    rejected: typing.Tuple[typing.Tuple[int, str], ...]
+    # the fraction of the file read, from 0 to 1.
+    progress: float
+
+
+class QuoteImport:
+    # one import of one file, see start, take_batches and cancel.
+
+    def __init__(self, path: str, /, *,
+                 batch_size: int = BATCH_SIZE) -> None:
+        self._path = path
+        self._batch_size = batch_size
+        self._batches: "queue.Queue[ImportBatch]" = queue.Queue(
+            MAX_PENDING_BATCHES)
+        self._cancelled = threading.Event()
+        self._thread: threading.Thread = None
+        # set by the worker before its last batch, read once it is taken.
+        self._error: str = ""
+        self._finished: bool = False
+        # bytes of the file read by the worker, for the progress.
+        self._bytes_read: int = 0
+        self._imported: int = 0
+        self._rejected: int = 0
+
+    def get_path(self) -> str:
+        return self._path
+
+    def get_imported_count(self) -> int:
+        # the quotes taken so far.
+        return self._imported
+
+    def get_rejected_count(self) -> int:
+        return self._rejected
+
+    def get_error(self) -> str:
+        # why the file could not be read to the end, once finished.
+        return self._error
+
+    def is_finished(self) -> bool:
+        # every batch has been taken, or the import was cancelled.
+        return self._finished
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def start(self) -> None:
+        # the worker is a daemon, so an import cannot keep the
+        # application running.
+        self._thread = threading.Thread(
+            target=self._run, name=f"QuoteImport {self._path}", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        # batches not yet taken are dropped.
+        self._cancelled.set()
+        self._finished = True
+        while True:
+            try:
+                self._batches.get_nowait()
+            except queue.Empty:
+                break
+
+    def take_batches(self, limit: int = 1, /) -> typing.List[ImportBatch]:
+        # up to limit batches, without waiting for the worker.
+        batches: typing.List[ImportBatch] = []
+        while len(batches) < limit and not self._finished:
+            try:
+                batch = self._batches.get_nowait()
+            except queue.Empty:
+                break
+            if batch is None:
+                self._finished = True
+                break
+            self._imported += len(batch.quotes)
+            self._rejected += len(batch.rejected)
+            batches.append(batch)
+        return batches
+
+    def _put(self, batch: ImportBatch, /) -> bool:
+        # waits for room in the queue, False once cancelled.
+        while not self._cancelled.is_set():
+            try:
+                self._batches.put(batch, timeout=PUT_TIMEOUT)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def _read_lines(self, handler: typing.BinaryIO, /
+                    ) -> typing.Iterator[str]:
+        for line in handler:
+            self._bytes_read += len(line)
+            yield line.decode("utf-8")
+
+    def _run(self) -> None:
+        quotes: typing.List[Quote] = []
+        rejected: typing.List[typing.Tuple[int, str]] = []
+        try:
+            size = max(os.path.getsize(self._path), 1)
+            file_format = (
+                "jsonl" if self._path.lower().endswith((".jsonl", ".ndjson"))
+                else "csv")
+            with open(self._path, "rb") as handler:
+                rows = read_quote_rows(
+                    self._read_lines(handler), file_format)
+                for row_number, (row, error) in enumerate(rows, 1):
+                    if self._cancelled.is_set():
+                        return
+                    quote = None
+                    if not error:
+                        quote, error = translate_quote_row(row)
+                    if quote is None:
+                        rejected.append((row_number, error))
+                    else:
+                        quotes.append(quote)
+                    if len(quotes) + len(rejected) >= self._batch_size:
+                        if not self._put(ImportBatch(
+                                tuple(quotes), tuple(rejected),
+                                min(self._bytes_read / size, 1))):
+                            return
+                        quotes, rejected = [], []
+        except (OSError, UnicodeDecodeError, csv.Error) as error:
+            self._error = str(error)
+        if self._put(ImportBatch(tuple(quotes), tuple(rejected), 1)):
+            self._put(None)
@@ -0,0 +1,319 @@
+"""
+Module: Wrapping Paper Quotes Calculator, Order Journal (wpqc_journal.py)
+Author: Harsh Jayprakash <harshjayprakash@outlook.com>
+Date: (Original) May 2022
+License: MIT
+
+Requires Python 3.8 or newer.
+
+An append-only journal of the changes made to the order in progress,
+so the order can be rebuilt if the application stops before the order
+is finished. Every record is written to the file as it happens, while
+the costly fsync is only done for a group of records at a time. The
+journal is rewritten from the order once it grows well past it, which
+keeps replay time bounded by the size of the order.
+"""
+import json
+import os
+import typing
+
+from wpqc import Order, Quote
+from wpqc_store import quote_to_record, record_to_quote
+
+DEFAULT_JOURNAL: str = "wpqc.journal"
+# records written before an fsync is forced, see sync for the timed one.
+GROUP_COMMIT_SIZE: int = 64
+# the journal is compacted once it holds this many records more than
+# are needed to rebuild the order.
+COMPACTION_SLACK: int = 256
+
+
+def _quote_fields(quote: Quote, /) -> typing.List[typing.Any]:
+    # the record without order number and position.
+    return list(quote_to_record(0, 0, quote)[2:])
+
+
+class _QuotePositions:
+    # the quotes of a journal being replayed, in the order they were
+    # added, so the index a record gives (which counts quotes skipped by
+    # the replay too) can be turned into an index into the order. two
+    # Fenwick trees (binary indexed trees) count the quotes still in the
+    # journal and those also in the order, so each lookup and change takes
+    # O(log n) steps however long the journal is.
+
+    __slots__ = ("_in_journal", "_in_order", "_kept")
+
+    def __init__(self) -> None:
+        # the trees are indexed from 1, slot i of the quotes is node i + 1.
+        self._in_journal: typing.List[int] = [0]
+        self._in_order: typing.List[int] = [0]
+        self._kept = bytearray()
+
+    def append(self) -> int:
+        # a quote added to the journal but not yet to the order.
+        _tree_append(self._in_journal, 1)
+        _tree_append(self._in_order, 0)
+        self._kept.append(0)
+        return len(self._kept) - 1
+
+    def find(self, position: int, /) -> int:
+        # the slot of the quote at a journal index, raises IndexError.
+        if position < 0:
+            raise IndexError(position)
+        return _tree_find(self._in_journal, position + 1) - 1
+
+    def is_kept(self, slot: int, /) -> bool:
+        return bool(self._kept[slot])
+
+    def get_order_index(self, slot: int, /) -> int:
+        # the quotes in the order before the slot's.
+        return _tree_sum(self._in_order, slot)
+
+    def keep(self, slot: int, /) -> None:
+        self._kept[slot] = 1
+        _tree_add(self._in_order, slot + 1, 1)
+
+    def skip(self, slot: int, /) -> None:
+        # the quote is still in the journal but not in the order.
+        if self._kept[slot]:
+            self._kept[slot] = 0
+            _tree_add(self._in_order, slot + 1, -1)
+
+    def remove(self, slot: int, /) -> None:
+        self.skip(slot)
+        _tree_add(self._in_journal, slot + 1, -1)
+
+
+def _tree_append(tree: typing.List[int], value: int, /) -> None:
+    # node i holds the sum of the values of nodes i - (i & -i) + 1 to i.
+    node = len(tree)
+    total = value
+    below = node - 1
+    while below > node - (node & -node):
+        total += tree[below]
+        below -= below & -below
+    tree.append(total)
+
+
+def _tree_add(tree: typing.List[int], node: int, value: int, /) -> None:
+    while node < len(tree):
+        tree[node] += value
+        node += node & -node
+
+
+def _tree_sum(tree: typing.List[int], node: int, /) -> int:
+    # the sum of the values of nodes 1 to node.
+    total = 0
+    while node > 0:
+        total += tree[node]
+        node -= node & -node
+    return total
+
+
+def _tree_find(tree: typing.List[int], count: int, /) -> int:
+    # the first node whose sum from node 1 reaches count, the values must
+    # not be negative. raises IndexError if there is none.
+    node = 0
+    step = 1 << (len(tree) - 1).bit_length()
+    while step:
+        if node + step < len(tree) and tree[node + step] < count:
+            node += step
+            count -= tree[node]
+        step >>= 1
+    if node + 1 >= len(tree):
+        raise IndexError(count)
+    return node + 1
+
+
+class OrderJournal:
+
+    def __init__(self, path: str = DEFAULT_JOURNAL, /) -> None:
+        self._path = path
+        self._handler: typing.TextIO = None
+        self._record_count: int = 0
+        self._quote_count: int = 0
+        self._unsynced_count: int = 0
+        self._skipped_count: int = 0
+
+    def __enter__(self) -> "OrderJournal":
+        return self
+
+    def __exit__(self, *exception: typing.Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._handler is not None:
+            self.sync()
+            self._handler.close()
+            self._handler = None
+
+    def discard(self) -> None:
+        # the order is finished with, nothing is left to replay.
+        if self._handler is not None:
+            self._handler.close()
+            self._handler = None
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
+    def get_record_count(self) -> int:
+        return self._record_count
+
+    def get_skipped_count(self) -> int:
+        # the records the last replay could not apply.
+        return self._skipped_count
+
+    def replay(self) -> Order:
+        # rebuilds the order in progress, or None when there is none.
+        # reading stops at the first record which is not whole, which can
+        # only be the last one written before the application stopped.
+        # records which can no longer be applied, such as quotes whose
+        # paper has left the catalogue, are skipped and counted, see
+        # get_skipped_count.
+        order: Order = None
+        positions = _QuotePositions()
+        self._skipped_count = 0
+        try:
+            with open(self._path, "r", encoding="utf-8") as handler:
+                for line in handler:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    try:
+                        if record["op"] == "begin":
+                            order = Order(record["order"])
+                            positions = _QuotePositions()
+                        elif order is None:
+                            break
+                        else:
+                            OrderJournal._apply(order, positions, record)
+                    except (ValueError, KeyError, TypeError, IndexError,
+                            AttributeError):
+                        self._skipped_count += 1
+        except FileNotFoundError:
+            pass
+        if order is None:
+            return None
+        self.compact(order)
+        return order
+
+    @staticmethod
+    def _apply(order: Order, positions: _QuotePositions,
+               record: typing.Dict[str, typing.Any], /) -> None:
+        # raises when the record cannot be applied, leaving positions in
+        # step with the journal.
+        operation = record["op"]
+        if operation == "add":
+            slot = positions.append()
+            order.add_quote(record_to_quote(record["quote"]))
+            positions.keep(slot)
+        elif operation == "replace":
+            slot = positions.find(record["index"])
+            if not positions.is_kept(slot):
+                raise ValueError(f"Quote {record['index']} was skipped")
+            index = positions.get_order_index(slot)
+            try:
+                quote = record_to_quote(record["quote"])
+            except ValueError:
+                # the quote it replaces is gone all the same.
+                order.delete_quote(index)
+                positions.skip(slot)
+                raise
+            order.replace_quote(index, quote)
+        elif operation == "delete":
+            slot = positions.find(record["index"])
+            if positions.is_kept(slot):
+                order.delete_quote(positions.get_order_index(slot))
+            positions.remove(slot)
+        else:
+            raise ValueError(f"Unknown journal operation: {operation}")
+
+    def begin(self, order_number: int, /) -> int:
+        # starts the journal afresh for a new order.
+        return self.compact(Order(order_number))
+
+    def compact(self, order: Order, /) -> int:
+        # the new journal is written beside the old one and swapped in,
+        # so a failure part way leaves the old journal untouched.
+        temporary_path = f"{self._path}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as handler:
+                handler.write(json.dumps(
+                    {"op": "begin", "order": order.get_order_number()}))
+                handler.write("\n")
+                for quote in order:
+                    handler.write(json.dumps(
+                        {"op": "add", "quote": _quote_fields(quote)}))
+                    handler.write("\n")
+                handler.flush()
+                os.fsync(handler.fileno())
+            if self._handler is not None:
+                self._handler.close()
+            os.replace(temporary_path, self._path)
+            self._handler = open(self._path, "a", encoding="utf-8")
+        except OSError:
+            self._handler = None
+            return 1
+        self._quote_count = len(order)
+        self._record_count = self._quote_count + 1
+        self._unsynced_count = 0
+        return 0
+
+    def check_compaction(self, order: Order, /) -> int:
+        if self._record_count - self._quote_count - 1 < COMPACTION_SLACK:
+            return 0
+        return self.compact(order)
+
+    def add_quote(self, quote: Quote, /) -> int:
+        self._quote_count += 1
+        return self._append({"op": "add", "quote": _quote_fields(quote)})
+
+    def add_quotes(self, quotes: typing.Iterable[Quote], /) -> int:
+        # a batch written and flushed as one, so it costs one fsync at
+        # most, however large it is.
+        records = [
+            {"op": "add", "quote": _quote_fields(quote)} for quote in quotes]
+        self._quote_count += len(records)
+        return self._append(*records)
+
+    def replace_quote(self, index: int, quote: Quote, /) -> int:
+        return self._append(
+            {"op": "replace", "index": index, "quote": _quote_fields(quote)})
+
+    def delete_quote(self, index: int, /) -> int:
+        self._quote_count -= 1
+        return self._append({"op": "delete", "index": index})
+
+    def sync(self) -> int:
+        # makes every record written so far durable with one fsync.
+        if self._handler is None:
+            return 1
+        if self._unsynced_count:
+            try:
+                os.fsync(self._handler.fileno())
+            except OSError:
+                return 1
+            self._unsynced_count = 0
+        return 0
+
+    def has_unsynced_records(self) -> bool:
+        return self._unsynced_count > 0
+
+    def _append(self, *records: typing.Dict[str, typing.Any]) -> int:
+        # flushed straight away so the records survive the application
+        # stopping, the fsync is left to sync for the whole group.
+        if self._handler is None:
+            return 1
+        try:
+            self._handler.write(
+                "".join(json.dumps(record) + "\n" for record in records))
+            self._handler.flush()
+        except OSError:
+            return 1
+        self._record_count += len(records)
+        self._unsynced_count += len(records)
+        if self._unsynced_count >= GROUP_COMMIT_SIZE:
+            return self.sync()
+        return 0
@@ -0,0 +1,205 @@
+"""
+Module: Wrapping Paper Quotes Calculator, Instrumentation (wpqc_metrics.py)
+Author: Harsh Jayprakash <harshjayprakash@outlook.com>
+Date: (Original) May 2022
+License: MIT
+
+Requires Python 3.8 or newer.
+
+Opt-in call counts and timings for the hot paths of the application.
+Modules register the methods worth watching with register; nothing is
+wrapped until instrumentation is enabled, so it costs nothing when it
+is off. Once enabled, each registered method records its call count,
+cumulative time and a histogram of call times (in power of two
+nanosecond buckets), which can be dumped as JSON at any time and are
+dumped when the application exits.
+
+Instrumentation is enabled with enable, the wpqc.py --metrics option or
+the WPQC_METRICS environment variable, which names the file snapshots
+are written to ("-" for standard error). On POSIX, SIGUSR1 dumps a
+snapshot while the application is running.
+"""
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import typing
+
+ENVIRONMENT_VARIABLE: str = "WPQC_METRICS"
+HISTOGRAM_BUCKETS: int = 64
+
+
+class CallStatistics:
+
+    __slots__ = ("count", "total_ns", "max_ns", "buckets", "_lock")
+
+    def __init__(self) -> None:
+        # methods are called from worker threads too (exports, imports,
+        # the service), so updates and reads hold the lock. it is
+        # reentrant as the SIGUSR1 dump can interrupt a record on the
+        # main thread.
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.count: int = 0
+            self.total_ns: int = 0
+            self.max_ns: int = 0
+            # bucket i counts calls taking under 2 ** i nanoseconds.
+            self.buckets: typing.List[int] = [0] * HISTOGRAM_BUCKETS
+
+    def record(self, elapsed_ns: int, /) -> None:
+        bucket = min(elapsed_ns.bit_length(), HISTOGRAM_BUCKETS - 1)
+        with self._lock:
+            self.count += 1
+            self.total_ns += elapsed_ns
+            if elapsed_ns > self.max_ns:
+                self.max_ns = elapsed_ns
+            self.buckets[bucket] += 1
+
+    def get_percentile_ns(self, fraction: float, /) -> int:
+        # the upper bound of the bucket holding the percentile.
+        with self._lock:
+            rank = fraction * self.count
+            seen = 0
+            for bucket, count in enumerate(self.buckets):
+                seen += count
+                if count and seen >= rank:
+                    return 1 << bucket
+            return 0
+
+    def snapshot(self) -> typing.Dict[str, typing.Any]:
+        # every figure from the same moment.
+        with self._lock:
+            return {
+                "count": self.count,
+                "total_ms": self.total_ns / 1e6,
+                "mean_us": self.total_ns / max(self.count, 1) / 1e3,
+                "max_us": self.max_ns / 1e3,
+                "p50_us_under": self.get_percentile_ns(0.50) / 1e3,
+                "p99_us_under": self.get_percentile_ns(0.99) / 1e3,
+                "histogram_us_under": {
+                    f"{(1 << bucket) / 1e3:g}": count
+                    for bucket, count in enumerate(self.buckets) if count}}
+
+
+_registered: typing.List[typing.Tuple[type, str]] = []
+# the original attribute of every wrapped method, restored by disable.
+_originals: typing.Dict[typing.Tuple[type, str], typing.Any] = {}
+_statistics: typing.Dict[str, CallStatistics] = {}
+_enabled: bool = False
+_dump_path: str = "-"
+_exit_hook_registered: bool = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _wrap(function: typing.Callable[..., typing.Any],
+          statistics: CallStatistics, /) -> typing.Callable[..., typing.Any]:
+    clock = time.perf_counter_ns
+
+    @functools.wraps(function)
+    def instrumented(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            statistics.record(clock() - start)
+    return instrumented
+
+
+def _instrument(owner: type, name: str, /) -> None:
+    if (owner, name) in _originals:
+        return
+    # owner must define the method itself, not inherit it.
+    original = vars(owner)[name]
+    statistics = _statistics.setdefault(
+        f"{owner.__qualname__}.{name}", CallStatistics())
+    if isinstance(original, staticmethod):
+        replacement = staticmethod(_wrap(original.__func__, statistics))
+    else:
+        replacement = _wrap(original, statistics)
+    _originals[(owner, name)] = original
+    setattr(owner, name, replacement)
+
+
+def register(owner: type, *names: str) -> None:
+    # methods are wrapped at once if instrumentation is already enabled.
+    for name in names:
+        _registered.append((owner, name))
+        if is_enabled():
+            _instrument(owner, name)
+
+
+def enable(*, dump_path: str = "-") -> None:
+    # bound methods taken before this call (e.g. Tk callbacks) are not
+    # instrumented, so enable before any window is created.
+    global _enabled, _dump_path, _exit_hook_registered
+    _enabled = True
+    _dump_path = dump_path
+    for owner, name in _registered:
+        _instrument(owner, name)
+    if not _exit_hook_registered:
+        _exit_hook_registered = True
+        atexit.register(_dump_at_exit)
+        import signal
+        if hasattr(signal, "SIGUSR1"):
+            try:
+                signal.signal(signal.SIGUSR1, lambda *_: dump())
+            except ValueError:
+                # only the main thread may install signal handlers.
+                pass
+
+
+def disable() -> None:
+    # the statistics so far are kept, see reset.
+    global _enabled
+    _enabled = False
+    for (owner, name), original in _originals.items():
+        setattr(owner, name, original)
+    _originals.clear()
+
+
+def reset() -> None:
+    for statistics in _statistics.values():
+        statistics.reset()
+
+
+def snapshot() -> typing.Dict[str, typing.Any]:
+    return {
+        "time": time.time(),
+        "pid": os.getpid(),
+        "calls": {
+            name: statistics.snapshot()
+            for name, statistics in sorted(_statistics.items())
+            if statistics.count}}
+
+
+def dump(path: str = None, /) -> int:
+    # writes a snapshot to path, the enabled dump path by default.
+    path = path or _dump_path
+    text = json.dumps(snapshot(), indent=2) + "\n"
+    try:
+        if path == "-":
+            sys.stderr.write(text)
+        else:
+            with open(path, "w", encoding="utf-8") as handler:
+                handler.write(text)
+    except OSError:
+        return 1
+    return 0
+
+
+def _dump_at_exit() -> None:
+    if _enabled:
+        dump()
+
+
+if os.environ.get(ENVIRONMENT_VARIABLE):
+    enable(dump_path=os.environ[ENVIRONMENT_VARIABLE])
@@ -0,0 +1,255 @@
+"""
+Module: Wrapping Paper Quotes Calculator, Pricing Service (wpqc_service.py)
+Author: Harsh Jayprakash <harshjayprakash@outlook.com>
+Date: (Original) May 2022
+License: MIT
+
+Requires Python 3.8 or newer.
+
+A small HTTP/JSON service, built on asyncio streams, which prices quotes
+with the same model as the application (Translator and Quote). Quote
+rows use the fields of the headless interface. Connections are kept
+alive between requests and pipelined requests are answered in order.
+Errors pricing a request are answered without closing the connection,
+and clients which stall part way through a request are timed out.
+
+Endpoints:
+    GET  /health        the service name and version, and the price
+                        cache statistics.
+    POST /price         one quote row as a JSON object.
+    POST /price/batch   a JSON array of quote rows.
+"""
+import asyncio
+import contextlib
+import json
+import sys
+import typing
+
+from wpqc import (
+    APPLICATION_NAME,
+    APPLICATION_VERSION,
+    Money,
+    PriceBreakdown,
+    describe_price_breakdown,
+    get_price_cache,
+    translate_quote_row)
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 8765
+# the longest request or header line, and the largest body, in bytes.
+MAX_LINE_SIZE: int = 1 << 14
+MAX_HEADER_COUNT: int = 100
+MAX_BODY_SIZE: int = 1 << 20
+MAX_BATCH_SIZE: int = 10000
+# seconds an idle connection is kept open for.
+KEEP_ALIVE_TIMEOUT: float = 15
+# seconds the headers, and then the body, of a request may take to arrive
+# once its request line has.
+REQUEST_TIMEOUT: float = 15
+
+REASONS: typing.Dict[int, str] = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+}
+
+RESPONSE_HEAD: typing.Callable[..., str] = (
+    "HTTP/1.1 {} {}\r\n"
+    + "Content-Type: application/json\r\n"
+    + "Content-Length: {}\r\n"
+    + "Connection: {}\r\n\r\n").format
+
+Response = typing.Tuple[int, typing.Any]
+
+
+def _price_row(row: typing.Any, /
+               ) -> typing.Tuple[PriceBreakdown, typing.Any]:
+    if not isinstance(row, dict):
+        return None, {"error": "A quote must be a JSON object."}
+    quote, error = translate_quote_row(row)
+    if error:
+        return None, {"error": error}
+    breakdown = get_price_cache().get_price_breakdown(quote)
+    return breakdown, describe_price_breakdown(quote.title, breakdown)
+
+
+def price_quote(row: typing.Any, /) -> Response:
+    breakdown, result = _price_row(row)
+    return (422 if breakdown is None else 200), result
+
+
+def price_quotes(rows: typing.Any, /) -> Response:
+    # every row gets a result, in order, rejected rows an error.
+    if not isinstance(rows, list):
+        return 400, {"error": "A batch must be a JSON array of quotes."}
+    if len(rows) > MAX_BATCH_SIZE:
+        return 413, {"error": f"A batch holds at most {MAX_BATCH_SIZE} "
+                     + "quotes."}
+    results: typing.List[typing.Any] = []
+    total: Money = Money()
+    rejected: int = 0
+    for row in rows:
+        breakdown, result = _price_row(row)
+        results.append(result)
+        if breakdown is None:
+            rejected += 1
+        else:
+            total += breakdown.total
+    return 200, {
+        "quotes": results,
+        "priced": len(rows) - rejected,
+        "rejected": rejected,
+        "total": f"{total:.2f}"}
+
+
+def dispatch(method: str, path: str, body: bytes, /) -> Response:
+    path = path.split("?", 1)[0]
+    if path == "/health":
+        if method != "GET":
+            return 405, {"error": "Use GET for /health."}
+        return 200, {
+            "name": APPLICATION_NAME,
+            "version": APPLICATION_VERSION,
+            "price_cache": get_price_cache().get_statistics()._asdict()}
+    if path not in ("/price", "/price/batch"):
+        return 404, {"error": f"No such endpoint: {path}"}
+    if method != "POST":
+        return 405, {"error": f"Use POST for {path}."}
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return 400, {"error": "Malformed JSON body."}
+    if path == "/price":
+        return price_quote(payload)
+    return price_quotes(payload)
+
+
+def _encode_response(status: int, payload: typing.Any,
+                     keep_alive: bool, /) -> bytes:
+    body = json.dumps(payload).encode("utf-8")
+    return RESPONSE_HEAD(
+        status, REASONS[status], len(body),
+        "keep-alive" if keep_alive else "close").encode("latin-1") + body
+
+
+async def _read_line(reader: asyncio.StreamReader, /) -> bytes:
+    try:
+        return await reader.readline()
+    except ValueError:
+        # readline gives up on lines over MAX_LINE_SIZE.
+        raise ValueError("Request line or header too long.") from None
+
+
+async def _read_request(
+        reader: asyncio.StreamReader, /
+        ) -> typing.Tuple[str, str, str, typing.Dict[str, str]]:
+    # the request line and headers, or None once the client has gone.
+    # blank lines between pipelined requests are skipped.
+    line = b"\r\n"
+    while line in (b"\r\n", b"\n"):
+        line = await asyncio.wait_for(_read_line(reader), KEEP_ALIVE_TIMEOUT)
+    if not line:
+        return None
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise ValueError("Malformed request line.")
+    headers = await asyncio.wait_for(_read_headers(reader), REQUEST_TIMEOUT)
+    return parts[0], parts[1], parts[2], headers
+
+
+async def _read_headers(reader: asyncio.StreamReader, /
+                        ) -> typing.Dict[str, str]:
+    headers: typing.Dict[str, str] = {}
+    while (line := await _read_line(reader)) not in (b"\r\n", b"\n", b""):
+        name, separator, value = line.decode("latin-1").partition(":")
+        if not separator or len(headers) >= MAX_HEADER_COUNT:
+            raise ValueError("Malformed request headers.")
+        headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def _dispatch_safely(method: str, path: str, body: bytes, /) -> Response:
+    # an error pricing one request is answered, and the connection kept,
+    # rather than dropping every request pipelined behind it.
+    try:
+        return dispatch(method, path, body)
+    except ValueError as error:
+        return 422, {"error": str(error)}
+    except Exception as error:
+        print(f"{APPLICATION_NAME}: {method} {path}: {error!r}",
+              file=sys.stderr, flush=True)
+        return 500, {"error": "Internal error."}
+
+
+async def handle_connection(reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter, /) -> None:
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except ValueError as error:
+                writer.write(_encode_response(
+                    400, {"error": str(error)}, False))
+                break
+            if request is None:
+                break
+            method, path, version, headers = request
+            connection = headers.get("connection", "").lower()
+            keep_alive = (
+                connection != "close" if version == "HTTP/1.1"
+                else connection == "keep-alive")
+            if "transfer-encoding" in headers:
+                writer.write(_encode_response(
+                    501, {"error": "Chunked bodies are not supported."},
+                    False))
+                break
+            try:
+                length = int(headers.get("content-length", "0"))
+            except ValueError:
+                length = -1
+            if not 0 <= length <= MAX_BODY_SIZE:
+                writer.write(_encode_response(
+                    413 if length > MAX_BODY_SIZE else 400,
+                    {"error": "Invalid Content-Length."}, False))
+                break
+            body = await asyncio.wait_for(
+                reader.readexactly(length), REQUEST_TIMEOUT)
+            status, payload = _dispatch_safely(method, path, body)
+            writer.write(_encode_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+        await writer.drain()
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError,
+            ConnectionError):
+        pass
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def serve_forever(host: str, port: int, /) -> None:
+    server = await asyncio.start_server(
+        handle_connection, host, port, limit=MAX_LINE_SIZE)
+    address = server.sockets[0].getsockname()
+    print(f"{APPLICATION_NAME}: serving on http://{address[0]}:{address[1]}",
+          file=sys.stderr, flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def serve(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> int:
+    try:
+        asyncio.run(serve_forever(host, port))
+    except KeyboardInterrupt:
+        pass
+    except OSError as error:
+        print(f"{APPLICATION_NAME}: {error}", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,371 @@
+"""
+Module: Wrapping Paper Quotes Calculator, Order Store (wpqc_store.py)
+Author: Harsh Jayprakash <harshjayprakash@outlook.com>
+Date: (Original) May 2022
+License: MIT
+
+Requires Python 3.8 or newer.
+
+Keeps orders and their quotes in a local SQLite database, so they
+outlive the application and can be queried. Quotes are written in
+batches inside a single transaction and are indexed by order number,
+date, shape, paper type and colour.
+
+The paper area and revenue of every order, and of every day, are kept
+per paper type and colour as orders are saved and deleted, so stock
+questions ("how much gold expensive paper went out today?") are one
+primary key lookup rather than a scan of every quote.
+"""
+import itertools
+import sqlite3
+import typing
+
+from wpqc import (
+    Bow,
+    ColumnarOrder,
+    GiftCard,
+    Money,
+    Order,
+    PaperUsage,
+    Quote,
+    Translator,
+    WrappingPaper,
+    get_current_time_date)
+
+DEFAULT_DATABASE: str = "wpqc.sqlite3"
+INSERT_BATCH_SIZE: int = 5000
+# stores older than this are brought up to date when opened.
+SCHEMA_VERSION: int = 2
+
+# quotes are keyed by (order_number, position), which also serves as the
+# order number index; created uses the sortable get_current_time_date.
+# usage areas are in units of 1/WrappingPaper.AREA_SCALE cm^2, as in
+# PaperUsage, so the running sums are exact; days are YYYY-MM-DD. each
+# quote keeps the price, area and paper price it was saved with, so
+# loading an order does not reprice it.
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS orders (
+    order_number INTEGER PRIMARY KEY,
+    created TEXT NOT NULL,
+    quote_count INTEGER NOT NULL,
+    total_pence INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS quotes (
+    order_number INTEGER NOT NULL
+        REFERENCES orders (order_number) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    shape TEXT NOT NULL,
+    length_one REAL NOT NULL,
+    length_two REAL NOT NULL,
+    length_three REAL NOT NULL,
+    paper TEXT NOT NULL,
+    colour TEXT NOT NULL,
+    bow INTEGER NOT NULL,
+    message TEXT,
+    price_pence INTEGER NOT NULL,
+    area_units INTEGER NOT NULL,
+    paper_pence INTEGER NOT NULL,
+    PRIMARY KEY (order_number, position)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS order_usage (
+    order_number INTEGER NOT NULL
+        REFERENCES orders (order_number) ON DELETE CASCADE,
+    paper TEXT NOT NULL,
+    colour TEXT NOT NULL,
+    area_units INTEGER NOT NULL,
+    revenue_pence INTEGER NOT NULL,
+    quotes INTEGER NOT NULL,
+    PRIMARY KEY (order_number, paper, colour)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS daily_usage (
+    day TEXT NOT NULL,
+    paper TEXT NOT NULL,
+    colour TEXT NOT NULL,
+    area_units INTEGER NOT NULL,
+    revenue_pence INTEGER NOT NULL,
+    quotes INTEGER NOT NULL,
+    PRIMARY KEY (day, paper, colour)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS orders_created ON orders (created);
+CREATE INDEX IF NOT EXISTS quotes_shape ON quotes (shape);
+CREATE INDEX IF NOT EXISTS quotes_paper ON quotes (paper);
+CREATE INDEX IF NOT EXISTS quotes_colour ON quotes (colour);
+"""
+
+
+def quote_to_record(order_number: int, position: int, quote: Quote, /
+                    ) -> typing.Tuple[typing.Any, ...]:
+    # the quote columns up to message, save_order adds the prices.
+    shape, length_one, length_two, length_three = (
+        Translator.describe_present_type(quote.present))
+    return (
+        order_number, position, quote.title, shape,
+        length_one, length_two, length_three,
+        Translator.describe_wrapping_paper_type(quote.wrapping_paper),
+        quote.wrapping_paper.get_colour(),
+        int(isinstance(quote.bow, Bow)),
+        quote.gift_card.get_message()
+        if isinstance(quote.gift_card, GiftCard) else None)
+
+
+def _priced_record(order: Order, position: int, /
+                   ) -> typing.Tuple[typing.Any, ...]:
+    area, paper_price = order.get_quote_paper_usage(position)
+    return (
+        *quote_to_record(
+            order.get_order_number(), position, order.get_quote(position)),
+        order.get_quote_price(position).get_pence(),
+        round(max(area, 0) * WrappingPaper.AREA_SCALE),
+        paper_price.get_pence())
+
+
+def record_to_quote(record: typing.Sequence[typing.Any], /) -> Quote:
+    # record holds the quote columns from title onwards. raises ValueError
+    # for a quote which can no longer be built, such as one whose paper
+    # has left the catalogue since it was saved.
+    (title, shape, length_one, length_two, length_three,
+     paper, colour, bow, message) = record[:9]
+    present = Translator.translate_present_type(
+        shape=shape,
+        length_one=length_one,
+        length_two=length_two,
+        length_three=length_three)
+    if present is None:
+        raise ValueError(f"Shape not on offer: {shape}")
+    wrapping_paper = Translator.translate_wrapping_paper_type(
+        paper=paper, colour=colour)
+    if wrapping_paper is None:
+        raise ValueError(f"Paper not in the catalogue: {paper}")
+    return Quote(
+        quote_title=title,
+        present_type=present,
+        wrapping_paper=wrapping_paper,
+        gift_card=Translator.translate_gift_card(
+            gift_card=int(message is not None), message=message),
+        bow=Translator.translate_bow(bow=bow))
+
+
+class OrderStore:
+
+    def __init__(self, path: str = DEFAULT_DATABASE, /) -> None:
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(SCHEMA)
+        version = self._connection.execute(
+            "PRAGMA user_version").fetchone()[0]
+        # quotes the upgrade could not price, see _upgrade.
+        self._skipped_count: int = 0
+        if version < SCHEMA_VERSION:
+            self._upgrade(version)
+
+    def __enter__(self) -> "OrderStore":
+        return self
+
+    def __exit__(self, *exception: typing.Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def get_skipped_count(self) -> int:
+        return self._skipped_count
+
+    def save_order(self, order: Order, /) -> int:
+        # replaces any earlier copy of the order, all or nothing.
+        order_number = order.get_order_number()
+        records = (
+            _priced_record(order, position) for position in range(len(order)))
+        created = get_current_time_date()
+        try:
+            with self._connection:
+                self._remove_usage(order_number)
+                self._connection.execute(
+                    "DELETE FROM quotes WHERE order_number = ?",
+                    (order_number,))
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO orders "
+                    + "(order_number, created, quote_count, total_pence) "
+                    + "VALUES (?, ?, ?, ?)",
+                    (order_number, created, len(order),
+                     order.calculate_total_price().get_pence()))
+                self._add_usage(
+                    order_number, created[:10], order.get_paper_usage())
+                while batch := list(
+                        itertools.islice(records, INSERT_BATCH_SIZE)):
+                    self._connection.executemany(
+                        "INSERT INTO quotes VALUES "
+                        + "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+        except sqlite3.Error:
+            return 1
+        return 0
+
+    def load_order(self, order_number: int, /, *,
+                   reprice: bool = False) -> Order:
+        # the order as saved, its quotes keep the prices they were saved
+        # with however the catalogue has changed since. with reprice, the
+        # quotes are priced again from the current catalogue, which raises
+        # ValueError if one of them is no longer on offer.
+        if self._connection.execute(
+                "SELECT 1 FROM orders WHERE order_number = ?",
+                (order_number,)).fetchone() is None:
+            return None
+        if reprice:
+            order = Order(order_number)
+            for record in self._connection.execute(
+                    "SELECT title, shape, length_one, length_two, "
+                    + "length_three, paper, colour, bow, message FROM quotes "
+                    + "WHERE order_number = ? ORDER BY position",
+                    (order_number,)):
+                order.add_quote(record_to_quote(record))
+            return order
+        order = ColumnarOrder(order_number)
+        order.add_stored_quotes(self._connection.execute(
+            "SELECT title, shape, length_one, length_two, length_three, "
+            + "paper, colour, bow, message, price_pence, area_units, "
+            + "paper_pence FROM quotes "
+            + "WHERE order_number = ? ORDER BY position", (order_number,)),
+            self.get_paper_usage(order_number=order_number))
+        return order
+
+    def delete_order(self, order_number: int, /) -> None:
+        with self._connection:
+            self._remove_usage(order_number)
+            self._connection.execute(
+                "DELETE FROM orders WHERE order_number = ?", (order_number,))
+
+    def get_last_order_number(self) -> int:
+        return self._connection.execute(
+            "SELECT COALESCE(MAX(order_number), 0) FROM orders").fetchone()[0]
+
+    def find_order_numbers(self, *, date: str = None) -> typing.List[int]:
+        # date as YYYY-MM-DD, or every order when not given.
+        if date is None:
+            cursor = self._connection.execute(
+                "SELECT order_number FROM orders ORDER BY order_number")
+        else:
+            cursor = self._connection.execute(
+                "SELECT order_number FROM orders "
+                + "WHERE created BETWEEN ? AND ? ORDER BY order_number",
+                (f"{date} 0000", f"{date} 2359"))
+        return [order_number for order_number, in cursor]
+
+    def count_quotes(self, *,
+                     shape: str = None,
+                     paper: str = None,
+                     colour: str = None) -> int:
+        conditions: typing.List[str] = []
+        parameters: typing.List[str] = []
+        for column, value in (
+                ("shape", shape), ("paper", paper), ("colour", colour)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        query = "SELECT COUNT(*) FROM quotes"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return self._connection.execute(query, parameters).fetchone()[0]
+
+    def get_paper_usage(self, *,
+                        date: str = None,
+                        order_number: int = None) -> PaperUsage:
+        # the usage of one order, of one day (YYYY-MM-DD) or of every
+        # saved order, read from the running totals.
+        if order_number is not None:
+            cursor = self._connection.execute(
+                "SELECT paper, colour, area_units, revenue_pence, quotes "
+                + "FROM order_usage WHERE order_number = ?", (order_number,))
+        elif date is not None:
+            cursor = self._connection.execute(
+                "SELECT paper, colour, area_units, revenue_pence, quotes "
+                + "FROM daily_usage WHERE day = ?", (date,))
+        else:
+            cursor = self._connection.execute(
+                "SELECT paper, colour, SUM(area_units), SUM(revenue_pence), "
+                + "SUM(quotes) FROM daily_usage GROUP BY paper, colour")
+        usage = PaperUsage()
+        for paper, colour, area, revenue, quotes in cursor:
+            usage.add_usage(
+                paper, colour, area / WrappingPaper.AREA_SCALE,
+                Money(revenue), quotes)
+        return usage
+
+    def _add_usage(self, order_number: int, day: str, usage: PaperUsage, /
+                   ) -> None:
+        records = [
+            (paper, colour, round(total.area * WrappingPaper.AREA_SCALE),
+             total.revenue.get_pence(), total.quotes)
+            for paper, colour, total in usage]
+        self._connection.executemany(
+            "INSERT INTO order_usage VALUES (?, ?, ?, ?, ?, ?)",
+            [(order_number, *record) for record in records])
+        self._connection.executemany(
+            "INSERT INTO daily_usage VALUES (?, ?, ?, ?, ?, ?) "
+            + "ON CONFLICT (day, paper, colour) DO UPDATE SET "
+            + "area_units = area_units + excluded.area_units, "
+            + "revenue_pence = revenue_pence + excluded.revenue_pence, "
+            + "quotes = quotes + excluded.quotes",
+            [(day, *record) for record in records])
+
+    def _remove_usage(self, order_number: int, /) -> None:
+        # takes an order's usage off the day it was saved on.
+        records = self._connection.execute(
+            "SELECT area_units, revenue_pence, quotes, "
+            + "substr(created, 1, 10), paper, colour "
+            + "FROM order_usage JOIN orders USING (order_number) "
+            + "WHERE order_number = ?", (order_number,)).fetchall()
+        self._connection.executemany(
+            "UPDATE daily_usage SET area_units = area_units - ?, "
+            + "revenue_pence = revenue_pence - ?, quotes = quotes - ? "
+            + "WHERE day = ? AND paper = ? AND colour = ?", records)
+        self._connection.executemany(
+            "DELETE FROM daily_usage "
+            + "WHERE day = ? AND paper = ? AND colour = ? AND quotes <= 0",
+            [record[3:] for record in records])
+        self._connection.execute(
+            "DELETE FROM order_usage WHERE order_number = ?", (order_number,))
+
+    def _upgrade(self, version: int, /) -> None:
+        # once per store: the quotes of stores from before version 2 are
+        # priced again for their area and paper price, and stores from
+        # before version 1 have their usage tables rebuilt from them.
+        # quotes which can no longer be priced, such as those whose paper
+        # has left the catalogue, keep their price, are left out of the
+        # usage and are counted (see get_skipped_count).
+        columns = {
+            column[1] for column in self._connection.execute(
+                "PRAGMA table_info(quotes)")}
+        with self._connection:
+            for column in ("area_units", "paper_pence"):
+                if column not in columns:
+                    self._connection.execute(
+                        f"ALTER TABLE quotes ADD COLUMN {column} "
+                        + "INTEGER NOT NULL DEFAULT 0")
+            if version < 1:
+                self._connection.execute("DELETE FROM order_usage")
+                self._connection.execute("DELETE FROM daily_usage")
+            for order_number, created in self._connection.execute(
+                    "SELECT order_number, created FROM orders").fetchall():
+                usage = PaperUsage()
+                updates: typing.List[typing.Tuple[int, ...]] = []
+                for position, *record in self._connection.execute(
+                        "SELECT position, title, shape, length_one, "
+                        + "length_two, length_three, paper, colour, bow, "
+                        + "message FROM quotes WHERE order_number = ?",
+                        (order_number,)).fetchall():
+                    try:
+                        quote = record_to_quote(record)
+                    except ValueError:
+                        self._skipped_count += 1
+                        continue
+                    breakdown = quote.calculate_price_breakdown()
+                    usage.add_quote(quote, breakdown.area, breakdown.paper)
+                    updates.append((
+                        round(max(breakdown.area, 0)
+                              * WrappingPaper.AREA_SCALE),
+                        breakdown.paper.get_pence(), order_number, position))
+                self._connection.executemany(
+                    "UPDATE quotes SET area_units = ?, paper_pence = ? "
+                    + "WHERE order_number = ? AND position = ?", updates)
+                if version < 1:
+                    self._add_usage(order_number, created[:10], usage)
+            self._connection.execute(
+                f"PRAGMA user_version = {SCHEMA_VERSION}")